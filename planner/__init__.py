@@ -1 +1,9 @@
-__all__ = []
\ No newline at end of file
+__all__ = ["render_month", "write_month", "render_range", "write_range", "write_document",
+           "write_archive"]
+
+def __getattr__(name):
+    # Resolved on first use so `import planner` (and the CLI) stay fast.
+    if name in __all__:
+        from planner import api
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
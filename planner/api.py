@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+import time
+import zipfile
+from datetime import date
+from typing import IO, TYPE_CHECKING, BinaryIO, Dict, Iterable, Optional, Sequence, Tuple
+
+from planner.config import load_config, month_name
+from planner.generate.month_loop import iter_month_starts
+from planner.generate.parallel import Unit
+from planner.metrics import MonthMetrics
+
+if TYPE_CHECKING:
+    from planner.context import RenderContext
+
+# Library entry points: render planners to bytes or to any binary stream,
+# without the directory tree the CLI generators write. Generators are
+# imported on first use so `import planner` stays cheap.
+
+KINDS = ("daily", "examen")
+
+def _config(cfg: Optional[dict]) -> dict:
+    return cfg if cfg is not None else load_config(None)
+
+def _render(kind: str, year: int, month: int, page_format: str, cfg: dict,
+            start: Optional[date] = None, end: Optional[date] = None,
+            context: Optional[RenderContext] = None) -> bytes:
+    metrics = MonthMetrics(kind, year, month, page_format)
+    if kind == "daily":
+        from planner.generate.daily import build_month_pdf as build_daily
+        pdf = build_daily(year, month, page_format, cfg, start, end, metrics=metrics, context=context)
+    elif kind == "examen":
+        from planner.generate.examen import build_month_pdf as build_examen
+        pdf = build_examen(year, month, page_format, cfg, metrics, context=context)
+    else:
+        raise ValueError(f"Unknown planner kind '{kind}' (expected one of {', '.join(KINDS)})")
+    with metrics.stage("pdf_output"):
+        data = bytes(pdf.output())
+    metrics.count("output_bytes", len(data))
+    metrics.emit()
+    return data
+
+def render_month(year: int, month: int, page_format: str = "A4", cfg: Optional[dict] = None,
+                 kind: str = "daily", context: Optional[RenderContext] = None) -> bytes:
+    """Render one month of the daily (or examen) planner and return the PDF bytes.
+
+    `cfg` is a loaded configuration (see `planner.config.load_config`); when
+    omitted the built-in defaults are used (no config.yaml is read). Callers
+    rendering many months can pass a `RenderContext` built once from the
+    same `cfg`. Nothing is kept in module state between calls, so threads may
+    render different configs at the same time.
+    """
+    return _render(kind, year, month, page_format, _config(cfg), context=context)
+
+def write_month(stream: IO[bytes], year: int, month: int, page_format: str = "A4",
+                cfg: Optional[dict] = None, kind: str = "daily",
+                context: Optional[RenderContext] = None) -> int:
+    """Render one month into a binary stream; return the number of bytes written."""
+    data = render_month(year, month, page_format, cfg, kind, context)
+    stream.write(data)
+    return len(data)
+
+def _write_months(stream: BinaryIO, months: Sequence[Tuple[int, int]], page_format: str, cfg: dict,
+                  kind: str, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, int]:
+    """Render `months` one at a time and stream them into one PDF.
+
+    Each month's FPDF is dropped as soon as its bytes reach the assembler, so
+    memory stays at one month however many are joined. Bookmarks are grouped
+    by year when the months span more than one.
+    """
+    from planner.assemble import StreamingAssembler
+    from planner.context import RenderContext
+
+    locale_code = cfg.get("locale", "en_US")
+    context = RenderContext.from_config(cfg)
+    by_year = len({year for year, _ in months}) > 1
+    asm = StreamingAssembler(stream)
+    for year, month in months:
+        data = _render(kind, year, month, page_format, cfg, start, end, context)
+        asm.add_document(data, f"{month_name(locale_code, month)} {year}", str(year) if by_year else None)
+        logging.debug("Streamed %s %d-%02d %s (%d bytes)", kind, year, month, page_format, len(data))
+    asm.close()
+    return asm.stats
+
+def write_range(stream: BinaryIO, start: date, end: date, page_format: str = "A4",
+                cfg: Optional[dict] = None) -> None:
+    """Daily pages for [start, end] as one PDF; months are joined with an outline.
+
+    Months are rendered one at a time and streamed through the assembler, so
+    only the month being merged is held in memory.
+    """
+    cfg = _config(cfg)
+    if end < start:
+        raise ValueError("end date is before start date")
+    firsts = list(iter_month_starts(start, end))
+    if len(firsts) == 1:
+        stream.write(_render("daily", start.year, start.month, page_format, cfg, start, end))
+        return
+    _write_months(stream, [(d.year, d.month) for d in firsts], page_format, cfg, "daily", start, end)
+
+def render_range(start: date, end: date, page_format: str = "A4", cfg: Optional[dict] = None) -> bytes:
+    """Like `write_range`, returning the PDF bytes."""
+    out = io.BytesIO()
+    write_range(out, start, end, page_format, cfg)
+    return out.getvalue()
+
+def write_document(stream: BinaryIO, years: Sequence[int], page_format: str = "A4",
+                   cfg: Optional[dict] = None, kind: str = "daily") -> Dict[str, int]:
+    """Every month of `years` as a single PDF, bookmarked by year and month.
+
+    Pages are written to `stream` a month at a time; what stays in memory is
+    the assembler's xref offsets and bookmarks, so a multi-year planner costs
+    about as much RAM as one month. Returns the assembler statistics.
+    """
+    if not years:
+        raise ValueError("no years to render")
+    months = [(year, month) for year in sorted(set(years)) for month in range(1, 13)]
+    return _write_months(stream, months, page_format, _config(cfg), kind)
+
+def document_name(years: Sequence[int], page_format: str) -> str:
+    """File name of a single-file planner; matches `assemble`'s Planner_<year>_<format>.pdf."""
+    first, last = min(years), max(years)
+    span = str(first) if first == last else f"{first}-{last}"
+    return f"Planner_{span}_{page_format}.pdf"
+
+def save_document(out_path: str, years: Sequence[int], page_format: str = "A4",
+                  cfg: Optional[dict] = None, kind: str = "daily") -> Dict[str, int]:
+    """`write_document` into `out_path`, via a `.part` file renamed once complete."""
+    folder = os.path.dirname(out_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = out_path + ".part"
+    try:
+        with open(tmp, "wb") as out:
+            stats = write_document(out, years, page_format, cfg, kind)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, out_path)
+    logging.info("Saved %s (%d months, %d objects written, %d shared)", out_path,
+                 stats["documents"], stats["objects_out"], stats["objects_shared"])
+    return stats
+
+def archive_name(year: int, month: int, page_format: str, cfg: dict) -> str:
+    """Path of a month inside an archive; mirrors the CLI's <year>/<format>/<file> layout."""
+    from planner.generate.daily import month_filename
+
+    return f"{year}/{page_format}/{month_filename(year, month, page_format, cfg.get('locale', 'en_US'))}"
+
+def write_archive(stream: BinaryIO, units: Iterable[Unit], cfg: Optional[dict] = None,
+                  kind: str = "daily") -> int:
+    """Stream every (year, month, format) unit into a zip archive written to `stream`.
+
+    Each month is added as soon as it is rendered, so only one month is held in
+    memory. Non-seekable streams (pipes, stdout) are fine. Returns the number
+    of months written.
+    """
+    from planner.context import RenderContext
+
+    cfg = _config(cfg)
+    context = RenderContext.from_config(cfg)
+    count = 0
+    # PDF streams are already Flate-compressed; storing them avoids recompressing.
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as zf:
+        for year, month, page_format in units:
+            name = archive_name(year, month, page_format, cfg)
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            with zf.open(info, "w") as entry:
+                write_month(entry, year, month, page_format, cfg, kind, context)
+            logging.info("Archived %s", name)
+            count += 1
+    return count
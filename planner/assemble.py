@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from array import array
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+# Streaming merger for the monthly PDFs written by fpdf2.
+#
+# Each input document is parsed on its own (classic xref table, direct
+# /Length values - what fpdf2 produces), its objects are renumbered and
+# written straight to the output. Only the xref offsets, a digest per shared
+# object and one page-tree node per input stay in memory, so assembling a
+# year costs roughly one month of objects.
+
+_OBJ_RE = re.compile(rb"(\d+)\s+(\d+)\s+obj\b")
+_REF_RE = re.compile(rb"(\d+)\s+0\s+R\b")
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_LENGTH_RE = re.compile(rb"/Length\s+(\d+)(?!\s+\d+\s+R)")
+_KIDS_RE = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+
+MONTHLY_FILE_RE = re.compile(r"^\d{2} - .+\.pdf$")
+
+class AssembleError(ValueError):
+    """Raised when an input is not a PDF layout this assembler understands."""
+
+def _string_end(body: bytes, i: int) -> int:
+    """Index just past the literal `(...)` or hex `<...>` string starting at `i`."""
+    if body[i] == 0x3C:  # '<' hex string
+        return body.index(b">", i) + 1
+    depth, j, n = 1, i + 1, len(body)  # '(' literal string, may nest and contain escapes
+    while j < n and depth:
+        if body[j] == 0x5C:  # backslash
+            j += 2
+            continue
+        if body[j] == 0x28:
+            depth += 1
+        elif body[j] == 0x29:
+            depth -= 1
+        j += 1
+    return j
+
+def _value_end(data: bytes, i: int) -> int:
+    """Index of the `stream` or `endobj` keyword ending the object value that starts at `i`.
+
+    Strings are skipped whole, so the keywords inside them (a title such as
+    "(Upstream)") are not mistaken for the end of the object.
+    """
+    depth, n = 0, len(data)
+    while i < n:
+        c = data[i]
+        if c == 0x28 or (c == 0x3C and data[i + 1:i + 2] != b"<"):
+            i = _string_end(data, i)
+        elif c == 0x3C or c == 0x3E:  # '<<' / '>>'
+            depth += 1 if c == 0x3C else -1
+            i += 2
+        elif c == 0x5B or c == 0x5D:  # '[' / ']'
+            depth += 1 if c == 0x5B else -1
+            i += 1
+        elif depth <= 0 and (data.startswith(b"stream", i) or data.startswith(b"endobj", i)) \
+                and data[i - 1:i] in b" \t\r\n>]":
+            return i
+        else:
+            i += 1
+    raise AssembleError("object is missing 'endobj'")
+
+def _rewrite_refs(body: bytes, mapping: Dict[int, int]) -> bytes:
+    """Renumber `N 0 R` references, leaving literal and hex strings untouched."""
+    out = bytearray()
+    i, n = 0, len(body)
+    while i < n:
+        c = body[i]
+        if c == 0x28 or (c == 0x3C and body[i + 1:i + 2] != b"<"):  # a string (not a dict)
+            j = _string_end(body, i)
+            out += body[i:j]
+            i = j
+        elif 0x30 <= c <= 0x39 and (i == 0 or not (0x30 <= body[i - 1] <= 0x39)):
+            m = _REF_RE.match(body, i)
+            if m:
+                out += b"%d 0 R" % mapping[int(m.group(1))]
+                i = m.end()
+            else:
+                out.append(c)
+                i += 1
+        elif c == 0x3C:  # '<<'
+            out += b"<<"
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return bytes(out)
+
+def _refs(body: bytes) -> List[int]:
+    return [int(m.group(1)) for m in _REF_RE.finditer(body)]
+
+class _Object:
+    __slots__ = ("num", "head", "stream")
+
+    def __init__(self, num: int, head: bytes, stream: Optional[bytes]):
+        self.num = num
+        self.head = head      # dictionary / value part
+        self.stream = stream  # raw (still encoded) stream data, if any
+
+def _parse_document(data: bytes) -> Tuple[Dict[int, _Object], int, Optional[int]]:
+    """Return (objects by number, catalog number, info dictionary number) of one input."""
+    m = None
+    for m in _STARTXREF_RE.finditer(data):
+        pass
+    if m is None or data[int(m.group(1)):int(m.group(1)) + 4] != b"xref":
+        raise AssembleError("only PDFs with a classic xref table are supported")
+    pos = int(m.group(1)) + 4
+    trailer_at = data.index(b"trailer", pos)
+    offsets: Dict[int, int] = {}
+    lines = data[pos:trailer_at].split()
+    k = 0
+    while k < len(lines):
+        first, count = int(lines[k]), int(lines[k + 1])
+        k += 2
+        for num in range(first, first + count):
+            field, _gen, kind = lines[k], lines[k + 1], lines[k + 2]
+            k += 3
+            if kind == b"n":
+                offsets[num] = int(field)
+    root = re.search(rb"/Root\s+(\d+)\s+0\s+R", data[trailer_at:])
+    if root is None:
+        raise AssembleError("trailer has no /Root")
+    info = re.search(rb"/Info\s+(\d+)\s+0\s+R", data[trailer_at:])
+
+    objects: Dict[int, _Object] = {}
+    for num, offset in offsets.items():
+        hm = _OBJ_RE.match(data, offset)
+        if hm is None or int(hm.group(1)) != num:
+            raise AssembleError(f"xref entry for object {num} is broken")
+        start = hm.end()
+        stream_at = _value_end(data, start)
+        if not data.startswith(b"stream", stream_at):
+            objects[num] = _Object(num, data[start:stream_at].strip(), None)
+            continue
+        head = data[start:stream_at].strip()
+        s = stream_at + len(b"stream")
+        s += 2 if data[s:s + 2] == b"\r\n" else 1
+        lm = _LENGTH_RE.search(head)
+        if lm is not None:
+            stream = data[s:s + int(lm.group(1))]
+        else:
+            stream = data[s:data.index(b"endstream", s)].rstrip(b"\r\n")
+        objects[num] = _Object(num, head, stream)
+    return objects, int(root.group(1)), int(info.group(1)) if info else None
+
+def _pdf_text(text: str) -> bytes:
+    """Encode a text string (outline titles) as PDFDocEncoding-safe bytes."""
+    try:
+        raw = text.encode("ascii")
+    except UnicodeEncodeError:
+        return b"<FEFF" + text.encode("utf-16-be").hex().upper().encode() + b">"
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+# (object number, title, first page, child bookmarks)
+_Bookmark = Tuple[int, bytes, int, list]
+
+class StreamingAssembler:
+    """Append whole PDF documents into one output, one document at a time.
+
+    Objects that do not point into the page tree (core fonts, resource
+    dictionaries, content streams, shared forms) are deduplicated by content
+    across inputs. Each input becomes a subtree of the output page tree and
+    gets a bookmark.
+
+    Only bookkeeping stays in memory once a document has been appended:
+    an 8-byte xref offset per output object, a digest per distinct shared
+    object and a bookmark entry per input.
+    """
+
+    # Reserved numbers for the objects written at close().
+    _PAGES, _CATALOG, _OUTLINES = 1, 2, 3
+
+    def __init__(self, out: BinaryIO):
+        self._out = out
+        self._offsets = array("Q", bytes(8 * 4))  # indexed by object number
+        self._next_num = 4
+        self._shared: Dict[bytes, int] = {}
+        # (pages node, first page, page count, title, outline group title or None)
+        self._sections: List[Tuple[int, int, int, bytes, Optional[bytes]]] = []
+        self._written = 0
+        # The header cannot be revised once streaming, so declare a version covering any fpdf2 output.
+        self._write(b"%PDF-1.7\n%\xe9\xeb\xf1\xbf\n")
+        self.stats = {"documents": 0, "objects_in": 0, "objects_out": 0, "objects_shared": 0}
+
+    def _write(self, data: bytes) -> None:
+        self._out.write(data)
+        self._written += len(data)
+
+    def _alloc(self) -> int:
+        num = self._next_num
+        self._next_num += 1
+        self._offsets.append(0)
+        return num
+
+    def _emit(self, num: int, head: bytes, stream: Optional[bytes]) -> None:
+        self._offsets[num] = self._written
+        self._write(b"%d 0 obj\n" % num + head + b"\n")
+        if stream is not None:
+            self._write(b"stream\n" + stream + b"\nendstream\n")
+        self._write(b"endobj\n")
+        self.stats["objects_out"] += 1
+
+    def add_document(self, data: bytes, title: str, group: Optional[str] = None) -> None:
+        """Append one PDF. Documents sharing a `group` are bookmarked under one parent entry."""
+        objects, root_num, info_num = _parse_document(data)
+        self.stats["documents"] += 1
+        self.stats["objects_in"] += len(objects)
+
+        root = objects[root_num]
+        pm = re.search(rb"/Pages\s+(\d+)\s+0\s+R", root.head)
+        if pm is None:
+            raise AssembleError("catalog has no /Pages")
+        pages_num = int(pm.group(1))
+        skip = {root_num, info_num}
+
+        # Pass 1: objects whose references all resolve to already-canonical
+        # objects (fonts, resources, content streams, forms) are canonicalised
+        # and shared across documents. Pages and link annotations point into
+        # the page tree, which is cyclic, so they never qualify.
+        mapping: Dict[int, int] = {}
+        pending = {num for num in objects if num not in skip and num != pages_num}
+        progress = True
+        while progress:
+            progress = False
+            for num in sorted(pending):
+                o = objects[num]
+                if any(r not in mapping for r in _refs(o.head)):
+                    continue
+                head = _rewrite_refs(o.head, mapping)
+                key = hashlib.sha256(head + b"\x00" + (o.stream or b"")).digest()
+                shared = self._shared.get(key)
+                if shared is not None:
+                    mapping[num] = shared
+                    self.stats["objects_shared"] += 1
+                else:
+                    mapping[num] = self._shared[key] = self._alloc()
+                    self._emit(mapping[num], head, o.stream)
+                pending.discard(num)
+                progress = True
+
+        # Pass 2: everything else (page tree, pages, annotations) gets fresh numbers.
+        for num in sorted(pending | {pages_num}):
+            mapping[num] = self._alloc()
+        for num in sorted(pending):
+            o = objects[num]
+            self._emit(mapping[num], _rewrite_refs(o.head, mapping), o.stream)
+
+        pages = objects[pages_num]
+        head = _rewrite_refs(pages.head, mapping)
+        head = head[:-2].rstrip() + b"\n/Parent %d 0 R\n>>" % self._PAGES
+        self._emit(mapping[pages_num], head, None)
+
+        kids_match = _KIDS_RE.search(pages.head)
+        kids = _refs(kids_match.group(1)) if kids_match else []
+        count = re.search(rb"/Count\s+(\d+)", pages.head)
+        if kids:
+            self._sections.append((mapping[pages_num], mapping[kids[0]],
+                                   int(count.group(1)) if count else len(kids), _pdf_text(title),
+                                   _pdf_text(group) if group is not None else None))
+
+    def _emit_outline(self, parent: int, entries: List[_Bookmark]) -> None:
+        """Write sibling bookmarks (and their children) under `parent`."""
+        for i, (num, title, first_page, children) in enumerate(entries):
+            fields = [b"/Title " + title, b"/Parent %d 0 R" % parent, b"/Dest [%d 0 R /Fit]" % first_page]
+            if i > 0:
+                fields.append(b"/Prev %d 0 R" % entries[i - 1][0])
+            if i + 1 < len(entries):
+                fields.append(b"/Next %d 0 R" % entries[i + 1][0])
+            if children:
+                # A negative count shows the entry collapsed.
+                fields += [b"/First %d 0 R" % children[0][0], b"/Last %d 0 R" % children[-1][0],
+                           b"/Count -%d" % len(children)]
+                self._emit_outline(num, children)
+            self._emit(num, b"<<\n" + b"\n".join(fields) + b"\n>>", None)
+
+    def close(self) -> None:
+        """Write the shared page tree, bookmarks, catalog, xref and trailer."""
+        total = sum(section[2] for section in self._sections)
+        kids = b" ".join(b"%d 0 R" % section[0] for section in self._sections)
+        self._emit(self._PAGES, b"<<\n/Type /Pages\n/Kids [%s]\n/Count %d\n>>" % (kids, total), None)
+
+        # One bookmark per document; documents of a group hang under one entry.
+        top: List[_Bookmark] = []
+        groups: Dict[bytes, _Bookmark] = {}
+        for _, first_page, _, title, group in self._sections:
+            siblings = top
+            if group is not None:
+                if group not in groups:
+                    groups[group] = (self._alloc(), group, first_page, [])
+                    top.append(groups[group])
+                siblings = groups[group][3]
+            siblings.append((self._alloc(), title, first_page, []))
+        self._emit_outline(self._OUTLINES, top)
+        outlines = [b"/Type /Outlines", b"/Count %d" % len(top)]
+        if top:
+            outlines += [b"/First %d 0 R" % top[0][0], b"/Last %d 0 R" % top[-1][0]]
+        self._emit(self._OUTLINES, b"<<\n" + b"\n".join(outlines) + b"\n>>", None)
+        self._emit(self._CATALOG, b"<<\n/Type /Catalog\n/Pages %d 0 R\n/Outlines %d 0 R\n"
+                   b"/PageMode /UseOutlines\n/PageLayout /OneColumn\n>>" % (self._PAGES, self._OUTLINES), None)
+
+        xref_at = self._written
+        size = self._next_num
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for num in range(1, size):
+            self._write(b"%010d 00000 n \n" % self._offsets[num])
+        doc_id = hashlib.md5(b"%d-%d" % (size, xref_at)).hexdigest().upper().encode()
+        self._write(b"trailer\n<<\n/Size %d\n/Root %d 0 R\n/ID [<%s><%s>]\n>>\nstartxref\n%d\n%%%%EOF\n"
+                    % (size, self._CATALOG, doc_id, doc_id, xref_at))
+
+def monthly_inputs(base_output_dir: str, year: int, page_format: str) -> List[str]:
+    """The monthly PDFs of one year/format, in month order ([] if none were generated)."""
+    folder = os.path.join(base_output_dir, str(year), page_format)
+    if not os.path.isdir(folder):
+        return []
+    return [os.path.join(folder, name) for name in sorted(os.listdir(folder))
+            if MONTHLY_FILE_RE.match(name)]
+
+def _title_from_filename(path: str) -> str:
+    # "01 - January_2025_A5.pdf" -> "January 2025"
+    stem = os.path.basename(path)[5:-4]
+    parts = stem.split("_")
+    return " ".join(parts[:2]) if len(parts) >= 2 else stem
+
+def assemble_year(paths: Sequence[str], out_path: str) -> Dict[str, int]:
+    """Stream the given monthly PDFs into a single document at `out_path`."""
+    tmp = out_path + ".part"
+    with open(tmp, "wb") as out:
+        asm = StreamingAssembler(out)
+        for path in paths:
+            with open(path, "rb") as f:
+                asm.add_document(f.read(), _title_from_filename(path))
+            logging.info("Appended %s", path)
+        asm.close()
+    os.replace(tmp, out_path)
+    logging.info("Saved %s (%d objects in, %d written, %d shared)", out_path,
+                 asm.stats["objects_in"], asm.stats["objects_out"], asm.stats["objects_shared"])
+    return asm.stats
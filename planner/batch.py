@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from planner.config import load_config
+from planner.generate.parallel import Task, UnitResult, iter_units
+
+KINDS = ("daily", "examen")
+
+class ManifestError(ValueError):
+    pass
+
+@dataclass
+class Tenant:
+    name: str
+    cfg: Dict[str, Any]
+    outdir: str
+    years: List[int]
+    formats: List[str]
+    kinds: List[str] = field(default_factory=lambda: ["daily"])
+
+def _resolve(base_dir: str, path: str) -> str:
+    return path if os.path.isabs(path) else os.path.normpath(os.path.join(base_dir, path))
+
+def _localize_paths(cfg: Dict[str, Any], config_dir: str) -> Dict[str, Any]:
+    """Make a tenant's quote file, event sources and fonts relative to its own config file."""
+    quotes = dict(cfg.get("quotes") or {})
+    if quotes.get("path") and os.path.exists(_resolve(config_dir, quotes["path"])):
+        quotes["path"] = _resolve(config_dir, quotes["path"])
+        cfg["quotes"] = quotes
+    fonts = cfg.get("fonts") or {}
+    if fonts:
+        cfg["fonts"] = {family: {name: _resolve(config_dir, path) for name, path in variants.items()}
+                        for family, variants in fonts.items()}
+    events = dict(cfg.get("events") or {})
+    if events.get("sources"):
+        events["sources"] = [_resolve(config_dir, p) for p in events["sources"]]
+        cfg["events"] = events
+    return cfg
+
+def load_manifest(path: str) -> List[Tenant]:
+    """Parse a batch manifest.
+
+    ```yaml
+    defaults: {years: [2025], formats: [A4, A5], kinds: [daily]}
+    tenants:
+      - name: alice
+        config: alice/config.yaml          # relative to the manifest
+        outdir: out/alice                  # default: generated_planners/<name>
+        formats: [A5]
+    ```
+    """
+    import yaml
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict) or not isinstance(data.get("tenants"), list):
+        raise ManifestError(f"{path}: expected a mapping with a 'tenants' list")
+    defaults = data.get("defaults") or {}
+
+    tenants: List[Tenant] = []
+    seen = set()
+    for i, entry in enumerate(data["tenants"], start=1):
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ManifestError(f"{path}: tenant #{i} needs a 'name'")
+        name = str(entry["name"])
+        if name in seen:
+            raise ManifestError(f"{path}: duplicate tenant name '{name}'")
+        seen.add(name)
+        opts = {**defaults, **entry}
+        config_path = _resolve(base_dir, opts["config"]) if opts.get("config") else None
+        if config_path and not os.path.exists(config_path):
+            raise ManifestError(f"{path}: config for tenant '{name}' not found: {config_path}")
+        cfg = load_config(config_path)
+        if config_path:
+            cfg = _localize_paths(cfg, os.path.dirname(config_path))
+        kinds = list(opts.get("kinds") or ["daily"])
+        unknown = [k for k in kinds if k not in KINDS]
+        if unknown:
+            raise ManifestError(f"{path}: tenant '{name}' has unknown kinds {unknown}")
+        tenants.append(Tenant(
+            name=name,
+            cfg=cfg,
+            outdir=_resolve(base_dir, opts.get("outdir") or os.path.join("generated_planners", name)),
+            years=[int(y) for y in opts.get("years") or []],
+            formats=list(opts.get("formats") or ["A4", "A5"]),
+            kinds=kinds,
+        ))
+        if not tenants[-1].years:
+            raise ManifestError(f"{path}: tenant '{name}' has no years")
+    return tenants
+
+def batch_tasks(tenants: Sequence[Tenant]) -> List[Task]:
+    """All months of all tenants as one task list for a shared pool."""
+    tasks: List[Task] = []
+    for t in tenants:
+        for kind in t.kinds:
+            outdir = t.outdir if len(t.kinds) == 1 else os.path.join(t.outdir, kind)
+            tasks.extend(Task(kind, unit, outdir, t.cfg, tenant=t.name)
+                         for unit in iter_units(t.years, t.formats))
+    return tasks
+
+def tenant_report(tenants: Sequence[Tenant], results: Sequence[UnitResult],
+                  wall_seconds: float) -> Dict[str, Any]:
+    rows = []
+    for t in tenants:
+        mine = [r for r in results if r.tenant == t.name]
+        ok = [r for r in mine if r.ok]
+        rows.append({
+            "tenant": t.name,
+            "outdir": t.outdir,
+            "units": len(mine),
+            "failed": len(mine) - len(ok),
+            "seconds": round(sum(r.seconds for r in mine), 3),
+            "output_bytes": sum(r.output_bytes for r in ok),
+            "errors": [f"{r.year}-{r.month:02d} {r.page_format}: {r.error}" for r in mine if not r.ok],
+        })
+    return {"wall_seconds": round(wall_seconds, 3), "tenants": rows}
+
+def format_report(report: Dict[str, Any]) -> str:
+    header = f"{'tenant':<20} {'units':>5} {'failed':>6} {'render s':>9} {'output KiB':>11}"
+    lines = [header, "-" * len(header)]
+    for r in report["tenants"]:
+        lines.append(f"{r['tenant']:<20} {r['units']:>5} {r['failed']:>6} {r['seconds']:>9.2f} "
+                     f"{r['output_bytes'] / 1024:>11.0f}")
+    lines.append(f"Wall time: {report['wall_seconds']:.2f}s")
+    return "\n".join(lines)
+
+def save_report(report: Dict[str, Any], path: Optional[str]) -> None:
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
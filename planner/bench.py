@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from fpdf import FPDF
+
+from planner.context import RenderContext, default_context
+from planner.rendering.pdf_factory import make_pdf
+from planner.rendering.state import count_operators, page_stream
+from planner.rendering.text import clear_layout_cache
+
+DEFAULT_FORMATS = ["A4", "A5", "Letter"]
+
+# Import-time budget for `planner.cli`, and the modules it must not pull in
+# before a subcommand actually renders something.
+STARTUP_BUDGET_MS = 100.0
+HEAVY_MODULES = ("fpdf", "yaml", "planner.templates", "planner.generate.daily",
+                 "planner.generate.examen", "planner.build_cache")
+
+_STARTUP_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import planner.cli\n"
+    "print(time.perf_counter() - t)\n"
+    "print(' '.join(m for m in sys.argv[1:] if m in sys.modules))\n"
+)
+
+def _monday(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+def _template_calls() -> Dict[str, Callable[[FPDF, int], None]]:
+    """One callable per public template, rendering it for iteration i.
+
+    Most add one page per call; create_weekly_examen_page overflows onto a
+    second page on Letter, so per-page figures divide by `pdf.page`, never
+    by the number of calls.
+    """
+    import planner.templates as T
+
+    base = date(2025, 1, 1)
+
+    def day(i: int) -> date:
+        return base + timedelta(days=i % 365)
+
+    def linked(template: Callable[..., None]) -> Callable[[FPDF, date], None]:
+        # Navigation links need a target page; point them at the page being rendered.
+        def call(pdf: FPDF, d: date) -> None:
+            link = pdf.add_link()
+            template(pdf, d, link, link)
+        return call
+
+    daily, weekly = linked(T.create_daily_page), linked(T.create_weekly_overview)
+    return {
+        "create_monthly_overview": lambda pdf, i: T.create_monthly_overview(
+            pdf, 2025, i % 12 + 1, {}, pdf.add_link()),
+        "create_daily_page": lambda pdf, i: daily(pdf, day(i)),
+        "create_weekly_overview": lambda pdf, i: weekly(pdf, _monday(day(i))),
+        "create_daily_reflection_page": lambda pdf, i: T.create_daily_reflection_page(pdf, day(i)),
+        "create_weekly_examen_page": lambda pdf, i: T.create_weekly_examen_page(pdf, _monday(day(i))),
+        "create_monthly_examen_page": lambda pdf, i: T.create_monthly_examen_page(
+            pdf, "January", 2025),
+    }
+
+def _render(call: Callable[[FPDF, int], None], page_format: str, margins: Dict[str, Any],
+            pages: int, track_state: bool = True, cache_layout: bool = True,
+            context: Optional[RenderContext] = None) -> FPDF:
+    pdf = make_pdf(page_format, margins, track_state, cache_layout, context=context)
+    for i in range(pages):
+        call(pdf, i)
+    return pdf
+
+def _ops_per_page(pdf: FPDF) -> float:
+    return sum(count_operators(page_stream(pdf, n)) for n in range(1, pdf.page + 1)) / max(pdf.page, 1)
+
+@contextmanager
+def _counting_measurements() -> Iterator[List[int]]:
+    """Count text width measurements (per character while line breaking, per string otherwise)."""
+    from fpdf.line_break import Fragment
+
+    counter = [0]
+    original = Fragment.get_width
+
+    def counted(self, *args, **kwargs):
+        counter[0] += 1
+        return original(self, *args, **kwargs)
+
+    Fragment.get_width = counted  # type: ignore[method-assign]
+    try:
+        yield counter
+    finally:
+        Fragment.get_width = original  # type: ignore[method-assign]
+
+def _measurements_per_page(call: Callable[[FPDF, int], None], page_format: str,
+                           margins: Dict[str, Any], pages: int, cache_layout: bool,
+                           context: Optional[RenderContext] = None) -> float:
+    with _counting_measurements() as counter:
+        pdf = _render(call, page_format, margins, pages, cache_layout=cache_layout, context=context)
+    return counter[0] / max(pdf.page, 1)
+
+def bench_template(name: str, call: Callable[[FPDF, int], None], page_format: str,
+                   margins: Dict[str, Any], pages: int,
+                   context: Optional[RenderContext] = None) -> Dict[str, Any]:
+    """Time `pages` calls of one template into a fresh document.
+
+    Rates and averages are per page actually rendered (`pages` in the
+    result), which can exceed the number of calls.
+    `content_bytes_per_page` is the page's own uncompressed content stream;
+    furniture shared through Form XObjects is not counted per page.
+    `ops_per_page` counts its operators, and `untracked_ops_per_page` the
+    same pages rendered by plain fpdf, without TrackedPDF.
+    `measurements_per_page` counts text width measurements with the line
+    break cache warm, `uncached_measurements_per_page` without it.
+    `context` selects fonts, ruling, quotes and events (default: the
+    project config.yaml).
+    """
+    clear_layout_cache()
+    _render(call, page_format, margins, 1, context=context)  # warm-up: imports, font metrics, first-page forms
+
+    started = time.perf_counter()
+    pdf = _render(call, page_format, margins, pages, context=context)
+    elapsed = time.perf_counter() - started
+
+    stream_bytes = [len(page_stream(pdf, n)) for n in range(1, pdf.page + 1)]
+    ops = _ops_per_page(pdf)
+    untracked_ops = _ops_per_page(_render(call, page_format, margins, pages, track_state=False,
+                                          context=context))
+    measurements = _measurements_per_page(call, page_format, margins, pages, True, context)
+    uncached_measurements = _measurements_per_page(call, page_format, margins, pages, False, context)
+
+    tracemalloc.start()
+    _render(call, page_format, margins, pages, context=context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "template": name,
+        "format": page_format,
+        "pages": pdf.page,
+        "seconds": elapsed,
+        "pages_per_sec": pdf.page / elapsed if elapsed else 0.0,
+        "content_bytes_per_page": sum(stream_bytes) / len(stream_bytes) if stream_bytes else 0,
+        "ops_per_page": ops,
+        "untracked_ops_per_page": untracked_ops,
+        "measurements_per_page": measurements,
+        "uncached_measurements_per_page": uncached_measurements,
+        "peak_alloc_bytes": peak,
+    }
+
+def run_benchmarks(
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    pages: int = 50,
+    cfg: Optional[dict] = None,
+    templates: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Benchmark every (or the selected) public template for each page format."""
+    import fpdf
+
+    context = RenderContext.from_config(cfg) if cfg is not None else default_context()
+    margins = context.margins
+    calls = _template_calls()
+    results: List[Dict[str, Any]] = []
+    for name, call in calls.items():
+        if templates and name not in templates:
+            continue
+        for page_format in formats:
+            r = bench_template(name, call, page_format, margins, pages, context)
+            logging.info("%s [%s]: %.1f pages/s, %.0f B/page, %.0f ops/page (untracked %.0f), "
+                         "%.0f measurements/page (uncached %.0f), peak %.0f KiB",
+                         name, page_format, r["pages_per_sec"], r["content_bytes_per_page"],
+                         r["ops_per_page"], r["untracked_ops_per_page"], r["measurements_per_page"],
+                         r["uncached_measurements_per_page"], r["peak_alloc_bytes"] / 1024)
+            results.append(r)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "fpdf2": fpdf.__version__,
+            "calls_per_run": pages,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def measure_startup(runs: int = 5, budget_ms: float = STARTUP_BUDGET_MS) -> Dict[str, Any]:
+    """Time `import planner.cli` in fresh interpreters and list heavy modules it loaded."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples: List[float] = []
+    loaded: set = set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _STARTUP_PROBE, *HEAVY_MODULES], cwd=root,
+                             capture_output=True, text=True, check=True).stdout.splitlines()
+        samples.append(float(out[0]) * 1000)
+        if len(out) > 1:
+            loaded.update(out[1].split())
+    import_ms = statistics.median(samples)
+    return {
+        "import_ms": import_ms,
+        "budget_ms": budget_ms,
+        "heavy_modules": sorted(loaded),
+        "ok": import_ms <= budget_ms and not loaded,
+    }
+
+def format_table(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Render a results table; with a baseline report, add the pages/sec change."""
+    old = {}
+    if baseline:
+        old = {(r["template"], r["format"]): r for r in baseline.get("results", [])}
+    header = (f"{'template':<30} {'fmt':<7} {'pages/s':>9} {'B/page':>8} {'ops/page':>8} "
+              f"{'untracked':>9} {'measure':>8} {'uncached':>8} {'peak KiB':>9}")
+    if old:
+        header += f" {'vs base':>8}"
+    lines = [header, "-" * len(header)]
+    for r in report["results"]:
+        line = (f"{r['template']:<30} {r['format']:<7} {r['pages_per_sec']:>9.1f} "
+                f"{r['content_bytes_per_page']:>8.0f} {r.get('ops_per_page', 0):>8.0f} "
+                f"{r.get('untracked_ops_per_page', 0):>9.0f} {r.get('measurements_per_page', 0):>8.0f} "
+                f"{r.get('uncached_measurements_per_page', 0):>8.0f} {r['peak_alloc_bytes'] / 1024:>9.0f}")
+        prev = old.get((r["template"], r["format"]))
+        if prev and prev.get("pages_per_sec"):
+            line += f" {100.0 * (r['pages_per_sec'] / prev['pages_per_sec'] - 1):>+7.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import calendar
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from planner.generate.parallel import Unit
+
+CACHE_FILENAME = ".planner-cache.json"
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that only describe *what* to render, not *how*; their content is
+# hashed per month below, so editing them must not invalidate every month.
+_DATA_MODULES = {"data.py"}
+
+def _digest(obj) -> str:
+    blob = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+@lru_cache(maxsize=1)
+def code_fingerprint() -> str:
+    """Hash of the planner package source plus the fpdf2 version (once per process)."""
+    import fpdf
+
+    h = hashlib.sha256(f"fpdf2 {fpdf.__version__}".encode("utf-8"))
+    for root, dirs, files in os.walk(_PACKAGE_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if not name.endswith(".py") or (root == _PACKAGE_DIR and name in _DATA_MODULES):
+                continue
+            path = os.path.join(root, name)
+            h.update(os.path.relpath(path, _PACKAGE_DIR).encode("utf-8"))
+            with open(path, "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+@lru_cache(maxsize=1)
+def data_fingerprint() -> str:
+    """Hash of the data modules `code_fingerprint` leaves out (once per process)."""
+    h = hashlib.sha256()
+    for name in sorted(_DATA_MODULES):
+        with open(os.path.join(_PACKAGE_DIR, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def _font_file_stats(fonts: Optional[dict]) -> List[Tuple[str, str, str, int, int]]:
+    # Size and mtime of each configured font file: a replaced file re-renders every month.
+    if not fonts:
+        return []
+    from planner.rendering.fonts import font_files
+
+    stats = []
+    for (family, style), path in sorted(font_files(fonts).items()):
+        st = os.stat(path) if os.path.exists(path) else None
+        stats.append((family, style, path, st.st_size if st else -1, st.st_mtime_ns if st else -1))
+    return stats
+
+def _file_stat(path: str) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return -1, -1
+    return st.st_size, st.st_mtime_ns
+
+def source_signature(cfg: dict) -> Tuple:
+    """Size and mtime of every file an `InputHasher` for `cfg` reads (fonts, events, quotes).
+
+    Cheap to compute; a hasher only needs rebuilding when this changes.
+    """
+    from planner.events import _sources
+    from planner.utils import _project_root
+
+    quotes = os.path.join(_project_root(), cfg.get("quotes", {}).get("path", "my_quotes.csv"))
+    _, event_sources = _sources(cfg)
+    return (tuple(_font_file_stats(cfg.get("fonts"))),
+            tuple(_file_stat(p) for p in event_sources),
+            _file_stat(quotes))
+
+@dataclass
+class CacheDecision:
+    kind: str
+    unit: Unit
+    reason: Optional[str]  # None when the unit is up to date
+
+    @property
+    def stale(self) -> bool:
+        return self.reason is not None
+
+class InputHasher:
+    """Computes the per-month input digests a rendered PDF depends on."""
+
+    def __init__(self, cfg: dict):
+        from planner.events import store_for
+        from planner.styles import resolve_styles
+        from planner.utils import quote_source
+
+        self.signature = source_signature(cfg)
+        styles = resolve_styles(cfg)
+        self.cfg_digest = _digest(cfg)
+        self.styles_digest = _digest([styles["FONT_TITLE"], styles["FONT_BODY"],
+                                      styles["FONT_EXAMEN_STEP_TITLE"], styles["FONT_EXAMEN_PROMPT"]])
+        self.code_digest = code_fingerprint()
+        self.fonts_digest = _digest(_font_file_stats(cfg.get("fonts")))
+        self.events = store_for(cfg)
+        self.quotes = quote_source(cfg.get("quotes", {}).get("path", "my_quotes.csv"))
+
+    def _quotes_for_month(self, year: int, month: int) -> List[Tuple[str, str]]:
+        if not self.quotes:
+            return []
+        days = calendar.monthrange(year, month)[1]
+        # Same indexing as templates.create_daily_page (day of year).
+        return [self.quotes[(date(year, month, d).timetuple().tm_yday - 1) % len(self.quotes)]
+                for d in range(1, days + 1)]
+
+    def parts(self, kind: str, unit: Unit) -> Dict[str, str]:
+        year, month, page_format = unit
+        parts = {
+            "config": self.cfg_digest,
+            "styles": self.styles_digest,
+            "code": self.code_digest,
+            "fonts": self.fonts_digest,
+            "format": _digest(page_format),
+        }
+        if kind == "daily":
+            parts["birthdays"] = _digest([e.key() for e in self.events.personal_in_month(month)])
+            # Weekly overviews starting in this month list events up to six days into the next.
+            first = date(year, month, 1)
+            last = date(year, month, calendar.monthrange(year, month)[1]) + timedelta(days=6)
+            parts["special_dates"] = _digest(
+                [e.key() for e in self.events.special_in_month(year, month)]
+                + [(d.isoformat(), *e.key()) for d, e in self.events.between(first, last)])
+            parts["quotes"] = _digest(self._quotes_for_month(year, month))
+        return parts
+
+@dataclass
+class BuildCache:
+    """Content-addressed record of the inputs each monthly PDF was built from.
+
+    Stored as JSON next to the outputs (`<outdir>/.planner-cache.json`).
+    """
+
+    base_output_dir: str
+    entries: Dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.base_output_dir, CACHE_FILENAME)
+
+    @classmethod
+    def load(cls, base_output_dir: str) -> "BuildCache":
+        cache = cls(base_output_dir)
+        try:
+            with open(cache.path, "r", encoding="utf-8") as f:
+                cache.entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning("Ignoring unreadable build cache '%s': %s", cache.path, e)
+        return cache
+
+    def save(self) -> None:
+        os.makedirs(self.base_output_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _entry_key(kind: str, unit: Unit) -> str:
+        year, month, page_format = unit
+        return f"{kind}/{year}/{page_format}/{month:02d}"
+
+    def check(self, kind: str, unit: Unit, parts: Dict[str, str]) -> CacheDecision:
+        entry = self.entries.get(self._entry_key(kind, unit))
+        if entry is None:
+            return CacheDecision(kind, unit, "not built before")
+        if not entry.get("path") or not os.path.exists(os.path.join(self.base_output_dir, entry["path"])):
+            return CacheDecision(kind, unit, "output missing")
+        old = entry.get("parts", {})
+        changed = sorted(k for k in set(parts) | set(old) if parts.get(k) != old.get(k))
+        if changed:
+            return CacheDecision(kind, unit, "changed: " + ", ".join(changed))
+        return CacheDecision(kind, unit, None)
+
+    def record(self, kind: str, unit: Unit, parts: Dict[str, str], path: str) -> None:
+        self.entries[self._entry_key(kind, unit)] = {
+            "key": _digest(parts),
+            "parts": parts,
+            "path": os.path.relpath(path, self.base_output_dir),
+        }
+
+def plan_incremental(
+    cache: BuildCache, hasher: InputHasher, kind: str, units: Sequence[Unit]
+) -> Tuple[List[CacheDecision], Dict[Unit, Dict[str, str]]]:
+    """Decide which units need rendering; also returns the input digests per unit."""
+    parts = {u: hasher.parts(kind, u) for u in units}
+    return [cache.check(kind, u, parts[u]) for u in units], parts
+
+def format_report(decisions: Sequence[CacheDecision]) -> List[str]:
+    """Human-readable rebuild report: one line per rebuilt unit, then totals."""
+    lines = []
+    for d in decisions:
+        if d.stale:
+            year, month, page_format = d.unit
+            lines.append(f"rebuild {year}-{month:02d} {page_format}: {d.reason}")
+    stale = sum(1 for d in decisions if d.stale)
+    lines.append(f"{stale} rebuilt, {len(decisions) - stale} up to date.")
+    return lines
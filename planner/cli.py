@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import sys
 from datetime import date
 
-from planner.config import load_config
+from planner.config import PROFILES, load_config
 from planner.logging_setup import setup_logging
-from planner.generate.daily import generate_for_format as gen_daily
-from planner.generate.examen import generate_year_for_format as gen_examen
+from planner.metrics import timed
+
+# Generators, fpdf and the build cache are imported inside the subcommands
+# that need them so `check`, `layout` or `--help` start quickly.
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="planner", description="Remarkable Planner Generator")
@@ -18,48 +22,330 @@ def build_parser() -> argparse.ArgumentParser:
                          help="Years to generate (e.g., 2025 2026).")
     p_daily.add_argument("--formats", nargs="+", default=["A4", "A5"], help="Page formats (e.g., A4 A5).")
     p_daily.add_argument("--outdir", default="generated_planners", help="Base output directory.")
+    p_daily.add_argument("--profile", choices=PROFILES,
+                         help="Output profile (default: the config's); eink-lite draws cheaper primitives "
+                              "and checks the per-page operator budget.")
     p_daily.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
     p_daily.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
     p_daily.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+    p_daily.add_argument("--jobs", type=int, default=1,
+                         help="Render months in parallel across N worker processes (default: 1).")
+    p_daily.add_argument("--incremental", action="store_true",
+                         help="Only rebuild months whose inputs changed since the last run.")
+    p_daily.add_argument("--resume", action="store_true",
+                         help="Skip months a previous (interrupted) run finished, as verified "
+                              "against the job journal in --outdir.")
+    p_daily.add_argument("--pipeline-depth", type=int, default=0, metavar="N",
+                         help="Write finished months on a background thread while the next renders, "
+                              "with at most N months waiting (default: 0, write inline).")
+    output_daily = p_daily.add_mutually_exclusive_group()
+    output_daily.add_argument("--archive", metavar="PATH",
+                              help="Write all months into one zip archive instead of --outdir ('-' for stdout).")
+    output_daily.add_argument("--single-file", action="store_true",
+                              help="Stream all --years into one PDF per format (<outdir>/Planner_<years>_<format>.pdf).")
 
     p_examen = sub.add_parser("generate-examen", help="Generate Examen-only planner PDFs.")
     p_examen.add_argument("--years", nargs="+", type=int, default=[date.today().year],
                           help="Years to generate (e.g., 2025 2026).")
     p_examen.add_argument("--formats", nargs="+", default=["A4", "A5"], help="Page formats (e.g., A4 A5).")
     p_examen.add_argument("--outdir", default="generated_examen_planners", help="Base output directory.")
+    p_examen.add_argument("--profile", choices=PROFILES,
+                         help="Output profile (default: the config's); eink-lite draws cheaper primitives "
+                              "and checks the per-page operator budget.")
     p_examen.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
     p_examen.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
     p_examen.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+    p_examen.add_argument("--jobs", type=int, default=1,
+                         help="Render months in parallel across N worker processes (default: 1).")
+    p_examen.add_argument("--incremental", action="store_true",
+                         help="Only rebuild months whose inputs changed since the last run.")
+    p_examen.add_argument("--resume", action="store_true",
+                         help="Skip months a previous (interrupted) run finished, as verified "
+                              "against the job journal in --outdir.")
+    p_examen.add_argument("--pipeline-depth", type=int, default=0, metavar="N",
+                         help="Write finished months on a background thread while the next renders, "
+                              "with at most N months waiting (default: 0, write inline).")
+    output_examen = p_examen.add_mutually_exclusive_group()
+    output_examen.add_argument("--archive", metavar="PATH",
+                               help="Write all months into one zip archive instead of --outdir ('-' for stdout).")
+    output_examen.add_argument("--single-file", action="store_true",
+                               help="Stream all --years into one PDF per format (<outdir>/Planner_<years>_<format>.pdf).")
 
     p_check = sub.add_parser("check", help="Validate config and exit.")
     p_check.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
     p_check.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
     p_check.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
 
+    p_asm = sub.add_parser("assemble", help="Merge the monthly PDFs of a year into one file.")
+    p_asm.add_argument("--years", nargs="+", type=int, default=[date.today().year],
+                       help="Years to assemble (e.g., 2025 2026).")
+    p_asm.add_argument("--formats", nargs="+", default=["A4", "A5"], help="Page formats (e.g., A4 A5).")
+    p_asm.add_argument("--outdir", default="generated_planners",
+                       help="Base directory holding the monthly PDFs.")
+    p_asm.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_asm.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_asm.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
+    p_bench = sub.add_parser("bench", help="Micro-benchmark each page template.")
+    p_bench.add_argument("--formats", nargs="+", default=["A4", "A5", "Letter"],
+                         help="Page formats to benchmark (e.g., A4 A5 Letter).")
+    p_bench.add_argument("--pages", type=int, default=50, help="Template calls per template and format; a call may add more than one page.")
+    p_bench.add_argument("--templates", nargs="+", help="Only benchmark these template functions.")
+    p_bench.add_argument("--output", help="Write the results as JSON to this path.")
+    p_bench.add_argument("--compare", help="Previous JSON results to compare against.")
+    p_bench.add_argument("--startup", action="store_true",
+                         help="Only check the CLI import time against its budget.")
+    p_bench.add_argument("--startup-budget-ms", type=float,
+                         help="Import-time budget for --startup (default: 100 ms).")
+    p_bench.add_argument("--profile", choices=PROFILES,
+                         help="Output profile to benchmark (default: the config's); eink-lite draws "
+                              "cheaper primitives. Bench reports ops/page but does not enforce the budget.")
+    p_bench.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_bench.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_bench.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
+    p_batch = sub.add_parser("batch", help="Generate planners for every tenant of a manifest.")
+    p_batch.add_argument("manifest", help="YAML manifest listing tenants (config, outdir, years, formats).")
+    p_batch.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                         help="Worker processes shared by all tenants (default: CPU count).")
+    p_batch.add_argument("--report", help="Write the per-tenant report as JSON to this path.")
+    p_batch.add_argument("--resume", action="store_true",
+                         help="Skip months a previous (interrupted) run finished, per tenant output directory.")
+    p_batch.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_batch.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_batch.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
+    p_serve = sub.add_parser("serve", help="Serve rendered months and date ranges over local HTTP.")
+    p_serve.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1).")
+    p_serve.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765).")
+    p_serve.add_argument("--cache-mb", type=int, default=256,
+                         help="Size bound of the rendered-PDF LRU cache in MiB (default: 256).")
+    p_serve.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_serve.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_serve.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
+    p_plan = sub.add_parser("plan", help="Estimate pages, output size and render time without rendering.")
+    p_plan.add_argument("--years", nargs="+", type=int, default=[date.today().year],
+                        help="Years to plan (e.g., 2025 2026).")
+    p_plan.add_argument("--formats", nargs="+", default=["A4", "A5"], help="Page formats (e.g., A4 A5).")
+    p_plan.add_argument("--kinds", nargs="+", choices=["daily", "examen"], default=["daily"],
+                        help="Planner kinds to plan (default: daily).")
+    p_plan.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes to estimate the wall time for (default: 1).")
+    p_plan.add_argument("--costs", metavar="PATH",
+                        help="Per-template costs JSON (default: built-in reference costs). "
+                             "With --calibrate, the measured costs are written here.")
+    p_plan.add_argument("--calibrate", action="store_true",
+                        help="Measure the costs first by rendering one sample month per kind and format.")
+    p_plan.add_argument("--output", help="Write the plan as JSON to this path.")
+    p_plan.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_plan.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_plan.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
+    p_layout = sub.add_parser("layout", help="Print the precomputed layout plan for a page format.")
+    p_layout.add_argument("--format", dest="page_format", default="A4", help="Page format (e.g., A4, A5).")
+    p_layout.add_argument("--config", default="config.yaml", help="Path to YAML configuration.")
+    p_layout.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity (-v, -vv).")
+    p_layout.add_argument("--json", action="store_true", help="Emit JSON logs instead of human-readable.")
+
     return parser
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    setup_logging(args.verbose, args.json)
-    cfg = load_config(getattr(args, "config", "config.yaml"))
+    to_stdout = getattr(args, "archive", None) == "-"
+    setup_logging(args.verbose, args.json, stream=sys.stderr if to_stdout else None)
+    with timed("config_load"):
+        cfg = load_config(getattr(args, "config", "config.yaml"))
+    if getattr(args, "profile", None):
+        cfg["profile"] = args.profile
 
     if args.cmd == "check":
         logging.info("Configuration OK.")
         print("OK")
         return
 
+    if args.cmd == "assemble":
+        from planner.assemble import assemble_year, monthly_inputs
+        for y in args.years:
+            for fmt in args.formats:
+                paths = monthly_inputs(args.outdir, y, fmt)
+                if not paths:
+                    logging.warning("No monthly PDFs found for %s %s in %s", y, fmt, args.outdir)
+                    continue
+                out_path = os.path.join(args.outdir, str(y), fmt, f"Planner_{y}_{fmt}.pdf")
+                assemble_year(paths, out_path)
+                print(f"Assembled {len(paths)} months into {out_path}")
+        return
+
+    if args.cmd == "bench":
+        from planner import bench
+        if args.startup:
+            budget = args.startup_budget_ms or bench.STARTUP_BUDGET_MS
+            startup = bench.measure_startup(budget_ms=budget)
+            print(f"import planner.cli: {startup['import_ms']:.1f} ms (budget {budget:.0f} ms)")
+            if startup["heavy_modules"]:
+                print("Loaded eagerly: " + ", ".join(startup["heavy_modules"]))
+            if not startup["ok"]:
+                raise SystemExit(1)
+            return
+        report = bench.run_benchmarks(args.formats, args.pages, cfg, args.templates)
+        baseline = bench.load_report(args.compare) if args.compare else None
+        print(bench.format_table(report, baseline))
+        if args.output:
+            bench.save_report(report, args.output)
+            logging.info("Benchmark results written to %s", args.output)
+        return
+
+    if args.cmd == "batch":
+        import time
+        from planner import batch
+        from planner.generate.parallel import log_summary, run_tasks
+        try:
+            tenants = batch.load_manifest(args.manifest)
+        except (OSError, batch.ManifestError) as e:
+            parser.error(str(e))
+        from planner.journal import open_journals, pending_tasks
+        tasks = batch.batch_tasks(tenants)
+        journals = open_journals(tasks, args.resume)
+        tasks = pending_tasks(tasks, journals)
+        started = time.perf_counter()
+        results = run_tasks(tasks, args.jobs, args.verbose, args.json,
+                            on_result=lambda task, r: journals[task.base_output_dir].record_result(task, r))
+        report = batch.tenant_report(tenants, results, time.perf_counter() - started)
+        failed = log_summary(results)
+        print(batch.format_report(report))
+        batch.save_report(report, args.report)
+        if failed:
+            raise SystemExit(1)
+        return
+
+    if args.cmd == "serve":
+        from planner.serve import make_server
+        server = make_server(args.host, args.port, cfg, args.cache_mb * 1024 * 1024)
+        host, port = server.server_address[:2]
+        print(f"Serving on http://{host!s}:{port}/ (GET /month?year=&month=&format=&kind=, "
+              f"/range?start=&end=&format=, /stats)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    if args.cmd == "plan":
+        import json
+        from planner import plan
+        costs = None
+        if args.calibrate:
+            costs = plan.calibrate(args.formats, cfg, year=args.years[0])
+            if args.costs:
+                plan.save_costs(costs, args.costs)
+                logging.info("Calibrated costs written to %s", args.costs)
+        elif args.costs:
+            costs = plan.load_costs(args.costs)
+        summary = plan.summarize(plan.plan_run(args.kinds, args.years, args.formats, costs), args.jobs, costs)
+        print(plan.format_plan(summary))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            logging.info("Plan written to %s", args.output)
+        return
+
+    if args.cmd == "layout":
+        import json
+        from planner.layout import layout_for_format
+        layout = layout_for_format(args.page_format, cfg.get("margins", {}), cfg)
+        print(json.dumps(layout.as_dict(), indent=2))
+        return
+
+    if args.cmd in ("generate-daily", "generate-examen") and args.archive:
+        from planner.api import write_archive
+        from planner.generate.parallel import iter_units
+        kind = "daily" if args.cmd == "generate-daily" else "examen"
+        if args.jobs > 1 or args.incremental or args.pipeline_depth or args.resume:
+            logging.warning("--jobs, --incremental, --pipeline-depth and --resume are ignored with --archive.")
+        units = iter_units(args.years, args.formats)
+        if to_stdout:
+            count = write_archive(sys.stdout.buffer, units, cfg, kind)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.archive, "wb") as f:
+                count = write_archive(f, units, cfg, kind)
+        print(f"Archived {count} {kind} months to {'stdout' if to_stdout else args.archive}.",
+              file=sys.stderr if to_stdout else sys.stdout)
+        return
+
+    if args.cmd in ("generate-daily", "generate-examen") and args.single_file:
+        from planner.api import document_name, save_document
+        kind = "daily" if args.cmd == "generate-daily" else "examen"
+        if args.jobs > 1 or args.incremental or args.pipeline_depth or args.resume:
+            logging.warning("--jobs, --incremental, --pipeline-depth and --resume are ignored with --single-file.")
+        for fmt in args.formats:
+            out_path = os.path.join(args.outdir, document_name(args.years, fmt))
+            with timed("single_file", kind=kind, format=fmt):
+                stats = save_document(out_path, args.years, fmt, cfg, kind)
+            print(f"Wrote {stats['documents']} months into {out_path}")
+        return
+
+    if args.cmd in ("generate-daily", "generate-examen") and (args.jobs > 1 or args.incremental):
+        from planner.build_cache import BuildCache, InputHasher, format_report, plan_incremental
+        from planner.generate.parallel import iter_units, log_summary, run_units
+        from planner.journal import JobJournal
+        kind = "daily" if args.cmd == "generate-daily" else "examen"
+        if args.pipeline_depth:
+            logging.warning("--pipeline-depth is ignored with --jobs and --incremental.")
+        journal = JobJournal(args.outdir, cfg, args.resume)
+        all_units = iter_units(args.years, args.formats)
+        units = journal.pending(kind, all_units)
+        cache = None
+        parts: dict = {}
+        if args.incremental:
+            cache = BuildCache.load(args.outdir)
+            decisions, parts = plan_incremental(cache, InputHasher(cfg), kind, units)
+            for line in format_report(decisions):
+                logging.info("%s", line)
+                print(line)
+            units = [d.unit for d in decisions if d.stale]
+        if not units:
+            print(f"All {len(all_units)} units up to date; nothing to build.")
+            return
+        results = run_units(kind, units, args.outdir, cfg, args.jobs, args.verbose, args.json,
+                            on_result=journal.record_result)
+        if cache is not None:
+            for r in results:
+                if r.ok and r.path:
+                    unit = (r.year, r.month, r.page_format)
+                    cache.record(kind, unit, parts[unit], r.path)
+            cache.save()
+        failed = log_summary(results)
+        for r in results:
+            if not r.ok:
+                print(f"FAILED {r.year}-{r.month:02d} {r.page_format}: {r.error}")
+        print(f"{kind.capitalize()} planner generation complete: "
+              f"{len(results) - failed}/{len(results)} units succeeded.")
+        if failed:
+            raise SystemExit(1)
+        return
+
     if args.cmd == "generate-daily":
+        from planner.generate.daily import generate_for_format as gen_daily
+        from planner.journal import JobJournal
+        journal = JobJournal(args.outdir, cfg, args.resume)
         for y in args.years:
             for fmt in args.formats:
-                gen_daily(date(y,1,1), date(y,12,31), fmt, args.outdir, cfg)
+                gen_daily(date(y,1,1), date(y,12,31), fmt, args.outdir, cfg, args.pipeline_depth, journal)
         print("Daily planner generation complete.")
         return
 
     if args.cmd == "generate-examen":
+        from planner.generate.examen import generate_year_for_format as gen_examen
+        from planner.journal import JobJournal
+        journal = JobJournal(args.outdir, cfg, args.resume)
         for y in args.years:
             for fmt in args.formats:
-                gen_examen(y, fmt, args.outdir, cfg)
+                gen_examen(y, fmt, args.outdir, cfg, args.pipeline_depth, journal)
         print("Examen planner generation complete.")
         return
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import os
-import yaml
 from typing import Dict, Any
 
 DEFAULTS: Dict[str, Any] = {
@@ -9,9 +8,31 @@ DEFAULTS: Dict[str, Any] = {
     "quotes": {
         "path": "my_quotes.csv",
         "seed": 0
+    },
+    "events": {
+        "include_builtin": True,   # birthdays / special dates from planner/data.py
+        "sources": []              # extra .csv / .yaml event files
+    },
+    "ruling": {
+        "mode": "lines",           # "lines": one rule per line; "pattern": one tiling-pattern fill per area
+        "style": "lines",          # pattern cell: lines | dots | squares
+        "spacing_mm": None,        # pattern spacing; default: the template's own line height
+        "dot_size_mm": 0.5
+    },
+    "fonts": {},                   # family -> {regular, bold, italic, bold_italic: .ttf/.otf path}
+    "profile": "default",          # "eink-lite": cheaper drawing primitives for e-ink devices
+    "eink": {
+        "max_ops_per_page": 300    # eink-lite operator budget per page (forms it places included)
     }
 }
 
+RULING_MODES = ("lines", "pattern")
+RULING_STYLES = ("lines", "dots", "squares")
+PROFILES = ("default", "eink-lite")
+# config key -> fpdf style letters
+FONT_STYLES = {"regular": "", "bold": "B", "italic": "I", "bold_italic": "BI"}
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".otc")
+
 MONTHS = {
     "en_US": ["", "January","February","March","April","May","June","July","August","September","October","November","December"],
     "pt_PT": ["", "Janeiro","Fevereiro","Março","Abril","Maio","Junho","Julho","Agosto","Setembro","Outubro","Novembro","Dezembro"],
@@ -21,6 +42,7 @@ MONTHS = {
 def load_config(path: str | None) -> Dict[str, Any]:
     data: Dict[str, Any] = {}
     if path and os.path.exists(path):
+        import yaml  # deferred: only needed when there is a file to parse
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
     # shallow merge
@@ -37,6 +59,29 @@ def load_config(path: str | None) -> Dict[str, Any]:
     for key in ["left","top","right","bottom"]:
         if float(m.get(key, 0)) < 0:
             raise ValueError(f"Margin '{key}' must be >= 0")
+    ruling = cfg.get("ruling", {})
+    if ruling.get("mode") not in RULING_MODES:
+        raise ValueError(f"ruling.mode must be one of {', '.join(RULING_MODES)}")
+    if ruling.get("style") not in RULING_STYLES:
+        raise ValueError(f"ruling.style must be one of {', '.join(RULING_STYLES)}")
+    if ruling.get("spacing_mm") is not None and float(ruling["spacing_mm"]) <= 0:
+        raise ValueError("ruling.spacing_mm must be > 0")
+    if cfg.get("profile") not in PROFILES:
+        raise ValueError(f"profile must be one of {', '.join(PROFILES)}")
+    budget = (cfg.get("eink") or {}).get("max_ops_per_page")
+    if budget is not None and int(budget) <= 0:
+        raise ValueError("eink.max_ops_per_page must be > 0")
+    fonts = cfg.get("fonts") or {}
+    if not isinstance(fonts, dict):
+        raise ValueError("fonts must map family names to their font files")
+    for family, variants in fonts.items():
+        if not isinstance(variants, dict) or "regular" not in variants:
+            raise ValueError(f"fonts.{family} needs at least a 'regular' file")
+        for name, file in variants.items():
+            if name not in FONT_STYLES:
+                raise ValueError(f"fonts.{family}.{name}: expected one of {', '.join(FONT_STYLES)}")
+            if not str(file).lower().endswith(FONT_EXTENSIONS):
+                raise ValueError(f"fonts.{family}.{name} must be a {'/'.join(FONT_EXTENSIONS)} file")
     return cfg
 
 def month_name(locale_code: str, month: int) -> str:
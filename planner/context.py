@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
+from fpdf import FPDF
+
+from planner.days import Day, DayTable, day_table
+from planner.events import EventStore, store_for
+from planner.styles import resolve_styles
+
+# Everything a render reads besides the page itself: fonts, ruling, quotes
+# and events of one configuration. A context is built from a config, bound
+# to each document it renders, and read back by the templates through
+# `context_of(pdf)`, so renders of different configs can run side by side
+# in one process. The expensive parts (quote index, event store, day
+# tables, parsed fonts) are shared process-wide by their own caches.
+
+Font = Tuple[str, str, int]
+
+_ATTR = "_planner_context"
+
+@dataclass
+class RenderContext:
+    """The configuration-dependent inputs of a render."""
+
+    cfg: Dict[str, Any]
+    font_title: Font
+    font_body: Font
+    font_examen_step_title: Font
+    font_examen_prompt: Font
+    ruling: Dict[str, Any]
+    quotes_path: str
+    events: EventStore
+    profile: str = "default"
+    op_budget: Optional[int] = None  # eink-lite: operators allowed per page
+    _quotes: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "RenderContext":
+        styles = resolve_styles(cfg)
+        profile = cfg.get("profile") or "default"
+        ruling = {"mode": "lines", "style": "lines", "spacing_mm": None, "dot_size_mm": 0.5,
+                  **(cfg.get("ruling") or {})}
+        if profile == "eink-lite":
+            ruling["mode"] = "pattern"  # one fill per writing area instead of a rule per line
+        return cls(
+            cfg=cfg,
+            font_title=tuple(styles["FONT_TITLE"]),
+            font_body=tuple(styles["FONT_BODY"]),
+            font_examen_step_title=tuple(styles["FONT_EXAMEN_STEP_TITLE"]),
+            font_examen_prompt=tuple(styles["FONT_EXAMEN_PROMPT"]),
+            ruling=ruling,
+            quotes_path=(cfg.get("quotes") or {}).get("path") or "my_quotes.csv",
+            events=store_for(cfg),
+            profile=profile,
+            op_budget=(cfg.get("eink") or {}).get("max_ops_per_page"),
+        )
+
+    @property
+    def lite(self) -> bool:
+        """True for the eink-lite profile (cheaper primitives, see planner.rendering.budget)."""
+        return self.profile == "eink-lite"
+
+    @property
+    def margins(self) -> Dict[str, Any]:
+        return self.cfg.get("margins", {})
+
+    @property
+    def fonts(self) -> Dict[str, Dict[str, str]]:
+        return self.cfg.get("fonts") or {}
+
+    @property
+    def locale(self) -> str:
+        return self.cfg.get("locale", "en_US")
+
+    @property
+    def quotes(self):
+        # The quote index is opened on first use (the first `days()` table needs its length),
+        # not when the context is built.
+        # quote_source reuses the shared store while the file is unchanged on disk.
+        if self._quotes is None:
+            from planner.utils import quote_source
+
+            self._quotes = quote_source(self.quotes_path)
+        return self._quotes
+
+    def days(self, year: int) -> DayTable:
+        return day_table(year, len(self.quotes), self.events)
+
+    def day(self, d: date) -> Day:
+        """Labels, quote slot and events of a date, from the per-year table."""
+        return self.days(d.year)[d]
+
+_default: Optional[RenderContext] = None
+_default_lock = threading.Lock()
+
+def default_context() -> RenderContext:
+    """Context of the project config.yaml, for documents rendered without one."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                from planner.config import load_config
+                from planner.styles import CONFIG_PATH
+
+                _default = RenderContext.from_config(load_config(CONFIG_PATH))
+    return _default
+
+def bind_context(pdf: FPDF, ctx: RenderContext) -> FPDF:
+    pdf.__dict__[_ATTR] = ctx
+    return pdf
+
+def context_of(pdf: FPDF) -> RenderContext:
+    """The context `pdf` is rendered with (see `bind_context`)."""
+    ctx = pdf.__dict__.get(_ATTR)
+    return ctx if ctx is not None else default_context()
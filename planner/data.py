@@ -105,7 +105,7 @@ BIRTHDAYS_ANNIVERSARIES_DATA = [
 # {"name": "St. Patrick's Day", "day": 17, "month": 3, "type": "saint"},
 # {"name": "Project Deadline", "day": 15, "month": 6, "year": 2025, "type": "gift"} # A specific one-time event
 
-SPECIAL_DATES_DATA = [
+SPECIAL_DATES_DATA: list = [
     # Add your special dates here
     # e.g. {"name": "Christmas Day", "day": 25, "month": 12, "type": "holiday"},
 ]
\ No newline at end of file
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import calendar
+import threading
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+from planner.events import Event, EventStore
+
+# Everything the templates derive from a date (weekday, labels, quote slot,
+# events) computed once per year instead of once per page and per format.
+# Labels are assembled from the locale's day and month names, which is what
+# strftime("%A", "%B", ...) returns for them.
+
+_MAX_TABLES = 16
+
+class Day:
+    """One calendar day as the templates need it."""
+
+    __slots__ = ("date", "weekday", "iso_week", "day_of_year", "month_label", "date_label",
+                 "short_label", "quote_index", "events")
+
+    def __init__(self, d: date, weekday: int, iso_week: int, day_of_year: int, month_label: str,
+                 date_label: str, short_label: str, quote_index: int, events: Tuple[Event, ...]):
+        self.date = d
+        self.weekday = weekday          # Monday == 0
+        self.iso_week = iso_week
+        self.day_of_year = day_of_year  # 1-based
+        self.month_label = month_label  # "January"
+        self.date_label = date_label    # "Wednesday, January 01, 2025"
+        self.short_label = short_label  # "Wed 01"
+        self.quote_index = quote_index  # -1 without quotes
+        self.events = events
+
+    def __repr__(self) -> str:
+        return f"Day({self.date.isoformat()})"
+
+def _week_one(year: int) -> int:
+    """Ordinal of the Monday starting ISO week 1 of `year`."""
+    jan4 = date(year, 1, 4).toordinal()
+    return jan4 - (jan4 - 1) % 7
+
+class DayTable:
+    """The days of one year, indexed by date; built in one pass over ordinals."""
+
+    __slots__ = ("year", "first_ordinal", "days", "_grids")
+
+    def __init__(self, year: int, quote_count: int, store: EventStore):
+        self.year = year
+        self.first_ordinal = date(year, 1, 1).toordinal()
+        last_ordinal = date(year, 12, 31).toordinal()
+        day_names = list(calendar.day_name)
+        day_abbrs = list(calendar.day_abbr)
+        month_names = list(calendar.month_name)
+        weeks = (_week_one(year - 1), _week_one(year), _week_one(year + 1))
+
+        days: List[Day] = []
+        for ordinal in range(self.first_ordinal, last_ordinal + 1):
+            d = date.fromordinal(ordinal)
+            weekday = (ordinal - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+            day_of_year = ordinal - self.first_ordinal + 1
+            if ordinal < weeks[1]:
+                iso_week = (ordinal - weeks[0]) // 7 + 1
+            elif ordinal >= weeks[2]:
+                iso_week = 1
+            else:
+                iso_week = (ordinal - weeks[1]) // 7 + 1
+            month_label = month_names[d.month]
+            days.append(Day(
+                d, weekday, iso_week, day_of_year, month_label,
+                f"{day_names[weekday]}, {month_label} {d.day:02d}, {year}",
+                f"{day_abbrs[weekday]} {d.day:02d}",
+                (day_of_year - 1) % quote_count if quote_count else -1,
+                tuple(store.on(d)),
+            ))
+        self.days = days
+        self._grids: Dict[int, List[List[int]]] = {}
+
+    def __getitem__(self, d: date) -> Day:
+        if d.year != self.year:
+            raise KeyError(d)
+        return self.days[d.toordinal() - self.first_ordinal]
+
+    def month(self, month: int) -> Sequence[Day]:
+        first = date(self.year, month, 1).toordinal() - self.first_ordinal
+        return self.days[first:first + calendar.monthrange(self.year, month)[1]]
+
+    def month_grid(self, month: int) -> List[List[int]]:
+        """Weeks of the month as day numbers, 0 outside it (like calendar.monthcalendar)."""
+        grid = self._grids.get(month)
+        if grid is None:
+            days = self.month(month)
+            cells = [0] * days[0].weekday + [day.date.day for day in days]
+            cells += [0] * (-len(cells) % 7)
+            grid = self._grids[month] = [cells[i:i + 7] for i in range(0, len(cells), 7)]
+        return grid
+
+_TABLES: Dict[Tuple[int, int, EventStore], DayTable] = {}
+_LOCK = threading.Lock()
+
+def day_table(year: int, quote_count: int, store: EventStore) -> DayTable:
+    """Cached table for a year; shared by every format rendered in the process."""
+    key = (year, quote_count, store)
+    table = _TABLES.get(key)
+    if table is None:
+        table = DayTable(year, quote_count, store)
+        with _LOCK:
+            if len(_TABLES) >= _MAX_TABLES:
+                del _TABLES[next(iter(_TABLES))]
+            table = _TABLES.setdefault(key, table)
+    return table
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import csv
+import logging
+import os
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Birthdays and anniversaries recur every year; their `year` is the year of
+# the original event (used for ages). Every other type is a special date,
+# which recurs yearly unless it carries a year.
+PERSONAL_TYPES = frozenset({"birthday", "anniversary"})
+
+class Event:
+    __slots__ = ("type", "name", "day", "month", "year")
+
+    def __init__(self, type: str, name: str, day: int, month: int, year: Optional[int] = None):
+        self.type = type
+        self.name = name
+        self.day = day
+        self.month = month
+        self.year = year
+
+    @property
+    def personal(self) -> bool:
+        return self.type in PERSONAL_TYPES
+
+    @property
+    def recurring(self) -> bool:
+        return self.personal or self.year is None
+
+    def key(self) -> Tuple[Any, ...]:
+        return (self.type, self.name, self.month, self.day, self.year)
+
+    def __repr__(self) -> str:
+        return f"Event{self.key()!r}"
+
+def _event_from_mapping(row: Dict[str, Any], default_type: str) -> Event:
+    year = row.get("year")
+    return Event(
+        type=(str(row.get("type") or default_type)).strip().lower(),
+        name=str(row["name"]).strip(),
+        day=int(row["day"]),
+        month=int(row["month"]),
+        year=int(year) if year not in (None, "") else None,
+    )
+
+class EventStore:
+    """Birthdays, anniversaries and special dates indexed for per-day lookups.
+
+    Recurring events are keyed by (month, day), one-off special dates by their
+    date, and both are also grouped per month (sorted by day) for the monthly
+    overview. Lookups never scan the full list.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()):
+        self._annual: Dict[Tuple[int, int], List[Event]] = defaultdict(list)
+        self._dated: Dict[date, List[Event]] = defaultdict(list)
+        self._annual_by_month: Dict[int, List[Event]] = defaultdict(list)
+        self._dated_by_month: Dict[Tuple[int, int], List[Event]] = defaultdict(list)
+        self._sorted = True
+        self.count = 0
+        for e in events:
+            self.add(e)
+
+    def add(self, event: Event) -> None:
+        if not 1 <= event.month <= 12 or not 1 <= event.day <= 31:
+            raise ValueError(f"invalid day/month for event {event.name!r}: {event.day}/{event.month}")
+        if event.recurring:
+            self._annual[(event.month, event.day)].append(event)
+            self._annual_by_month[event.month].append(event)
+        else:
+            year = event.year
+            assert year is not None  # an event without a year is recurring
+            d = date(year, event.month, event.day)
+            self._dated[d].append(event)
+            self._dated_by_month[(year, event.month)].append(event)
+        self._sorted = False
+        self.count += 1
+
+    def _ensure_sorted(self) -> None:
+        if self._sorted:
+            return
+        for events in (*self._annual_by_month.values(), *self._dated_by_month.values()):
+            events.sort(key=lambda e: e.day)
+        self._sorted = True
+
+    def on(self, d: date) -> List[Event]:
+        """All events falling on `d` (recurring first)."""
+        return self._annual.get((d.month, d.day), []) + self._dated.get(d, [])
+
+    def personal_in_month(self, month: int) -> List[Event]:
+        """Birthdays and anniversaries of a month, sorted by day."""
+        self._ensure_sorted()
+        return [e for e in self._annual_by_month.get(month, ()) if e.personal]
+
+    def special_in_month(self, year: int, month: int) -> List[Event]:
+        """Special dates (recurring and year-specific) of a month, sorted by day."""
+        self._ensure_sorted()
+        annual = [e for e in self._annual_by_month.get(month, ()) if not e.personal]
+        dated = self._dated_by_month.get((year, month), [])
+        return sorted(annual + dated, key=lambda e: e.day)
+
+    def between(self, first: date, last: date) -> Iterator[Tuple[date, Event]]:
+        d = first
+        while d <= last:
+            for e in self.on(d):
+                yield d, e
+            d += timedelta(days=1)
+
+    # --- Loading ---------------------------------------------------------
+
+    @classmethod
+    def builtin(cls) -> "EventStore":
+        """The events edited as Python literals in planner/data.py."""
+        from planner.data import BIRTHDAYS_ANNIVERSARIES_DATA, SPECIAL_DATES_DATA
+
+        store = cls()
+        store.extend(BIRTHDAYS_ANNIVERSARIES_DATA, default_type="birthday", source="planner/data.py")
+        store.extend(SPECIAL_DATES_DATA, default_type="other", source="planner/data.py")
+        return store
+
+    def extend(self, rows: Iterable[Dict[str, Any]], default_type: str = "other",
+               source: str = "<memory>") -> None:
+        for i, row in enumerate(rows, start=1):
+            try:
+                self.add(_event_from_mapping(row, default_type))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping invalid event #%d in '%s': %s", i, source, e)
+
+    def load_csv(self, path: str) -> None:
+        """Columns: type, name, day, month[, year]; a header row is required."""
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            self.extend(csv.DictReader(f), source=path)
+
+    def load_yaml(self, path: str) -> None:
+        """Either a list of events, or a mapping with `birthdays_anniversaries`
+        and/or `special_dates` lists (same fields as planner/data.py)."""
+        import yaml
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or []
+        if isinstance(data, dict):
+            self.extend(data.get("birthdays_anniversaries") or [], default_type="birthday", source=path)
+            self.extend(data.get("special_dates") or [], default_type="other", source=path)
+        else:
+            self.extend(data, source=path)
+
+    def load(self, path: str) -> None:
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".csv":
+            self.load_csv(path)
+        elif ext in (".yaml", ".yml"):
+            self.load_yaml(path)
+        else:
+            raise ValueError(f"Unsupported event source '{path}' (expected .csv, .yaml or .yml)")
+
+def _sources(cfg: Optional[dict]) -> Tuple[bool, Tuple[str, ...]]:
+    events_cfg = (cfg or {}).get("events") or {}
+    return bool(events_cfg.get("include_builtin", True)), tuple(events_cfg.get("sources") or ())
+
+def build_store(cfg: Optional[dict] = None) -> EventStore:
+    """Event store for a config: planner/data.py plus `events.sources` files."""
+    include_builtin, sources = _sources(cfg)
+    store = EventStore.builtin() if include_builtin else EventStore()
+    for path in sources:
+        if not os.path.exists(path):
+            logger.warning("Event source '%s' not found; skipping.", os.path.abspath(path))
+            continue
+        before = store.count
+        store.load(path)
+        logger.info("Loaded %d events from '%s'.", store.count - before, os.path.abspath(path))
+    return store
+
+_STORES: Dict[Tuple[Any, ...], EventStore] = {}
+
+def _cache_key(cfg: Optional[dict]) -> Tuple[Any, ...]:
+    include_builtin, sources = _sources(cfg)
+    mtimes = tuple(os.path.getmtime(p) if os.path.exists(p) else None for p in sources)
+    return include_builtin, sources, mtimes
+
+def store_for(cfg: Optional[dict]) -> EventStore:
+    """Cached store for a config; reloaded when a source file changes."""
+    key = _cache_key(cfg)
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES.setdefault(key, build_store(cfg))  # one store even if threads race here
+    return store
+
+def describe(event: Event) -> str:
+    return event.name if event.type in ("other", "") else f"{event.name} ({event.type})"
+
+def events_label(events: Sequence[Event]) -> str:
+    return " · ".join(describe(e) for e in events)
@@ -3,11 +3,19 @@ from __future__ import annotations
 import logging
 import os
 from datetime import date
+from typing import TYPE_CHECKING, Optional
 from fpdf import FPDF
 
 from planner.config import month_name
+from planner.context import RenderContext
+from planner.metrics import MonthMetrics
+from planner.rendering.budget import check_operator_budget
 from planner.rendering.pdf_factory import make_pdf
-from planner.generate.month_loop import iter_date_range
+from planner.generate.month_loop import iter_date_range, iter_month_starts, month_bounds
+from planner.generate.writer import pipelined, save_pdf
+
+if TYPE_CHECKING:
+    from planner.journal import JobJournal
 
 # Use your existing templates without touching them
 from planner.templates import (
@@ -22,72 +30,113 @@ def _ensure_dir(path: str) -> None:
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
 
-def generate_for_format(
-    start_date: date,
-    end_date: date,
+def month_filename(year: int, month: int, page_format: str, locale_code: str) -> str:
+    return f"{month:02d} - {month_name(locale_code, month)}_{year}_{page_format}.pdf"
+
+def build_month_pdf(
+    year: int,
+    month: int,
     page_format: str,
-    base_output_dir: str,
     cfg: dict,
-) -> None:
-    """Generate a planner PDF per month for [start_date, end_date]."""
-    margins = cfg.get("margins", {})
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    metrics: Optional[MonthMetrics] = None,
+    context: Optional[RenderContext] = None,
+) -> FPDF:
+    """Render one month of the daily planner (optionally clipped to [start_date, end_date]).
+
+    `context` is the render context for `cfg`; callers rendering many months
+    of one config may build it once and pass it along.
+    """
+    m = metrics or MonthMetrics("daily", year, month, page_format)
     locale_code = cfg.get("locale", "en_US")
-
-    year_dir = os.path.join(base_output_dir, str(start_date.year), page_format)
-    _ensure_dir(year_dir)
-    logging.info("Output dir: %s", os.path.abspath(year_dir))
-
-    # init first month
-    current_year = start_date.year
-    current_month = start_date.month
-    pdf: FPDF = make_pdf(page_format, margins)
+    first_day, last_day = month_bounds(year, month)
+    if start_date is not None:
+        first_day = max(first_day, start_date)
+    if end_date is not None:
+        last_day = min(last_day, end_date)
+
+    ctx = context
+    if ctx is None:
+        with m.stage("render_context"):
+            ctx = RenderContext.from_config(cfg)
+    with m.stage("make_pdf"):
+        pdf: FPDF = make_pdf(page_format, ctx.margins, context=ctx)
 
     daily_links: dict = {}           # let monthly_overview populate this
-    calendar_link: int = pdf.add_link()
-    create_monthly_overview(pdf, current_year, current_month, daily_links, calendar_link)
-
-    for d in iter_date_range(start_date, end_date):
-        # month boundary
-        if d.month != current_month or d.year != current_year:
-            month_label = month_name(locale_code, current_month)
-            create_monthly_examen_page(pdf, month_label, current_year)
-
-            out_name = f"{current_month:02d} - {month_label}_{current_year}_{page_format}.pdf"
-            out_path = os.path.join(year_dir, out_name)
-            try:
-                pdf.output(out_path)
-                logging.info("Saved %s", out_path)
-            except Exception as e:
-                logging.error("Failed to save %s: %s", out_path, e)
-                raise
-
-            current_month = d.month
-            current_year = d.year
-            pdf = make_pdf(page_format, margins)
-
-            daily_links = {}
-            calendar_link = pdf.add_link()
-            create_monthly_overview(pdf, current_year, current_month, daily_links, calendar_link)
+    with m.stage("link_allocation"):
+        calendar_link: int = pdf.add_link()
+    with m.stage("create_monthly_overview"):
+        create_monthly_overview(pdf, year, month, daily_links, calendar_link)
 
+    for d in iter_date_range(first_day, last_day):
         # daily page
-        create_daily_page(pdf, d, calendar_link, daily_links[d])
+        with m.stage("create_daily_page"):
+            create_daily_page(pdf, d, calendar_link, daily_links[d])
 
         # weekly overview on Mondays: reuse the SAME link id as the daily page so the
         # monthly calendar Monday cell points to the weekly overview (the weekly call sets the final target).
         if d.weekday() == 0:
-            create_weekly_overview(pdf, d, calendar_link, daily_links[d])
+            with m.stage("create_weekly_overview"):
+                create_weekly_overview(pdf, d, calendar_link, daily_links[d])
 
         # daily reflection (two-arg signature in your templates)
-        create_daily_reflection_page(pdf, d)
-
-    # finalize last month
-    month_label = month_name(locale_code, current_month)
-    create_monthly_examen_page(pdf, month_label, current_year)
-    out_name = f"{current_month:02d} - {month_label}_{current_year}_{page_format}.pdf"
-    out_path = os.path.join(year_dir, out_name)
-    try:
-        pdf.output(out_path)
-        logging.info("Saved %s", out_path)
-    except Exception as e:
-        logging.error("Failed to save %s: %s", out_path, e)
-        raise
+        with m.stage("create_daily_reflection_page"):
+            create_daily_reflection_page(pdf, d)
+
+    with m.stage("create_monthly_examen_page"):
+        create_monthly_examen_page(pdf, month_name(locale_code, month), year)
+    if ctx.lite:
+        with m.stage("operator_budget"):
+            check_operator_budget(pdf, ctx.op_budget, m)
+    m.count("pages", pdf.page)
+    m.count("internal_links", len(pdf.links))
+    return pdf
+
+def generate_month(
+    year: int,
+    month: int,
+    page_format: str,
+    base_output_dir: str,
+    cfg: dict,
+) -> str:
+    """Generate the planner PDF for a single month and return its path."""
+    out_dir = os.path.join(base_output_dir, str(year), page_format)
+    _ensure_dir(out_dir)
+    out_path = os.path.join(out_dir, month_filename(year, month, page_format, cfg.get("locale", "en_US")))
+    metrics = MonthMetrics("daily", year, month, page_format)
+    save_pdf(build_month_pdf(year, month, page_format, cfg, metrics=metrics), out_path, metrics)
+    return out_path
+
+def generate_for_format(
+    start_date: date,
+    end_date: date,
+    page_format: str,
+    base_output_dir: str,
+    cfg: dict,
+    pipeline_depth: int = 0,
+    journal: Optional[JobJournal] = None,
+) -> None:
+    """Generate a planner PDF per month for [start_date, end_date].
+
+    With `pipeline_depth` > 0, finished months are written by a background
+    thread (at most that many waiting) while the next month renders.
+    Finished months are recorded in `journal`, which also decides the months
+    a resumed run skips.
+    """
+    locale_code = cfg.get("locale", "en_US")
+
+    year_dir = os.path.join(base_output_dir, str(start_date.year), page_format)
+    _ensure_dir(year_dir)
+    logging.info("Output dir: %s", os.path.abspath(year_dir))
+
+    context = RenderContext.from_config(cfg)
+    with pipelined(pipeline_depth, journal.on_saved if journal else None) as save:
+        for first in iter_month_starts(start_date, end_date):
+            if journal is not None and journal.done("daily", (first.year, first.month, page_format)):
+                continue
+            metrics = MonthMetrics("daily", first.year, first.month, page_format)
+            pdf = build_month_pdf(first.year, first.month, page_format, cfg, start_date, end_date,
+                                  metrics, context)
+            out_name = month_filename(first.year, first.month, page_format, locale_code)
+            save(pdf, os.path.join(year_dir, out_name), metrics)
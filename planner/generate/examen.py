@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-import logging
 import os
 from datetime import date, timedelta
+from typing import TYPE_CHECKING, Optional
 
 from fpdf import FPDF
 
 from planner.config import month_name
+from planner.context import RenderContext
+from planner.generate.daily import month_filename
+from planner.generate.writer import pipelined, save_pdf
+from planner.metrics import MonthMetrics
+from planner.rendering.budget import check_operator_budget
 from planner.rendering.pdf_factory import make_pdf
 
+if TYPE_CHECKING:
+    from planner.journal import JobJournal
+
 # Import the templates module and feature-detect available functions.
 # This lets the generator work even if some examen helpers are not implemented.
 import planner.templates as T  # type: ignore
@@ -27,52 +35,91 @@ def _ensure_dir(path: str) -> None:
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
 
-def generate_year_for_format(
-    year: int,
-    page_format: str,
-    base_output_dir: str,
-    cfg: dict,
-) -> None:
-    """Generate an Examen-only planner for the given year and page format.
+def build_month_pdf(year: int, month: int, page_format: str, cfg: dict,
+                    metrics: Optional[MonthMetrics] = None,
+                    context: Optional[RenderContext] = None) -> FPDF:
+    """Render the Examen-only planner for one month.
 
     Behavior adapts to available template functions:
       - If T.create_daily_examen_page exists -> add a daily examen page for each day.
       - If T.create_weekly_examen_page exists -> add a weekly examen page on Mondays.
-      - Always add a monthly examen page at the start and end of each month.
+      - Always add a monthly examen page at the start and end of the month.
+
+    `context` is the render context for `cfg` (built here when omitted).
     """
-    margins = cfg.get("margins", {})
+    m = metrics or MonthMetrics("examen", year, month, page_format)
     locale_code = cfg.get("locale", "en_US")
 
-    outdir = os.path.join(base_output_dir, str(year), page_format)
-    _ensure_dir(outdir)
-
-    for month in range(1, 13):
-        pdf: FPDF = make_pdf(page_format, margins)
-        month_label = month_name(locale_code, month)
+    ctx = context or RenderContext.from_config(cfg)
+    with m.stage("make_pdf"):
+        pdf: FPDF = make_pdf(page_format, ctx.margins, context=ctx)
+    month_label = month_name(locale_code, month)
 
-        # Monthly Examen intro/overview (required)
+    # Monthly Examen intro/overview (required)
+    with m.stage("create_monthly_examen_page"):
         T.create_monthly_examen_page(pdf, month_label, year)
 
-        d = date(year, month, 1)
-        while d.month == month:
-            # Optional daily examen
-            if HAS_DAILY_EXAMEN:
+    d = date(year, month, 1)
+    while d.month == month:
+        # Optional daily examen
+        if HAS_DAILY_EXAMEN:
+            with m.stage("create_daily_examen_page"):
                 T.create_daily_examen_page(pdf, d)
 
-            # Optional weekly examen (Mondays)
-            if HAS_WEEKLY_EXAMEN and d.weekday() == 0:
+        # Optional weekly examen (Mondays)
+        if HAS_WEEKLY_EXAMEN and d.weekday() == 0:
+            with m.stage("create_weekly_examen_page"):
                 T.create_weekly_examen_page(pdf, d)
 
-            d += timedelta(days=1)
+        d += timedelta(days=1)
 
-        # Monthly Examen summary/end (required)
+    # Monthly Examen summary/end (required)
+    with m.stage("create_monthly_examen_page"):
         T.create_monthly_examen_page(pdf, month_label, year)
+    if ctx.lite:
+        with m.stage("operator_budget"):
+            check_operator_budget(pdf, ctx.op_budget, m)
+    m.count("pages", pdf.page)
+    m.count("internal_links", len(pdf.links))
+    return pdf
+
+def _out_path(year: int, month: int, page_format: str, base_output_dir: str, cfg: dict) -> str:
+    outdir = os.path.join(base_output_dir, str(year), page_format)
+    _ensure_dir(outdir)
+    return os.path.join(outdir, month_filename(year, month, page_format, cfg.get("locale", "en_US")))
 
-        out_name = f"{month:02d} - {month_label}_{year}_{page_format}.pdf"
-        out_path = os.path.join(outdir, out_name)
-        try:
-            pdf.output(out_path)
-            logging.info("Saved %s", out_path)
-        except Exception as e:
-            logging.error("Failed to save %s: %s", out_path, e)
-            raise
+def generate_month(
+    year: int,
+    month: int,
+    page_format: str,
+    base_output_dir: str,
+    cfg: dict,
+) -> str:
+    """Generate the Examen-only PDF for a single month and return its path."""
+    out_path = _out_path(year, month, page_format, base_output_dir, cfg)
+    metrics = MonthMetrics("examen", year, month, page_format)
+    save_pdf(build_month_pdf(year, month, page_format, cfg, metrics), out_path, metrics)
+    return out_path
+
+def generate_year_for_format(
+    year: int,
+    page_format: str,
+    base_output_dir: str,
+    cfg: dict,
+    pipeline_depth: int = 0,
+    journal: Optional[JobJournal] = None,
+) -> None:
+    """Generate an Examen-only planner for the given year and page format (one PDF per month).
+
+    With `pipeline_depth` > 0, months are written by a background thread
+    while the next one renders (see planner.generate.writer). Finished
+    months are recorded in `journal`; a resumed run skips the ones it holds.
+    """
+    context = RenderContext.from_config(cfg)
+    with pipelined(pipeline_depth, journal.on_saved if journal else None) as save:
+        for month in range(1, 13):
+            if journal is not None and journal.done("examen", (year, month, page_format)):
+                continue
+            metrics = MonthMetrics("examen", year, month, page_format)
+            pdf = build_month_pdf(year, month, page_format, cfg, metrics, context)
+            save(pdf, _out_path(year, month, page_format, base_output_dir, cfg), metrics)
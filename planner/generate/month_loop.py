@@ -1,4 +1,5 @@
 from __future__ import annotations
+import calendar
 from datetime import date, timedelta
 
 def iter_date_range(start: date, end: date):
@@ -6,3 +7,13 @@ def iter_date_range(start: date, end: date):
     while d <= end:
         yield d
         d += timedelta(days=1)
+
+def month_bounds(year: int, month: int) -> tuple[date, date]:
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+def iter_month_starts(start: date, end: date):
+    """Yield the first day of every month touched by [start, end]."""
+    y, m = start.year, start.month
+    while date(y, m, 1) <= end:
+        yield date(y, m, 1)
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from planner.logging_setup import setup_logging
+
+# (year, month, page_format)
+Unit = Tuple[int, int, str]
+
+@dataclass
+class Task:
+    """One unit of work for the pool: a month of a planner kind, with its own config."""
+    kind: str
+    unit: Unit
+    base_output_dir: str
+    cfg: dict
+    tenant: Optional[str] = None
+
+@dataclass
+class UnitResult:
+    year: int
+    month: int
+    page_format: str
+    path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    tenant: Optional[str] = None
+    kind: Optional[str] = None
+    output_bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def iter_units(years: Sequence[int], formats: Sequence[str]) -> List[Unit]:
+    """Expand years x formats into (year, month, format) units, in sequential CLI order."""
+    return [(y, m, fmt) for y in years for fmt in formats for m in range(1, 13)]
+
+def _generate_month(kind: str):
+    # Imported lazily so worker processes only pay for the generator they run.
+    if kind == "daily":
+        from planner.generate.daily import generate_month
+    elif kind == "examen":
+        from planner.generate.examen import generate_month
+    else:
+        raise ValueError(f"Unknown planner kind '{kind}'")
+    return generate_month
+
+def _run_task(task: Task) -> UnitResult:
+    year, month, page_format = task.unit
+    started = time.perf_counter()
+    labels: Dict[str, Any] = {"tenant": task.tenant, "kind": task.kind}
+    try:
+        path = _generate_month(task.kind)(year, month, page_format, task.base_output_dir, task.cfg)
+        return UnitResult(year, month, page_format, path=path, seconds=time.perf_counter() - started,
+                          output_bytes=os.path.getsize(path), **labels)
+    except Exception as e:  # reported in the summary instead of killing the pool
+        logging.exception("Unit %d-%02d %s failed", year, month, page_format)
+        return UnitResult(year, month, page_format, error=f"{type(e).__name__}: {e}",
+                          seconds=time.perf_counter() - started, **labels)
+
+def _prepare_output_dirs(tasks: Sequence[Task]) -> None:
+    for base, year, page_format in dict.fromkeys((t.base_output_dir, t.unit[0], t.unit[2]) for t in tasks):
+        year_dir = os.path.join(base, str(year), page_format)
+        os.makedirs(year_dir, exist_ok=True)
+        logging.info("Output dir: %s", os.path.abspath(year_dir))
+
+def run_tasks(
+    tasks: Sequence[Task],
+    jobs: int,
+    verbosity: int = 0,
+    json_logs: bool = False,
+    on_result: Optional[Callable[[Task, UnitResult], None]] = None,
+) -> List[UnitResult]:
+    """Render tasks across one pool of `jobs` worker processes.
+
+    Workers live for the whole run, so their warm caches (layout plans, quote
+    indexes, event stores, font metrics) are shared by every task they pick
+    up, whatever config it carries. Results are returned in the order of
+    `tasks`; `on_result` sees each one as soon as it completes (e.g. to
+    journal it) and always runs in the calling process.
+
+    With jobs <= 1 no pool is started: the tasks render in the calling
+    process, one after another, so everything they run - the generators'
+    save hooks, metrics and log output, module-level caches - happens in the
+    parent, under its logging setup (`verbosity`/`json_logs` only configure
+    workers).
+    """
+    _prepare_output_dirs(tasks)
+
+    results: List[Optional[UnitResult]] = [None] * len(tasks)
+    if jobs <= 1:
+        for i, task in enumerate(tasks):
+            result = results[i] = _run_task(task)
+            if on_result is not None:
+                on_result(task, result)
+        return [r for r in results if r is not None]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=setup_logging,
+                             initargs=(verbosity, json_logs)) as pool:
+        futures = {pool.submit(_run_task, task): i for i, task in enumerate(tasks)}
+        for fut in as_completed(futures):
+            i = futures[fut]
+            result = results[i] = fut.result()
+            if on_result is not None:
+                on_result(tasks[i], result)
+    return [r for r in results if r is not None]
+
+def run_units(
+    kind: str,
+    units: Sequence[Unit],
+    base_output_dir: str,
+    cfg: dict,
+    jobs: int,
+    verbosity: int = 0,
+    json_logs: bool = False,
+    on_result: Optional[Callable[[Task, UnitResult], None]] = None,
+) -> List[UnitResult]:
+    """Render (year, month, format) units across a pool of `jobs` worker processes.
+
+    With jobs <= 1 the units run in the calling process, one after another,
+    and everything they run (save hooks, metrics, logging) happens there;
+    see `run_tasks`. Results are returned in the order of `units`,
+    regardless of completion order.
+    """
+    tasks = [Task(kind, unit, base_output_dir, cfg) for unit in units]
+    return run_tasks(tasks, jobs, verbosity, json_logs, on_result)
+
+def log_summary(results: Sequence[UnitResult]) -> int:
+    """Log one line per unit plus a total; return the number of failed units."""
+    failed = 0
+    for r in results:
+        label = f"{r.year}-{r.month:02d} {r.page_format}"
+        if r.tenant:
+            label = f"[{r.tenant}] {label}"
+        if r.ok:
+            logging.info("OK     %s (%.2fs) -> %s", label, r.seconds, r.path)
+        else:
+            failed += 1
+            logging.error("FAILED %s (%.2fs): %s", label, r.seconds, r.error)
+    logging.info("%d/%d units succeeded.", len(results) - failed, len(results))
+    return failed
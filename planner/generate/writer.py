@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple, cast
+
+from fpdf import FPDF
+
+from planner.metrics import MonthMetrics, emit
+
+# Writing a month (serialization, compression, disk) used to block the loop
+# before the next month could start rendering. With a pipeline depth > 0 the
+# finished document goes to a background thread instead; the queue bound
+# caps how many rendered months wait in memory. zlib and file writes release
+# the GIL, so writing overlaps with rendering even on one interpreter.
+
+SaveFn = Callable[[FPDF, str, Optional[MonthMetrics]], None]
+# Called with (out_path, metrics) once a document is in place (e.g. JobJournal.on_saved).
+SavedHook = Callable[[str, Optional[MonthMetrics]], None]
+
+def save_pdf(pdf: FPDF, out_path: str, metrics: Optional[MonthMetrics] = None) -> None:
+    """Write `pdf` to `out_path` via a `.part` file renamed once complete, then emit `metrics`."""
+    tmp = out_path + ".part"
+    try:
+        if metrics is not None:
+            with metrics.stage("pdf_output"):
+                pdf.output(tmp)
+        else:
+            pdf.output(tmp)
+        os.replace(tmp, out_path)
+    except BaseException as e:
+        logging.error("Failed to save %s: %s", out_path, e)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    logging.info("Saved %s", out_path)
+    if metrics is not None:
+        metrics.count("output_bytes", os.path.getsize(out_path))
+        metrics.emit()
+
+_STOP = object()
+_Job = Tuple[FPDF, str, Optional[MonthMetrics]]
+
+class BackgroundWriter:
+    """Saves finished documents on a worker thread while the caller renders the next one.
+
+    At most `depth` documents wait in the queue (plus the one being written);
+    `submit` blocks when it is full. The first failed write is re-raised by
+    the next `submit` or by `close`; later documents are then dropped.
+    `on_saved` runs on the writer thread after each successful write.
+    """
+
+    def __init__(self, depth: int = 2, on_saved: Optional[SavedHook] = None):
+        if depth < 1:
+            raise ValueError("pipeline depth must be >= 1")
+        self.depth = depth
+        self.on_saved = on_saved
+        self.written: List[str] = []
+        self.wait_seconds = 0.0
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="planner-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            pdf, out_path, metrics = cast(_Job, item)
+            del item
+            if self._error is None:
+                try:
+                    save_pdf(pdf, out_path, metrics)
+                    self.written.append(out_path)
+                    if self.on_saved is not None:
+                        self.on_saved(out_path, metrics)
+                except BaseException as e:
+                    self._error = e
+            del pdf  # release the document before waiting for the next one
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, pdf: FPDF, out_path: str, metrics: Optional[MonthMetrics] = None) -> None:
+        self._raise_pending()
+        started = time.perf_counter()
+        self._queue.put((pdf, out_path, metrics))
+        self.wait_seconds += time.perf_counter() - started
+
+    def close(self, raise_errors: bool = True) -> None:
+        """Wait for every queued document to be written."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+            emit("writer", depth=self.depth, written=len(self.written),
+                 wait_seconds=round(self.wait_seconds, 6))
+        if raise_errors:
+            self._raise_pending()
+
+@contextmanager
+def pipelined(depth: int, on_saved: Optional[SavedHook] = None) -> Iterator[SaveFn]:
+    """A save function: `save_pdf` for depth <= 0, else a `BackgroundWriter` of that depth.
+
+    `on_saved` is called after each document is written. Leaving the block
+    waits for pending writes; an error raised inside the block takes
+    precedence over a failed write.
+    """
+    if depth <= 0:
+        def save(pdf: FPDF, out_path: str, metrics: Optional[MonthMetrics] = None) -> None:
+            save_pdf(pdf, out_path, metrics)
+            if on_saved is not None:
+                on_saved(out_path, metrics)
+        yield save
+        return
+    writer = BackgroundWriter(depth, on_saved)
+    try:
+        yield writer.submit
+    except BaseException:
+        writer.close(raise_errors=False)
+        raise
+    writer.close()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from planner.generate.parallel import Task, Unit, UnitResult
+from planner.metrics import MonthMetrics
+
+JOURNAL_FILENAME = ".planner-journal.jsonl"
+
+# A run records every month it finishes in `<outdir>/.planner-journal.jsonl`,
+# one JSON line per unit, flushed and fsynced as soon as the PDF is in
+# place. A run killed halfway leaves at worst a truncated last line, which
+# is ignored. `--resume` skips the units whose recorded output is still on
+# disk with the same checksum and was rendered from the same config, code
+# and data files; everything else is rendered again.
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _inputs_digest(cfg: dict) -> str:
+    # Config, code, planner/data.py and the files it reads (fonts, event
+    # sources, quotes) by size and mtime: any change renders every unit again.
+    from planner.build_cache import _digest, code_fingerprint, data_fingerprint, source_signature
+
+    return _digest([_digest(cfg), code_fingerprint(), data_fingerprint(), source_signature(cfg)])
+
+class JobJournal:
+    """Finished units of the runs writing into one output directory."""
+
+    def __init__(self, base_output_dir: str, cfg: dict, resume: bool = False):
+        self.base_output_dir = base_output_dir
+        self.resume = resume
+        self.inputs = _inputs_digest(cfg)
+        self.entries: Dict[str, dict] = {}
+        self._verified: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.base_output_dir, JOURNAL_FILENAME)
+
+    @staticmethod
+    def _entry_key(kind: str, unit: Unit) -> str:
+        year, month, page_format = unit
+        return f"{kind}/{year}/{page_format}/{month:02d}"
+
+    def _load(self) -> None:
+        lines = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for lines, line in enumerate(f, start=1):
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        logging.warning("Ignoring unreadable line %d of job journal '%s'.", lines, self.path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logging.warning("Ignoring unreadable job journal '%s': %s", self.path, e)
+            return
+        if lines > 2 * len(self.entries) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Reruns append a new line per unit; keep only the latest of each.
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
+        os.replace(tmp, self.path)
+
+    def check(self, kind: str, unit: Unit) -> Optional[str]:
+        """Why `unit` must be rendered, or None if its recorded output is intact."""
+        key = self._entry_key(kind, unit)
+        if key in self._verified:
+            return self._verified[key]
+        entry = self.entries.get(key)
+        reason = None
+        if entry is None:
+            reason = "not finished"
+        elif entry.get("inputs") != self.inputs:
+            reason = "inputs changed"
+        else:
+            path = os.path.join(self.base_output_dir, entry["path"])
+            if not os.path.exists(path):
+                reason = "output missing"
+            elif os.path.getsize(path) != entry.get("bytes") or _sha256(path) != entry.get("sha256"):
+                reason = "checksum mismatch"
+        self._verified[key] = reason
+        return reason
+
+    def done(self, kind: str, unit: Unit) -> bool:
+        """True when resuming and `unit` was finished by an earlier run (see `check`)."""
+        if not self.resume:
+            return False
+        reason = self.check(kind, unit)
+        year, month, page_format = unit
+        if reason is None:
+            logging.info("Resume: skipping %s %d-%02d %s (verified)", kind, year, month, page_format)
+        else:
+            logging.debug("Resume: rendering %s %d-%02d %s (%s)", kind, year, month, page_format, reason)
+        return reason is None
+
+    def pending(self, kind: str, units: Sequence[Unit]) -> List[Unit]:
+        """`units` minus the ones `done` skips, with a summary line when resuming."""
+        todo = [u for u in units if not self.done(kind, u)]
+        if self.resume:
+            logging.info("Resume: %d of %d units already done in %s.",
+                         len(units) - len(todo), len(units), self.base_output_dir)
+        return todo
+
+    def record(self, kind: str, unit: Unit, path: str) -> None:
+        """Append a finished unit; durable once this returns."""
+        key = self._entry_key(kind, unit)
+        entry = {
+            "key": key,
+            "path": os.path.relpath(path, self.base_output_dir),
+            "bytes": os.path.getsize(path),
+            "sha256": _sha256(path),
+            "inputs": self.inputs,
+        }
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            os.makedirs(self.base_output_dir, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = entry
+            self._verified[key] = None
+
+    def record_result(self, task: Task, result: UnitResult) -> None:
+        """`run_tasks` hook: record the task if it succeeded."""
+        if result.ok and result.path:
+            self.record(task.kind, task.unit, result.path)
+
+    def on_saved(self, out_path: str, metrics: Optional[MonthMetrics]) -> None:
+        """Save hook for the generators' writers: record the month `metrics` describes."""
+        if metrics is None:
+            return
+        labels = metrics.labels
+        self.record(labels["kind"], (labels["year"], labels["month"], labels["format"]), out_path)
+
+def open_journals(tasks: Sequence[Task], resume: bool = False) -> Dict[str, JobJournal]:
+    """One journal per output directory of `tasks` (a directory holds one tenant's config)."""
+    journals: Dict[str, JobJournal] = {}
+    for t in tasks:
+        if t.base_output_dir not in journals:
+            journals[t.base_output_dir] = JobJournal(t.base_output_dir, t.cfg, resume)
+    return journals
+
+def pending_tasks(tasks: Sequence[Task], journals: Dict[str, JobJournal]) -> List[Task]:
+    """`tasks` minus the ones their directory's journal `done` skips."""
+    todo = [t for t in tasks if not journals[t.base_output_dir].done(t.kind, t.unit)]
+    if any(j.resume for j in journals.values()):
+        logging.info("Resume: %d of %d units already done.", len(tasks) - len(todo), len(tasks))
+    return todo
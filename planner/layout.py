@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from fpdf import FPDF
+
+# Layout plans: every geometry value the templates derive from the page size,
+# margins and configured fonts, computed once per (format, margins, fonts)
+# and shared by all pages of that shape. Values that depend on how far the
+# text flow has advanced (e.g. the journal line count) are exposed as small
+# methods on the plan instead.
+
+Font = Tuple[str, str, int]
+
+def _pick(is_a5: bool, a5, other):
+    return a5 if is_a5 else other
+
+@dataclass(frozen=True)
+class MonthlyOverviewPlan:
+    page_width: float
+    is_a5: bool
+    cal_cell_w: float
+    cal_cell_h: float
+    cal_x_start: float
+    section_line_height: float
+    section_text_font_size: int
+    section_prompt_h: float
+    section_padding_after_lines: float
+    birthday_font_size: int
+    birthday_line_h: float
+    birthday_cols: int
+    birthday_rows_per_col: int
+    birthday_col_width: float
+    birthday_col_x: Tuple[float, ...]
+    max_ideas_lines: int
+    content_bottom: float
+
+    def ideas_lines(self, y: float) -> int:
+        remaining = self.content_bottom - y - self.section_line_height
+        if remaining <= 0:
+            return 0
+        return min(max(1, int(remaining / self.section_line_height)), self.max_ideas_lines)
+
+@dataclass(frozen=True)
+class DailyPagePlan:
+    page_width: float
+    is_a5: bool
+    num_task_lines: int
+    task_line_h: float
+    marker_width: float
+    tasks_title_h: float
+    tasks_padding_after: float
+    journal_title_h: float
+    journal_line_h: float
+    content_bottom: float
+
+    def journal_lines(self, y: float) -> int:
+        remaining = self.content_bottom - y - (self.journal_line_h * 0.3)
+        if not self.is_a5:
+            return max(0, int(remaining // self.journal_line_h))
+        return max(0, int(remaining / self.journal_line_h)) if remaining > 0 else 0
+
+@dataclass(frozen=True)
+class WeeklyOverviewPlan:
+    page_width: float
+    is_a5: bool
+    title_gap: float
+    line_height: float
+    prompt_h: float
+    section_spacing: float
+    inter_title_spacing: float
+    lines_top_3: int
+    lines_appointments: int
+    lines_skills: int
+    lines_gratitude: int
+    lines_accomplishments: int
+    lines_challenges: int
+    tracker_intro_gap: float
+    habit_label_width: float
+    day_cell_w: float
+    tracker_x_start: float
+    table_cell_h: float
+    habit_box_dx: float
+    habit_box_dy: float
+    tracker_gap_after: float
+    divider_offset: float
+
+@dataclass(frozen=True)
+class ReflectionPlan:
+    page_width: float
+    is_a5: bool
+    title_font: Font
+    step_font: Font
+    prompt_font: Font
+    title_h: float
+    title_gap: float
+    section_line_height: float
+    first_line_height: float
+    prompt_cell_h: float
+    step_title_h: float
+    notes_lines: int
+    tally_indent: float
+    tally_boxes: int
+    tally_box_size: float
+    divider_offset: float
+    prompt_group_gap: float
+
+@dataclass(frozen=True)
+class WeeklyExamenPlan:
+    page_width: float
+    is_a5: bool
+    header_gap: float
+    line_h: float
+    space_after_prompt: float
+    step_gap: float
+    step_title_h: float
+    prompt_h: float
+    step_lines: Tuple[int, ...]
+    step_font: Font
+    prompt_font: Font
+
+@dataclass(frozen=True)
+class MonthlyExamenPlan:
+    page_width: float
+    line_h: float
+    space_after_prompt: float
+    step_gap: float
+    step_title_h: float
+    prompt_h: float
+    lines_per_step: int
+
+@dataclass(frozen=True)
+class LayoutPlan:
+    w: float
+    h: float
+    margins: Tuple[float, float, float, float]  # left, top, right, bottom
+    monthly: MonthlyOverviewPlan
+    daily: DailyPagePlan
+    weekly: WeeklyOverviewPlan
+    reflection: ReflectionPlan
+    weekly_examen: WeeklyExamenPlan
+    monthly_examen: MonthlyExamenPlan
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@lru_cache(maxsize=64)
+def build_plan(w: float, h: float, l_margin: float, t_margin: float, r_margin: float,
+               b_margin: float, step_font: Font, prompt_font: Font, title_font: Font) -> LayoutPlan:
+    """Compute the layout plan for one page shape (memoized)."""
+    is_a5 = w < 160
+    page_width = w - l_margin - r_margin
+    bottom = h - b_margin
+
+    cal_cell_w = min(page_width / (7 + 2), 12)
+    birthday_cols, col_spacing = 3, 2
+    col_width = (page_width - (birthday_cols - 1) * col_spacing) / birthday_cols
+    monthly = MonthlyOverviewPlan(
+        page_width=page_width,
+        is_a5=is_a5,
+        cal_cell_w=cal_cell_w,
+        cal_cell_h=5.5,
+        cal_x_start=l_margin + (page_width - 7 * cal_cell_w) / 2,
+        section_line_height=_pick(is_a5, 5.0, 6.0),
+        section_text_font_size=_pick(is_a5, 7, 8),
+        section_prompt_h=6,
+        section_padding_after_lines=_pick(is_a5, 3, 4),
+        birthday_font_size=_pick(is_a5, 6, 7),
+        birthday_line_h=_pick(is_a5, 3.8, 4.2),
+        birthday_cols=birthday_cols,
+        birthday_rows_per_col=5,
+        birthday_col_width=col_width,
+        birthday_col_x=tuple(l_margin + i * (col_width + col_spacing) for i in range(birthday_cols)),
+        max_ideas_lines=_pick(is_a5, 3, 4),
+        content_bottom=bottom,
+    )
+
+    daily = DailyPagePlan(
+        page_width=page_width,
+        is_a5=is_a5,
+        num_task_lines=10,
+        task_line_h=6.5,
+        marker_width=5,
+        tasks_title_h=8,
+        tasks_padding_after=2,
+        journal_title_h=8,
+        journal_line_h=7,
+        content_bottom=bottom,
+    )
+
+    habit_label_width = _pick(is_a5, 35, 40)
+    day_cell_w = max(6, (page_width * 0.7 - habit_label_width) / 7)
+    table_cell_h = _pick(is_a5, 3.5, 4.0)
+    weekly = WeeklyOverviewPlan(
+        page_width=page_width,
+        is_a5=is_a5,
+        title_gap=_pick(is_a5, 1, 2),
+        line_height=_pick(is_a5, 5.0, 6.0),
+        prompt_h=_pick(is_a5, 4.0, 5.0),
+        section_spacing=_pick(is_a5, 1.0, 2.0),
+        inter_title_spacing=_pick(is_a5, 0.5, 1.0),
+        lines_top_3=3,
+        lines_appointments=_pick(is_a5, 3, 5),
+        lines_skills=_pick(is_a5, 2, 3),
+        lines_gratitude=2,
+        lines_accomplishments=_pick(is_a5, 3, 5),
+        lines_challenges=_pick(is_a5, 2, 3),
+        tracker_intro_gap=_pick(is_a5, 0.5, 1),
+        habit_label_width=habit_label_width,
+        day_cell_w=day_cell_w,
+        tracker_x_start=l_margin + (page_width - (habit_label_width + 7 * day_cell_w)) / 2,
+        table_cell_h=table_cell_h,
+        habit_box_dx=(day_cell_w - 3) / 2,
+        habit_box_dy=(table_cell_h - 3) / 2,
+        tracker_gap_after=_pick(is_a5, 1.0 + 0.5, 2.0 + 1.0),
+        divider_offset=_pick(is_a5, 0, 0.5),
+    )
+
+    prompt_cell_h = _pick(is_a5, 4.0, 4.5)
+    section_line_height = _pick(is_a5, 5.0, 6.0)
+    reflection = ReflectionPlan(
+        page_width=page_width,
+        is_a5=is_a5,
+        title_font=(title_font[0], title_font[1], _pick(is_a5, 12, 14)),
+        step_font=(step_font[0], step_font[1], max(8, step_font[2] - 1)),
+        prompt_font=(prompt_font[0], prompt_font[1], max(7, prompt_font[2] - 1)),
+        title_h=_pick(is_a5, 6, 8),
+        title_gap=_pick(is_a5, 2, 3),
+        section_line_height=section_line_height,
+        first_line_height=section_line_height + _pick(is_a5, 0, 0.5),
+        prompt_cell_h=prompt_cell_h,
+        step_title_h=prompt_cell_h + _pick(is_a5, 1, 1.5),
+        notes_lines=_pick(is_a5, 3, 2),
+        tally_indent=_pick(is_a5, 6, 8),
+        tally_boxes=_pick(is_a5, 10, 12),
+        tally_box_size=_pick(is_a5, 2.5, 3),
+        divider_offset=_pick(is_a5, 1.0, 1.5),
+        prompt_group_gap=_pick(is_a5, 0.2, 0.5),
+    )
+
+    weekly_examen = WeeklyExamenPlan(
+        page_width=page_width,
+        is_a5=is_a5,
+        header_gap=_pick(is_a5, 4, 7),
+        line_h=_pick(is_a5, 5.5, 7.0),
+        space_after_prompt=_pick(is_a5, 1.0, 1.5),
+        step_gap=_pick(is_a5, 1.0, 2.0),
+        step_title_h=_pick(is_a5, 5, 6),
+        prompt_h=_pick(is_a5, 4, 5),
+        step_lines=_pick(is_a5, (2, 2, 3, 2, 2), (4, 3, 7, 4, 4)),
+        step_font=(step_font[0], step_font[1], _pick(is_a5, 11, step_font[2])),
+        prompt_font=(prompt_font[0], prompt_font[1], _pick(is_a5, 9, prompt_font[2])),
+    )
+
+    monthly_examen = MonthlyExamenPlan(
+        page_width=page_width,
+        line_h=6.5,
+        space_after_prompt=1.0,
+        step_gap=1.5,
+        step_title_h=5,
+        prompt_h=4.5,
+        lines_per_step=3,
+    )
+
+    return LayoutPlan(
+        w=w, h=h, margins=(l_margin, t_margin, r_margin, b_margin),
+        monthly=monthly, daily=daily, weekly=weekly, reflection=reflection,
+        weekly_examen=weekly_examen, monthly_examen=monthly_examen,
+    )
+
+def layout_for(pdf: FPDF) -> LayoutPlan:
+    """The (memoized) layout plan for the document's page shape and its context's fonts."""
+    from planner.context import context_of
+
+    ctx = context_of(pdf)
+    return build_plan(pdf.w, pdf.h, pdf.l_margin, pdf.t_margin, pdf.r_margin, pdf.b_margin,
+                      ctx.font_examen_step_title, ctx.font_examen_prompt, ctx.font_title)
+
+def layout_for_format(page_format: str, margins: Dict[str, Any], cfg: Optional[Dict[str, Any]] = None) -> LayoutPlan:
+    """Layout plan for a page format and margins config, without rendering anything."""
+    from planner.context import RenderContext
+    from planner.rendering.pdf_factory import make_pdf
+
+    context = RenderContext.from_config(cfg) if cfg is not None else None
+    return layout_for(make_pdf(page_format, margins, context=context))
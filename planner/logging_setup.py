@@ -1,6 +1,7 @@
 import json
 import logging
 import sys
+from typing import Optional, TextIO
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
@@ -9,18 +10,22 @@ class JsonFormatter(logging.Formatter):
             "msg": record.getMessage(),
             "logger": record.name,
         }
+        metrics = getattr(record, "metrics", None)
+        if metrics is not None:
+            payload["metrics"] = metrics
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
         return json.dumps(payload, ensure_ascii=False)
 
-def setup_logging(verbosity: int = 0, json_logs: bool = False) -> None:
+def setup_logging(verbosity: int = 0, json_logs: bool = False, stream: Optional[TextIO] = None) -> None:
     level = logging.WARNING
     if verbosity == 1:
         level = logging.INFO
     elif verbosity >= 2:
         level = logging.DEBUG
 
-    handler = logging.StreamHandler(stream=sys.stdout)
+    # Defaults to stdout; pass sys.stderr when stdout carries data (e.g. `--archive -`).
+    handler = logging.StreamHandler(stream=stream or sys.stdout)
     if json_logs:
         handler.setFormatter(JsonFormatter())
     else:
@@ -30,3 +35,6 @@ def setup_logging(verbosity: int = 0, json_logs: bool = False) -> None:
     root.handlers.clear()
     root.setLevel(level)
     root.addHandler(handler)
+
+    # In JSON mode the per-stage metrics records are always emitted for log pipelines.
+    logging.getLogger("planner.metrics").setLevel(logging.INFO if json_logs else logging.NOTSET)
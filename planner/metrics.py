@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# Metrics go through their own logger so --json can always let them through.
+logger = logging.getLogger("planner.metrics")
+
+def emit(event: str, **fields: Any) -> None:
+    """Log one machine-readable metrics record (see JsonFormatter)."""
+    payload = {"event": event, **fields}
+    summary = " ".join(f"{k}={v}" for k, v in fields.items() if not isinstance(v, dict))
+    logger.info("%s %s", event, summary, extra={"metrics": payload})
+
+@contextmanager
+def timed(event: str, **fields: Any) -> Iterator[None]:
+    """Emit a single-stage record with its duration once the block finishes."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit(event, seconds=round(time.perf_counter() - started, 6), **fields)
+
+class MonthMetrics:
+    """Per-month stage durations and counters, emitted as one record."""
+
+    def __init__(self, kind: str, year: int, month: int, page_format: str):
+        self.labels: Dict[str, Any] = {"kind": kind, "year": year, "month": month, "format": page_format}
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.counters: Dict[str, Any] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - started
+            self.calls[name] += 1
+
+    def count(self, name: str, value: Any) -> None:
+        self.counters[name] = value
+
+    def emit(self) -> None:
+        emit(
+            "month",
+            **self.labels,
+            stages={k: {"seconds": round(v, 6), "calls": self.calls[k]} for k, v in self.seconds.items()},
+            **self.counters,
+        )
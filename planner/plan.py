@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from planner.generate.month_loop import iter_date_range, month_bounds
+from planner.generate.parallel import Unit, iter_units
+from planner.metrics import MonthMetrics
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+# `planner plan` lays out the template calls of a run without rendering
+# anything and prices each call with a per-template cost: the pages it adds
+# (a template overflowing its page adds two), render seconds including its
+# share of writing the file, and compressed content bytes. Each monthly
+# document adds a fixed overhead for the document setup, fonts, shared
+# forms, links and the PDF structure. The built-in costs were measured with
+# the project config.yaml on a reference machine; `--calibrate` measures
+# them for the run's own config and hardware.
+
+Costs = Dict[str, Any]
+
+DEFAULT_COSTS: Costs = {
+    "startup_seconds": 0.48,
+    "formats": {
+        "A4": {
+            "templates": {
+                "create_daily_page": {"pages": 1.0, "seconds": 0.00387, "bytes": 284},
+                "create_daily_reflection_page": {"pages": 1.0, "seconds": 0.003, "bytes": 568},
+                "create_monthly_examen_page": {"pages": 1.0, "seconds": 0.00308, "bytes": 571},
+                "create_monthly_overview": {"pages": 1.0, "seconds": 0.01122, "bytes": 627},
+                "create_weekly_examen_page": {"pages": 1.0, "seconds": 0.00371, "bytes": 907},
+                "create_weekly_overview": {"pages": 1.0, "seconds": 0.0097, "bytes": 1172},
+            },
+            "documents": {
+                "daily": {"seconds": 0.00964, "bytes": 37029},
+                "examen": {"seconds": 0.00136, "bytes": 3678},
+            },
+        },
+        "A5": {
+            "templates": {
+                "create_daily_page": {"pages": 1.0, "seconds": 0.00408, "bytes": 287},
+                "create_daily_reflection_page": {"pages": 1.0, "seconds": 0.00312, "bytes": 577},
+                "create_monthly_examen_page": {"pages": 1.0, "seconds": 0.00338, "bytes": 604},
+                "create_monthly_overview": {"pages": 1.0, "seconds": 0.01437, "bytes": 618},
+                "create_weekly_examen_page": {"pages": 1.0, "seconds": 0.0046, "bytes": 923},
+                "create_weekly_overview": {"pages": 1.0, "seconds": 0.00971, "bytes": 1163},
+            },
+            "documents": {
+                "daily": {"seconds": 0.01197, "bytes": 38446},
+                "examen": {"seconds": 0.00134, "bytes": 3597},
+            },
+        },
+        "Letter": {
+            "templates": {
+                "create_daily_page": {"pages": 1.0, "seconds": 0.00409, "bytes": 283},
+                "create_daily_reflection_page": {"pages": 1.0, "seconds": 0.00303, "bytes": 568},
+                "create_monthly_examen_page": {"pages": 1.0, "seconds": 0.003, "bytes": 573},
+                "create_monthly_overview": {"pages": 1.0, "seconds": 0.01003, "bytes": 626},
+                "create_weekly_examen_page": {"pages": 2.0, "seconds": 0.00459, "bytes": 996},
+                "create_weekly_overview": {"pages": 1.0, "seconds": 0.01075, "bytes": 1158},
+            },
+            "documents": {
+                "daily": {"seconds": 0.01126, "bytes": 36901},
+                "examen": {"seconds": 0.00162, "bytes": 4920},
+            },
+        },
+    },
+}
+
+_FALLBACK_FORMAT = "A4"
+_STARTUP_PROBE = "import planner.generate.daily, planner.generate.examen"
+KINDS = ("daily", "examen")
+_warned: Set[str] = set()
+
+def month_templates(kind: str, year: int, month: int) -> List[str]:
+    """Template calls of a monthly document, in the order its generator makes them."""
+    first_day, last_day = month_bounds(year, month)
+    if kind == "daily":
+        calls = ["create_monthly_overview"]
+        for d in iter_date_range(first_day, last_day):
+            calls.append("create_daily_page")
+            if d.weekday() == 0:
+                calls.append("create_weekly_overview")
+            calls.append("create_daily_reflection_page")
+        calls.append("create_monthly_examen_page")
+        return calls
+    if kind == "examen":
+        # Same soft capabilities as the generator: optional pages follow the templates module.
+        from planner.generate.examen import HAS_DAILY_EXAMEN, HAS_WEEKLY_EXAMEN
+
+        calls = ["create_monthly_examen_page"]
+        for d in iter_date_range(first_day, last_day):
+            if HAS_DAILY_EXAMEN:
+                calls.append("create_daily_examen_page")
+            if HAS_WEEKLY_EXAMEN and d.weekday() == 0:
+                calls.append("create_weekly_examen_page")
+        calls.append("create_monthly_examen_page")
+        return calls
+    raise ValueError(f"Unknown planner kind '{kind}'")
+
+@dataclass
+class MonthPlan:
+    """Estimated pages, output size and render time of one monthly document."""
+    kind: str
+    unit: Unit
+    pages: Dict[str, int] = field(default_factory=dict)  # per template
+    bytes: float = 0.0
+    seconds: float = 0.0
+
+    @property
+    def page_count(self) -> int:
+        return sum(self.pages.values())
+
+def measure_startup(runs: int = 3) -> float:
+    """Seconds for a fresh interpreter to import the generators, as each worker process does."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _STARTUP_PROBE], cwd=root, check=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+def _format_costs(costs: Costs, page_format: str) -> Dict[str, Any]:
+    for source in (costs, DEFAULT_COSTS):
+        table = source.get("formats", {}).get(page_format)
+        if table is not None:
+            if source is not costs and page_format not in _warned:
+                _warned.add(page_format)
+                logging.warning("No calibrated costs for format %s; using the built-in ones.", page_format)
+            return table
+    if page_format not in _warned:
+        _warned.add(page_format)
+        logging.warning("No costs for format %s; using the %s costs.", page_format, _FALLBACK_FORMAT)
+    return costs.get("formats", {}).get(_FALLBACK_FORMAT) or DEFAULT_COSTS["formats"][_FALLBACK_FORMAT]
+
+def _call_cost(table: Dict[str, Any], template: str) -> Dict[str, float]:
+    templates = table["templates"]
+    if template in templates:
+        return templates[template]
+    if template not in _warned:
+        _warned.add(template)
+        logging.warning("No calibrated cost for %s; using the mean template cost.", template)
+    return {key: sum(c[key] for c in templates.values()) / len(templates)
+            for key in ("pages", "seconds", "bytes")}
+
+def estimate_month(kind: str, unit: Unit, costs: Costs) -> MonthPlan:
+    year, month, page_format = unit
+    table = _format_costs(costs, page_format)
+    document = table["documents"][kind]
+    plan = MonthPlan(kind, unit, bytes=document["bytes"], seconds=document["seconds"])
+    for template, calls in Counter(month_templates(kind, year, month)).items():
+        cost = _call_cost(table, template)
+        plan.pages[template] = round(calls * cost.get("pages", 1.0))
+        plan.bytes += calls * cost["bytes"]
+        plan.seconds += calls * cost["seconds"]
+    return plan
+
+def plan_run(kinds: Sequence[str], years: Sequence[int], formats: Sequence[str],
+             costs: Optional[Costs] = None) -> List[MonthPlan]:
+    """Estimate every monthly document of a run, in the CLI's generation order."""
+    costs = costs or DEFAULT_COSTS
+    return [estimate_month(kind, unit, costs) for kind in kinds for unit in iter_units(years, formats)]
+
+def _workers(plans: Sequence[MonthPlan], jobs: int) -> int:
+    return max(min(jobs, len(plans)), 1)
+
+def wall_seconds(plans: Sequence[MonthPlan], jobs: int, startup: float = 0.0) -> float:
+    """Makespan of the months over `jobs` workers, longest months first (as a pool drains them)."""
+    workers = [startup] * _workers(plans, jobs)
+    for seconds in sorted((p.seconds for p in plans), reverse=True):
+        heapq.heapreplace(workers, workers[0] + seconds)
+    return max(workers)
+
+def summarize(plans: Sequence[MonthPlan], jobs: int = 1, costs: Optional[Costs] = None) -> Dict[str, Any]:
+    """Totals per (kind, year, format) and for the whole run, each worker paying the startup cost once."""
+    startup: float = {**DEFAULT_COSTS, **(costs or {})}["startup_seconds"]
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for p in plans:
+        year, _, page_format = p.unit
+        g = groups.setdefault((p.kind, year, page_format), {
+            "kind": p.kind, "year": year, "format": page_format,
+            "documents": 0, "pages": 0, "bytes": 0.0, "seconds": 0.0})
+        g["documents"] += 1
+        g["pages"] += p.page_count
+        g["bytes"] += p.bytes
+        g["seconds"] += p.seconds
+    templates: Counter = Counter()
+    for p in plans:
+        templates.update(p.pages)
+    return {
+        "groups": list(groups.values()),
+        "templates": dict(templates),
+        "total": {
+            "documents": len(plans),
+            "pages": sum(p.page_count for p in plans),
+            "bytes": sum(p.bytes for p in plans),
+            "cpu_seconds": sum(p.seconds for p in plans) + startup * _workers(plans, jobs),
+            "jobs": jobs,
+            "workers": _workers(plans, jobs),
+            "startup_seconds": startup,
+            "wall_seconds": wall_seconds(plans, jobs, startup),
+            "largest_document_bytes": max((p.bytes for p in plans), default=0.0),
+        },
+    }
+
+def format_plan(summary: Dict[str, Any]) -> str:
+    header = f"{'kind':<8} {'year':>5} {'fmt':<7} {'months':>6} {'pages':>7} {'MiB':>8} {'seconds':>9}"
+    lines = [header, "-" * len(header)]
+    for g in summary["groups"]:
+        lines.append(f"{g['kind']:<8} {g['year']:>5} {g['format']:<7} {g['documents']:>6} {g['pages']:>7} "
+                     f"{g['bytes'] / 2**20:>8.1f} {g['seconds']:>9.1f}")
+    t = summary["total"]
+    lines.append(f"{'worker startup':<22} {t['workers']:>6} {'':>7} {'':>8} "
+                 f"{t['workers'] * t['startup_seconds']:>9.1f}")
+    lines.append("-" * len(header))
+    lines.append(f"{'total':<22} {t['documents']:>6} {t['pages']:>7} {t['bytes'] / 2**20:>8.1f} "
+                 f"{t['cpu_seconds']:>9.1f}")
+    lines.append("Pages by template: " + ", ".join(
+        f"{name} {count}" for name, count in sorted(summary["templates"].items(), key=lambda kv: -kv[1])))
+    lines.append(f"Estimated wall time with {t['jobs']} worker(s): {t['wall_seconds']:.1f}s "
+                 f"(largest document {t['largest_document_bytes'] / 2**20:.1f} MiB)")
+    return "\n".join(lines)
+
+class _PageMetrics(MonthMetrics):
+    """Month metrics that also note the stage adding each page."""
+
+    def __init__(self, *args: Any):
+        super().__init__(*args)
+        self.current: Optional[str] = None
+        self.page_stages: List[Optional[str]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.current = name
+        try:
+            with super().stage(name):
+                yield
+        finally:
+            self.current = None
+
+@contextmanager
+def _attributing_pages(m: _PageMetrics) -> Iterator[None]:
+    """Record the current stage of `m` for every page fpdf adds, automatic page breaks included."""
+    from fpdf import FPDF
+
+    original = FPDF.add_page
+
+    def add_page(self, *args, **kwargs):
+        m.page_stages.append(m.current)
+        return original(self, *args, **kwargs)
+
+    FPDF.add_page = add_page  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        FPDF.add_page = original  # type: ignore[method-assign]
+
+def _calibrate_month(kind: str, year: int, month: int, page_format: str, cfg: dict, context,
+                     totals: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """Render one sample month, add its per-template costs to `totals`, return its document overhead."""
+    from planner.rendering.state import page_stream
+    from planner.rendering.text import clear_layout_cache
+
+    if kind == "daily":
+        from planner.generate.daily import build_month_pdf as build_daily
+
+        def build(mo: int, m: MonthMetrics) -> FPDF:
+            return build_daily(year, mo, page_format, cfg, metrics=m, context=context)
+    else:
+        from planner.generate.examen import build_month_pdf as build_examen
+
+        def build(mo: int, m: MonthMetrics) -> FPDF:
+            return build_examen(year, mo, page_format, cfg, m, context)
+
+    # Warm up fonts, forms and day tables on another month: rendering the sample
+    # twice would find all of its quotes in the line break cache, unlike a real run.
+    clear_layout_cache()
+    other = month % 12 + 1
+    build(other, MonthMetrics(kind, year, other, page_format))
+    m = _PageMetrics(kind, year, month, page_format)
+    with _attributing_pages(m):
+        pdf = build(month, m)
+    # fpdf compresses each page's content stream with zlib when writing the file.
+    page_bytes = [len(zlib.compress(page_stream(pdf, n))) for n in range(1, pdf.page + 1)]
+    started = time.perf_counter()
+    size = len(pdf.output())
+    per_byte = (time.perf_counter() - started) / size
+
+    templates = set(month_templates(kind, year, month))
+    for template in templates:
+        t = totals.setdefault(template, {"calls": 0, "pages": 0, "seconds": 0.0, "bytes": 0.0})
+        t["calls"] += m.calls[template]
+        t["seconds"] += m.seconds[template]
+    for stage, nbytes in zip(m.page_stages, page_bytes):
+        if stage is None or stage not in templates:
+            raise RuntimeError(f"Page added outside a template call ({stage}) in {kind} "
+                               f"{year}-{month:02d} {page_format}")
+        totals[stage]["pages"] += 1
+        totals[stage]["bytes"] += nbytes
+        totals[stage]["seconds"] += nbytes * per_byte
+    document_bytes = size - sum(page_bytes)
+    setup = sum(s for stage, s in m.seconds.items() if stage not in templates)
+    return {"seconds": setup + document_bytes * per_byte, "bytes": document_bytes}
+
+def calibrate(formats: Sequence[str], cfg: dict, year: int = 2025, month: int = 1) -> Costs:
+    """Measure per-template costs by rendering one sample month of each kind per format."""
+    import fpdf
+
+    from planner.context import RenderContext
+
+    context = RenderContext.from_config(cfg)
+    result: Costs = {"meta": {"fpdf2": fpdf.__version__, "sample": f"{year}-{month:02d}",
+                              "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+                     "startup_seconds": measure_startup(),
+                     "formats": {}}
+    for page_format in formats:
+        totals: Dict[str, Dict[str, float]] = {}
+        documents = {kind: _calibrate_month(kind, year, month, page_format, cfg, context, totals)
+                     for kind in KINDS}
+        templates = {name: {key: t[key] / t["calls"] for key in ("pages", "seconds", "bytes")}
+                     for name, t in totals.items()}
+        result["formats"][page_format] = {"templates": templates, "documents": documents}
+        logging.info("Calibrated %s: %s", page_format, ", ".join(
+            f"{name} {c['seconds'] * 1000:.1f} ms/{c['bytes'] / 1024:.1f} KiB/{c['pages']:g} pages"
+            for name, c in templates.items()))
+    return result
+
+def save_costs(costs: Costs, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(costs, f, indent=2)
+
+def load_costs(path: str) -> Costs:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
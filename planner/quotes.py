@@ -1,20 +1,162 @@
 from __future__ import annotations
 import csv
-from functools import lru_cache
+import logging
+import mmap
+import os
+import struct
 from datetime import date
+from typing import Dict, Iterator, Optional, Tuple, Union, cast
 
-@lru_cache(maxsize=1)
-def _load_quotes(path: str) -> list[str]:
+logger = logging.getLogger(__name__)
+
+# Quote corpus backed by the CSV itself (memory-mapped) plus a persisted
+# index of (byte offset, byte length) per valid row. Lookups decode a single
+# row, so memory stays flat however large the corpus is. The index lives
+# next to the CSV (`.<name>.idx`) and records the CSV's size and mtime; it
+# is rebuilt whenever they no longer match.
+
+_MAGIC = b"PLQIDX1\n"
+_HEADER = struct.Struct("<8sQQQ")   # magic, csv size, csv mtime_ns, row count
+_ENTRY = struct.Struct("<QQ")       # offset, length
+
+Quote = Tuple[str, str]
+
+def index_path(csv_path: str) -> str:
+    head, tail = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(head, f".{tail}.idx")
+
+def _parse_row(raw: bytes) -> Optional[Quote]:
+    """(quote, author) for one CSV record, or None if it holds no quote."""
+    row = next(csv.reader([raw.decode("utf-8")]), None)
+    if not row:
+        return None
+    quote = row[0].strip()
+    if not quote:
+        return None
+    author = row[1].strip() if len(row) > 1 and row[1] else "Unknown"
+    return quote, author
+
+def _iter_records(data) -> Iterator[Tuple[int, int]]:
+    """(offset, length) of every CSV record; quoted fields may span lines."""
+    start, pos, size, in_quotes = 0, 0, len(data), False
+    while pos < size:
+        nl = data.find(b"\n", pos)
+        end = size if nl < 0 else nl + 1
+        # Embedded quotes come in pairs ("" escapes), so the parity of the
+        # quote count tells whether the record continues past this newline.
+        if data[pos:end].count(b'"') % 2:
+            in_quotes = not in_quotes
+        pos = end
+        if not in_quotes:
+            yield start, end - start
+            start = end
+    if start < size:
+        yield start, size - start
+
+def build_index(data, size: int, mtime_ns: int) -> bytes:
+    entries = bytearray()
+    count = 0
+    for offset, length in _iter_records(data):
+        try:
+            if _parse_row(data[offset:offset + length]) is None:
+                continue
+        except (csv.Error, UnicodeDecodeError) as e:
+            logger.warning("Skipping unreadable quote row at byte %d: %s", offset, e)
+            continue
+        entries += _ENTRY.pack(offset, length)
+        count += 1
+    return _HEADER.pack(_MAGIC, size, mtime_ns, count) + bytes(entries)
+
+class QuoteStore:
+    """Random access to the (quote, author) rows of a CSV file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data: Optional[mmap.mmap] = None
+        self._index: Union[mmap.mmap, bytes, None] = None
+        self._count = 0
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.signature = None
+            return
+        self.signature = (st.st_size, st.st_mtime_ns)
+        if st.st_size == 0:
+            return
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = self._open_index(st.st_size, st.st_mtime_ns)
+        self._count = _HEADER.unpack_from(self._index)[3]
+
+    def _open_index(self, size: int, mtime_ns: int) -> Union[mmap.mmap, bytes]:
+        idx_path = index_path(self.path)
+        try:
+            with open(idx_path, "rb") as f:
+                index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, idx_size, idx_mtime, count = _HEADER.unpack_from(index)
+            if (magic, idx_size, idx_mtime) == (_MAGIC, size, mtime_ns) \
+                    and len(index) == _HEADER.size + count * _ENTRY.size:
+                return index
+            index.close()
+        except (OSError, ValueError, struct.error):
+            pass
+        logger.info("Rebuilding quote index for '%s'.", os.path.abspath(self.path))
+        built = build_index(self._data, size, mtime_ns)
+        tmp = f"{idx_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(built)
+            os.replace(tmp, idx_path)
+        except OSError as e:
+            # Read-only checkout: keep the index in memory for this process.
+            logger.warning("Could not write quote index '%s': %s", idx_path, e)
+        return built
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> Quote:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("quote index out of range")
+        index, data = self._index, self._data
+        assert index is not None and data is not None  # a non-empty store has both
+        offset, length = _ENTRY.unpack_from(index, _HEADER.size + i * _ENTRY.size)
+        # The index only lists records that hold a quote.
+        return cast(Quote, _parse_row(data[offset:offset + length]))
+
+    def __iter__(self) -> Iterator[Quote]:
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self) -> None:
+        for m in (self._data, self._index):
+            if isinstance(m, mmap.mmap):
+                m.close()
+        self._data = self._index = None
+        self._count = 0
+
+_STORES: Dict[str, QuoteStore] = {}
+
+def quote_store(path: str) -> QuoteStore:
+    """Shared store for `path`, reopened when the file changes on disk."""
+    key = os.path.abspath(path)
+    store = _STORES.get(key)
     try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            return [row[0].strip() for row in reader if row and row[0].strip()]
+        st = os.stat(key)
+        signature = (st.st_size, st.st_mtime_ns)
     except FileNotFoundError:
-        return []
+        signature = None
+    if store is None or store.signature != signature:
+        # The old store is not closed: callers may still hold it, and its
+        # maps are released once the last reference goes away.
+        store = _STORES[key] = QuoteStore(key)
+    return store
 
 def quote_for_date(d: date, path: str, seed: int = 0) -> str:
-    quotes = _load_quotes(path)
+    quotes = quote_store(path)
     if not quotes:
         return ""
     idx = (d.toordinal() + int(seed)) % len(quotes)
-    return quotes[idx]
+    return quotes[idx][0]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import logging
+import re
+import statistics
+from typing import Dict, List, Optional
+
+from fpdf import FPDF
+
+from planner.metrics import MonthMetrics
+from planner.rendering.state import count_operators, page_stream
+
+# E-ink readers redraw a page by executing its content stream, and slow down
+# with the number of vector operators. Under the eink-lite profile every
+# rendered page is counted: its own operators plus those of the Form
+# XObjects it places (a static layer is executed on every page showing it).
+# Tiling pattern cells are counted once per fill, as the `re f` painting them.
+
+_PLACED_FORM = re.compile(rb"/I(\d+) Do")
+
+def page_operator_counts(pdf: FPDF) -> List[int]:
+    """Operators executed to draw each page of `pdf`, in page order."""
+    form_ops: Dict[int, int] = pdf.__dict__.get("_planner_form_ops", {})
+    counts = []
+    for n in range(1, pdf.page + 1):
+        contents = page_stream(pdf, n)
+        counts.append(count_operators(contents) + sum(
+            form_ops.get(int(index), 0) for index in _PLACED_FORM.findall(contents)))
+    return counts
+
+def check_operator_budget(pdf: FPDF, budget: Optional[int],
+                          metrics: Optional[MonthMetrics] = None) -> List[int]:
+    """Count operators per page, log a summary (each page at debug level), warn about pages
+    above `budget` and add the counts to `metrics`."""
+    counts = page_operator_counts(pdf)
+    over = [n for n, ops in enumerate(counts, start=1) if budget and ops > budget]
+    label = "document"
+    if metrics is not None:
+        labels = metrics.labels
+        label = f"{labels['kind']} {labels['year']}-{labels['month']:02d} {labels['format']}"
+    if counts:
+        logging.info("%s: %d pages, operators per page min %d / median %d / max %d, %d over budget %s",
+                     label, len(counts), min(counts), int(statistics.median(counts)), max(counts),
+                     len(over), budget)
+    for n, ops in enumerate(counts, start=1):
+        logging.debug("%s: page %d has %d operators", label, n, ops)
+    if over:
+        worst = max(over, key=lambda n: counts[n - 1])
+        logging.warning("%s: %d page(s) over the operator budget of %d (pages %s; page %d has %d)",
+                        label, len(over), budget, ", ".join(map(str, over)), worst, counts[worst - 1])
+    if metrics is not None:
+        metrics.count("max_ops_per_page", max(counts, default=0))
+        metrics.count("pages_over_budget", len(over))
+        metrics.count("operators", {"budget": budget, "per_page": counts})
+    return counts
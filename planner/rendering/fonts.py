@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import copy
+import io
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.enums import TextEmphasis
+from fpdf.fonts import SubsetMap, TTFFont
+
+from planner.config import FONT_STYLES
+
+# Unicode TrueType/OpenType fonts from the `fonts` config section.
+#
+# fpdf parses a font file (cmap, widths, metrics) on every add_font, i.e.
+# once per monthly document. Here each file is parsed once per process and
+# every document gets a light copy sharing the parsed tables; only the
+# fontTools object, which fpdf subsets in place when the document is
+# written, is opened anew (from bytes kept in memory) per document. Each
+# document therefore still embeds a subset of just the glyphs it uses.
+
+logger = logging.getLogger(__name__)
+
+# Styles the templates select, and what to use when a family lacks one.
+_FALLBACKS = {"": (), "B": ("",), "I": ("",), "BI": ("B", "I", "")}
+_STYLE_NAMES = {letters: name for name, letters in FONT_STYLES.items()}
+# Per-document state that must not be shared with the parsed original.
+_PER_DOCUMENT = ("i", "fontkey", "emphasis", "desc", "ttfont", "subset", "missing_glyphs",
+                 "biggest_size_pt", "_hbfont")
+
+_PARSED: Dict[Tuple[str, int, int], Tuple[bytes, Optional[TTFFont]]] = {}
+_warned: Set[Tuple[str, str]] = set()
+
+def resolve_font_path(path: str) -> str:
+    """Absolute path of a configured font file: as given, else under the project root."""
+    from planner.styles import PROJECT_ROOT
+
+    if os.path.isabs(path) or os.path.exists(path):
+        return os.path.abspath(path)
+    return os.path.join(PROJECT_ROOT, path)
+
+def font_files(fonts: Optional[Mapping[str, Mapping[str, str]]]) -> Dict[Tuple[str, str], str]:
+    """(family, fpdf style) -> font file for every style the templates may select."""
+    files: Dict[Tuple[str, str], str] = {}
+    for family, variants in (fonts or {}).items():
+        by_style = {FONT_STYLES[name]: resolve_font_path(path) for name, path in variants.items()}
+        for style, fallbacks in _FALLBACKS.items():
+            chosen = style if style in by_style else next(s for s in fallbacks if s in by_style)
+            if chosen != style and (family, style) not in _warned:
+                _warned.add((family, style))
+                logger.warning("Font family '%s' has no %s file; using its %s file instead.",
+                               family, _STYLE_NAMES[style], _STYLE_NAMES[chosen])
+            files[(family, style)] = by_style[chosen]
+    return files
+
+def _parsed(pdf: FPDF, path: str) -> Tuple[bytes, Optional[TTFFont]]:
+    """File bytes and the parsed font, once per file version and process.
+
+    The parsed font is None for files fpdf patches while parsing (TrueType
+    without a .notdef glyph) and for color fonts; those are added normally.
+    """
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    entry = _PARSED.get(key)
+    if entry is None:
+        with open(path, "rb") as f:
+            data = f.read()
+        probe = ttLib.TTFont(io.BytesIO(data), lazy=True)
+        parsed: Optional[TTFFont] = None
+        if not ("glyf" in probe and ".notdef" not in probe["glyf"]):
+            parsed = TTFFont(pdf, Path(path), "", "")
+            if parsed.color_font is not None:
+                parsed = None
+        entry = _PARSED[key] = (data, parsed)
+        logger.debug("Parsed font %s (%d bytes)", path, len(data))
+    return entry
+
+def add_font(pdf: FPDF, family: str, style: str, path: str) -> None:
+    """`pdf.add_font(family, style, path)`, reusing the process-wide parsed font."""
+    fontkey = f"{family.lower()}{style}"
+    if fontkey in pdf.fonts:
+        return
+    data, parsed = _parsed(pdf, path)
+    if parsed is None:
+        pdf.add_font(family, style, path)
+        return
+    font = TTFFont.__new__(TTFFont)
+    for name in TTFFont.__slots__:
+        if name not in _PER_DOCUMENT and hasattr(parsed, name):
+            setattr(font, name, getattr(parsed, name))
+    font.i = len(pdf.fonts) + 1
+    font.fontkey = fontkey
+    font.emphasis = TextEmphasis.coerce(style)
+    font.desc = copy.copy(parsed.desc)  # a PDF object: gets its own object id in each document
+    font.ttfont = ttLib.TTFont(io.BytesIO(data), recalcTimestamp=False, lazy=True)
+    font.missing_glyphs = []
+    font.biggest_size_pt = 0
+    font._hbfont = None
+    font.subset = SubsetMap(font)
+    pdf.fonts[fontkey] = font
+    if font.is_cff and font.is_cid_keyed:
+        pdf._set_min_pdf_version("1.6")
+
+class _FontTable(dict):
+    """fpdf's font registry, where a style falling back to another style's file maps to its font.
+
+    fpdf embeds every font in `values()`; listing each font once embeds a
+    file shared by several styles once.
+    """
+
+    def values(self):
+        return list({id(font): font for font in dict.values(self)}.values())
+
+def register_fonts(pdf: FPDF, fonts: Optional[Mapping[str, Mapping[str, str]]]) -> None:
+    """Make every configured family available to `pdf.set_font` in all four styles.
+
+    Styles without a file of their own (see `font_files`) select the font
+    already registered for that file, so the document embeds it once.
+    """
+    catalog = pdf._resource_catalog
+    if not isinstance(catalog.font_registry, _FontTable):
+        catalog.font_registry = _FontTable(catalog.font_registry)
+    by_path: Dict[str, Any] = {}
+    for (family, style), path in font_files(fonts).items():
+        fontkey = f"{family.lower()}{style}"
+        shared = by_path.get(path)
+        if shared is not None and fontkey not in pdf.fonts:
+            pdf.fonts[fontkey] = shared
+            continue
+        add_font(pdf, family, style, path)
+        by_path.setdefault(path, pdf.fonts[fontkey])
+
+def font_cache_info() -> Dict[str, Any]:
+    return {"files": len(_PARSED), "bytes": sum(len(data) for data, _ in _PARSED.values())}
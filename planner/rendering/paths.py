@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fpdf import FPDF
+
+Color = Tuple[int, int, int]
+Style = Tuple[Color, Optional[float], str]  # color, line width, painting operator
+
+class PathBatch:
+    """Collects stroked lines and rectangles and emits one path per style.
+
+    Instead of one `pdf.line`/`pdf.rect` call (and usually a color switch)
+    per primitive, segments sharing a (color, line width) are appended to a
+    single PDF path that is stroked once with `S` when the batch is flushed.
+    Filled rectangles (`fill_rect`) likewise share one path per color,
+    filled once with `f`. The graphics state still goes through fpdf's
+    setters, so a color or width equal to the current one is still not
+    written again.
+    """
+
+    def __init__(self, pdf: FPDF):
+        self.pdf = pdf
+        self._paths: Dict[Style, List[str]] = {}
+
+    def _ops(self, color: Color, width: Optional[float], paint: str = "S") -> List[str]:
+        r, g, b = color  # also accepts the lists YAML configs give
+        return self._paths.setdefault(((r, g, b), width, paint), [])
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, color: Color,
+             width: Optional[float] = None) -> None:
+        k, h = self.pdf.k, self.pdf.h
+        self._ops(color, width).append(
+            f"{x1 * k:.2f} {(h - y1) * k:.2f} m {x2 * k:.2f} {(h - y2) * k:.2f} l")
+
+    def rect(self, x: float, y: float, w: float, h: float, color: Color,
+             width: Optional[float] = None) -> None:
+        k, page_h = self.pdf.k, self.pdf.h
+        self._ops(color, width).append(
+            f"{x * k:.2f} {(page_h - y) * k:.2f} {w * k:.2f} {-h * k:.2f} re")
+
+    def fill_rect(self, x: float, y: float, w: float, h: float, color: Color) -> None:
+        k, page_h = self.pdf.k, self.pdf.h
+        self._ops(color, None, "f").append(
+            f"{x * k:.2f} {(page_h - y) * k:.2f} {w * k:.2f} {-h * k:.2f} re")
+
+    def __len__(self) -> int:
+        return sum(len(ops) for ops in self._paths.values())
+
+    def flush(self) -> None:
+        pdf = self.pdf
+        for (color, width, paint), ops in self._paths.items():
+            if not ops:
+                continue
+            if paint == "f":
+                pdf.set_fill_color(*color)
+            else:
+                pdf.set_draw_color(*color)
+            if width is not None:
+                pdf.set_line_width(width)
+            pdf._out(" ".join(ops) + " " + paint)
+        self._paths.clear()
+
+@contextmanager
+def batched_paths(pdf: FPDF) -> Iterator[PathBatch]:
+    """Yield a PathBatch that is flushed to the current page when the block ends."""
+    batch = PathBatch(pdf)
+    yield batch
+    batch.flush()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from fpdf import FPDF
+from fpdf.pattern import Pattern
+from fpdf.syntax import PDFObject
+
+from planner.config import RULING_STYLES as STYLES
+from planner.rendering.xobjects import add_pattern
+
+# Ruled writing areas as PDF tiling patterns: one small pattern cell (a
+# rule, a dot or a square) is defined once per document and an area is
+# filled with it by a single `re f`, instead of one path segment per rule.
+
+Color = Tuple[int, int, int]
+
+class TilingPattern(Pattern):
+    """A colored tiling pattern (PatternType 1) whose cell is a content stream.
+
+    fpdf2 only implements shading patterns; this plugs a tiling pattern
+    into the same resource catalog so it is written and referenced from
+    page resources like any other pattern. Pattern space is the default
+    user space of the page (points, origin bottom-left).
+    """
+
+    def __init__(self, cell: bytes, x_step: float, y_step: float, matrix: Tuple[float, ...]):
+        PDFObject.__init__(self)  # no shading behind this pattern
+        self.x_step = x_step
+        self.y_step = y_step
+        self._matrix_values = matrix
+        self._cell = cell  # a handful of operators: stored uncompressed
+
+    def get_apply_page_ctm(self) -> bool:
+        return False  # the matrix is already in points
+
+    def serialize(self, obj_dict=None, _security_handler=None) -> str:
+        stream = self._cell
+        if _security_handler:
+            stream = _security_handler.encrypt_stream(stream, self.id)
+        matrix = " ".join(f"{v:.2f}" for v in self._matrix_values)
+        head = (f"<</Type /Pattern /PatternType 1 /PaintType 1 /TilingType 1"
+                f" /BBox [0 0 {self.x_step:.2f} {self.y_step:.2f}]"
+                f" /XStep {self.x_step:.2f} /YStep {self.y_step:.2f}"
+                f" /Resources <<>> /Matrix [{matrix}] /Length {len(stream)}>>")
+        return "\n".join([f"{self.id} 0 obj", head, "stream",
+                          stream.decode("latin-1"), "endstream", "endobj"])
+
+def _cell(style: str, width: float, step: float, x0: float, color: Color, line_w: float, dot: float) -> bytes:
+    """Content of one pattern cell (points): `width` wide, `step` tall, rule mid-height.
+
+    Cells span the whole page width, so a rule never crosses a tile edge
+    (viewers tile with antialiasing, which shows up as seams); `x0` is
+    where the vertical rules / dot columns start.
+    """
+    rgb = " ".join(f"{c / 255:.4f}" for c in color)
+    mid = step / 2
+    columns = []
+    x = x0 % step
+    while x < width:
+        columns.append(x)
+        x += step
+    if style == "dots":
+        # A zero-length segment with round caps paints a dot of the line width.
+        dots = " ".join(f"{x:.2f} {mid:.2f} m {x:.2f} {mid:.2f} l" for x in columns)
+        return f"{rgb} RG 1 J {dot:.2f} w {dots} S".encode("latin-1")
+    ops = f"{rgb} RG 0 J {line_w:.2f} w 0 {mid:.2f} m {width:.2f} {mid:.2f} l"
+    if style == "squares":
+        ops += "".join(f" {x:.2f} 0 m {x:.2f} {step:.2f} l" for x in columns)
+    return (ops + " S").encode("latin-1")
+
+def ruling_pattern(pdf: FPDF, style: str, spacing: float, first_rule_y: float, color: Color,
+                   dot_size: float = 0.5) -> str:
+    """Resource name (`P1`…) of a pattern ruling `spacing` mm apart with a rule at `first_rule_y`.
+
+    Patterns are cached per document by style, spacing, color and phase, so
+    areas on the same grid share one pattern object.
+    """
+    if style not in STYLES:
+        raise ValueError(f"Unknown ruling style '{style}' (expected one of {', '.join(STYLES)})")
+    k = pdf.k
+    step = round(spacing * k, 2)
+    width = round(pdf.w * k, 2)
+    # Phase the rows so that a rule (cell middle) lands on first_rule_y;
+    # squares and dots start their columns at the left margin.
+    phase_y = round(((pdf.h - first_rule_y) * k - step / 2) % step, 2)
+    x0 = round(pdf.l_margin * k, 2)
+    key = (style, step, tuple(color), phase_y, x0, round(pdf.line_width * k, 2), dot_size)
+    cache: Dict[tuple, TilingPattern] = pdf.__dict__.setdefault("_planner_patterns", {})
+    pattern = cache.get(key)
+    if pattern is None:
+        pattern = cache[key] = TilingPattern(
+            _cell(style, width, step, x0, color, pdf.line_width * k, dot_size * k),
+            width, step, (1, 0, 0, 1, 0, phase_y))
+    # Inside a recorded form the pattern is listed in the form's own resources, not the page's.
+    return add_pattern(pdf, pattern)
+
+def fill_with_pattern(pdf: FPDF, name: str, x: float, y: float, w: float, h: float) -> None:
+    """Paint the rectangle (mm, top-left origin) with pattern `name` in one operation."""
+    k = pdf.k
+    pdf._out(f"q /Pattern cs /{name} scn {x * k:.2f} {(pdf.h - y) * k:.2f} "
+             f"{w * k:.2f} {-h * k:.2f} re f Q")
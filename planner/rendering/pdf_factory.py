@@ -1,21 +1,61 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, Tuple, Type
 from fpdf import FPDF
 
-def make_pdf(fmt: str, margins: Dict[str, Any]) -> FPDF:
+from planner.rendering.state import TrackedPDF
+from planner.rendering.text import TextLayoutMixin
+from planner.rendering.xobjects import FormXObjectMixin
+
+if TYPE_CHECKING:
+    from planner.context import RenderContext
+
+class PlannerPDF(FormXObjectMixin, TextLayoutMixin, TrackedPDF):
+    pass
+
+class TrackedOnlyPDF(FormXObjectMixin, TrackedPDF):
+    pass
+
+class LayoutCachedPDF(FormXObjectMixin, TextLayoutMixin, FPDF):
+    pass
+
+class PlainPDF(FormXObjectMixin, FPDF):
+    pass
+
+_CLASSES: Dict[Tuple[bool, bool], Type[FPDF]] = {
+    (True, True): PlannerPDF,
+    (True, False): TrackedOnlyPDF,
+    (False, True): LayoutCachedPDF,
+    (False, False): PlainPDF,
+}
+
+def make_pdf(fmt: str, margins: Dict[str, Any], track_state: bool = True,
+             cache_layout: bool = True, fonts: Optional[Mapping[str, Mapping[str, str]]] = None,
+             context: Optional[RenderContext] = None) -> FPDF:
     left   = float(margins.get("left", 10))
     top    = float(margins.get("top", 15))
     right  = float(margins.get("right", 10))
     bottom = float(margins.get("bottom", 15))
 
-    pdf = FPDF(orientation="P", unit="mm", format=fmt)
+    # TrackedPDF skips font selections that change nothing;
+    # TextLayoutMixin reuses multi_cell line breaks. Turning either off gives
+    # plain fpdf behaviour (used by bench for comparison). All of them write
+    # static layers as Form XObjects (rendering.xobjects).
+    pdf_class = _CLASSES[(track_state, cache_layout)]
+    pdf = pdf_class(orientation="P", unit="mm", format=fmt)
     pdf.set_left_margin(left)
     pdf.set_top_margin(top)
     pdf.set_right_margin(right)
     pdf.set_auto_page_break(auto=True, margin=bottom)
 
-    # If/when you switch to a Unicode TTF (e.g., Noto Sans), register it here once.
-    # pdf.add_font("NotoSans", "", "NotoSans-Regular.ttf", uni=True)
-    # pdf.set_font("NotoSans", size=12)
+    # The templates read fonts, ruling, quotes and events from the context.
+    if context is not None:
+        from planner.context import bind_context
+        bind_context(pdf, context)
+        fonts = fonts if fonts is not None else context.fonts
+
+    # Unicode TTF families from the `fonts` config; parsed once per process.
+    if fonts:
+        from planner.rendering.fonts import register_fonts
+        register_fonts(pdf, fonts)
 
     return pdf
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, Union, cast
+
+from fpdf import FPDF
+
+# fpdf already skips a color or line width equal to the current one, but
+# re-selects the font (`/F1 10.00 Tf`) before the next text after every
+# set_font / set_font_size call that changes it, even when the page comes
+# back to the font it already has in effect - which the templates do on
+# nearly every line, switching between title, body and prompt fonts.
+# TrackedPDF remembers the font and size last written to the page and marks
+# a return to it as already selected. It works at the public setters only:
+# nothing written to the content stream is parsed.
+
+_STRING = re.compile(rb"\((?:[^()\\]|\\.)*\)|<[0-9A-Fa-f\s]*>")
+_DELIMS = re.compile(rb"[\s\[\]]+")
+
+def _tokens(data: bytes) -> List[bytes]:
+    if b"(" in data or b"<" in data:
+        data = _STRING.sub(b" ", data)
+    return [t for t in _DELIMS.split(data) if t]
+
+def _is_operator(token: bytes) -> bool:
+    first = token[:1]
+    return (first.isalpha() or first in (b"'", b'"')) and token not in (b"true", b"false", b"null")
+
+def count_operators(data: Union[bytes, bytearray]) -> int:
+    """Number of operators (not operands) in a content stream."""
+    return sum(1 for t in _tokens(bytes(data)) if _is_operator(t))
+
+def page_stream(pdf: FPDF, n: int) -> bytes:
+    """The content stream written so far for page `n` (fpdf keeps it as a bytearray until output)."""
+    return bytes(cast(bytearray, pdf.pages[n].contents))
+
+class TrackedPDF(FPDF):
+    """FPDF that does not select a font again when the page already has it in effect.
+
+    Text only ever goes to the page's own content stream (Form XObject
+    furniture is vector-only), so one selection per page is tracked. fpdf's
+    `local_context` restores the font with `Q`; the record is dropped there.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._font_page = 0
+        self._page_font: Optional[Tuple[int, float]] = None
+        super().__init__(*args, **kwargs)
+
+    def _selected(self) -> Optional[Tuple[int, float]]:
+        font = self.current_font
+        return None if font is None else (font.i, round(self.font_size_pt, 2))
+
+    def _note_page_font(self) -> None:
+        # Before a change: if fpdf wrote the current selection to this page, remember it.
+        if self.page != self._font_page:
+            self._font_page, self._page_font = self.page, None
+        if self.page and self.current_font_is_set_on_page:
+            self._page_font = self._selected()
+
+    def _reuse_page_font(self) -> None:
+        if self.page and self._page_font is not None and self._selected() == self._page_font:
+            self.current_font_is_set_on_page = True
+
+    def set_font(self, family=None, style="", size=0) -> None:
+        self._note_page_font()
+        super().set_font(family, style, size)
+        self._reuse_page_font()
+
+    def set_font_size(self, size: float) -> None:
+        self._note_page_font()
+        super().set_font_size(size)
+        self._reuse_page_font()
+
+    @contextmanager
+    def local_context(self, *args, **kwargs) -> Iterator[None]:
+        with super().local_context(*args, **kwargs):
+            yield
+        self._page_font = None
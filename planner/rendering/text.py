@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, Hashable, List, Tuple, cast
+
+from fpdf import FPDF
+from fpdf.enums import Align, XPos, YPos
+
+# The templates print the same prompts, headings and quotes on page after
+# page, and fpdf's multi_cell measures every character to find the line
+# breaks each time. Line breaks only depend on the font, the width and the
+# text, so they are computed once per process and the lines are then printed
+# as plain cells, which measure a whole line at once.
+
+_MAX_ENTRIES = 4096
+_LINES: Dict[Hashable, Tuple[str, ...]] = {}
+_STATS = {"hits": 0, "misses": 0}
+_LOCK = threading.Lock()  # lookups are lock-free; inserts and evictions are not
+
+# multi_cell arguments the cached path reproduces; anything else (borders,
+# fills, links, padding, markdown, dry runs...) goes to fpdf unchanged.
+_PLAIN_ARGS = {"align", "ln", "new_x", "new_y"}
+_DEFAULTS = {"border": 0, "fill": False, "link": None, "max_line_height": None, "markdown": False,
+             "print_sh": False, "center": False, "padding": 0}
+_PLAIN_ALIGNS = {Align.L, Align.C, Align.R}
+_LN = {0: (XPos.RIGHT, YPos.NEXT), 1: (XPos.LMARGIN, YPos.NEXT),
+       2: (XPos.LEFT, YPos.NEXT), 3: (XPos.RIGHT, YPos.TOP)}
+
+def layout_cache_info() -> Dict[str, int]:
+    return {**_STATS, "entries": len(_LINES)}
+
+def clear_layout_cache() -> None:
+    with _LOCK:
+        _LINES.clear()
+        _STATS.update(hits=0, misses=0)
+
+# Mixed into FPDF subclasses (see rendering.pdf_factory); type checkers see it as one.
+if TYPE_CHECKING:
+    _Base = FPDF
+else:
+    _Base = object
+
+class TextLayoutMixin(_Base):
+    """FPDF mixin memoizing multi_cell line breaks by font, width and text."""
+
+    def _wrapped_lines(self, w: float, text: str, align: Align) -> Tuple[str, ...]:
+        key = (getattr(self.current_font, "name", None), self.font_family, self.font_style,
+               self.font_size_pt, self.font_stretching, self.char_spacing, round(self.c_margin, 6),
+               round(w, 6), align, text)
+        lines = _LINES.get(key)
+        if lines is not None:
+            _STATS["hits"] += 1
+            return lines
+        _STATS["misses"] += 1
+        measured = cast(List[str], super().multi_cell(w, None, text, align=align, dry_run=True, output="LINES"))
+        lines = tuple(measured) or ("",)
+        with _LOCK:
+            if len(_LINES) >= _MAX_ENTRIES:
+                del _LINES[next(iter(_LINES))]
+            _LINES[key] = lines
+        return lines
+
+    def multi_cell(self, w, h=None, text="", *args, **kwargs):
+        if "txt" in kwargs:
+            text = kwargs.pop("txt")
+        align = Align.coerce(kwargs.get("align", Align.J))
+        plain = {k: v for k, v in kwargs.items() if k not in _DEFAULTS or v != _DEFAULTS[k]}
+        if (args or not set(plain) <= _PLAIN_ARGS or align not in _PLAIN_ALIGNS or not w
+                or self.text_shaping or "\r" in text or text.endswith("\n")):
+            return super().multi_cell(w, h, text, *args, **kwargs)
+        if "ln" in plain:
+            new_x, new_y = _LN[plain["ln"]]
+        else:
+            new_x = XPos.coerce(plain.get("new_x", XPos.RIGHT))
+            new_y = YPos.coerce(plain.get("new_y", YPos.NEXT))
+        if h is None:
+            h = self.font_size
+
+        lines = self._wrapped_lines(w, self.normalize_text(text), align)
+        page = self.page
+        top = self.y
+        for i, line in enumerate(lines):
+            last = i == len(lines) - 1
+            self.cell(w, h, line, align=align,
+                      new_x=new_x if last else XPos.LEFT, new_y=new_y if last else YPos.NEXT)
+        if new_y == YPos.TOP and self.page == page:
+            self.y = top  # after a page break fpdf keeps y on the last line instead
+        return self.page != page
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Hashable, Iterator, Set
+
+import fpdf
+from fpdf import FPDF
+from fpdf.enums import PDFResourceType
+from fpdf.output import OutputProducer
+from fpdf.syntax import Name, PDFArray, PDFContentStream
+
+from planner.rendering.state import count_operators
+
+# fpdf2 has no public API for reusable Form XObjects, so FormXObjectMixin
+# hands fpdf's output() a producer subclass that writes the forms next to
+# the images and gives each one its own /Resources. That subclass relies on
+# producer hooks of the 2.8 series (pyproject allows 2.8.x, requirements.txt
+# pins the release it is tested with); with any other fpdf2, or a PDF class
+# without the mixin, static_layer() draws the furniture inline on every page.
+_PRODUCER_HOOKS = ("_add_images", "_add_patterns", "_add_pdf_obj")
+_FORMS_AVAILABLE = (tuple(int(n) for n in fpdf.FPDF_VERSION.split(".")[:2]) == (2, 8)
+                    and all(hasattr(OutputProducer, hook) for hook in _PRODUCER_HOOKS))
+
+def _supported(pdf: FPDF) -> bool:
+    return _FORMS_AVAILABLE and isinstance(pdf, FormXObjectMixin)
+
+_REPLAY = object()
+
+class _FormOutputProducer(OutputProducer):
+    """Writes the recorded forms as XObjects, each with the patterns it paints as /Resources."""
+
+    def _add_images(self):
+        objs = super()._add_images()
+        for index, form, _ in self.fpdf.__dict__.get("_planner_form_xobjects", ()):
+            self._add_pdf_obj(form, "images")
+            objs[index] = form
+        return objs
+
+    def _add_patterns(self):
+        objs = super()._add_patterns()
+        for _, form, patterns in self.fpdf.__dict__.get("_planner_form_xobjects", ()):
+            entries = " ".join(f"/{name} {objs[name].id} 0 R" for name in sorted(patterns))
+            form.resources = f"<</Pattern <<{entries}>>>>" if entries else "<<>>"
+        return objs
+
+class FormXObjectMixin:
+    """PDF class mixin that writes the static layers recorded by static_layer() as Form XObjects."""
+
+    def output(self, *args, **kwargs):
+        if kwargs.get("linearize") and self.__dict__.get("_planner_form_xobjects"):
+            raise ValueError("documents with Form XObject furniture cannot be linearized")
+        kwargs.setdefault("output_producer_class", _FormOutputProducer)
+        return super().output(*args, **kwargs)  # type: ignore[misc]
+
+class _Recorder:
+    """Collects the vector operators of one static layer, plus the graphics state they leave behind."""
+
+    def __init__(self, pdf: FPDF):
+        self.buffer = bytearray()
+        self.patterns: Set[str] = set()  # names of the tiling patterns the form paints with
+        self.active = False  # inside a furniture() block: operators go to the form
+        self.state = (pdf.draw_color, pdf.fill_color, pdf.line_width)
+        # Make the form self-contained: start from an explicit state instead of
+        # whatever the page happens to have set when the form is invoked.
+        draw, fill, width = self.state
+        assert draw is not None and fill is not None  # fpdf starts every document with black
+        self.buffer.extend(f"{draw.serialize().upper()} {fill.serialize().lower()} "
+                           f"{width * pdf.k:.2f} w\n".encode("latin-1"))
+
+class _FormXObject(PDFContentStream):
+    def __init__(self, pdf: FPDF, contents: bytes):
+        super().__init__(contents=contents, compress=pdf.compress)
+        self.type = Name("XObject")
+        self.subtype = Name("Form")
+        self.b_box = PDFArray([0, 0, round(pdf.w_pt, 2), round(pdf.h_pt, 2)])
+        self.resources = "<<>>"  # set by _FormOutputProducer once pattern ids are known
+
+def _register_form(pdf: FPDF, recorder: _Recorder) -> int:
+    catalog = pdf._resource_catalog
+    xobject = _FormXObject(pdf, bytes(recorder.buffer))
+    index = catalog.next_xobject_index
+    catalog.next_xobject_index += 1
+    pdf.__dict__.setdefault("_planner_form_xobjects", []).append((index, xobject, recorder.patterns))
+    return index
+
+def _place_form(pdf: FPDF, index: int) -> None:
+    catalog = pdf._resource_catalog
+    catalog.add(PDFResourceType.X_OBJECT, index, pdf.page)
+    pdf._out(f"q /I{index} Do Q")
+
+@contextmanager
+def static_layer(pdf: FPDF, key: Hashable) -> Iterator[None]:
+    """Emit the furniture drawn inside this block once per document as a Form XObject.
+
+    The first page rendered with a given `key` records every `furniture()` block
+    into a new form; later pages with the same key skip the drawing and invoke
+    the form instead. Text and links keep going to the page as usual, so `key`
+    must capture everything the furniture's position depends on.
+    """
+    if not _supported(pdf) or pdf.__dict__.get("_planner_layer") is not None:
+        yield
+        return
+    forms = pdf.__dict__.setdefault("_planner_forms", {})
+    index = forms.get(key)
+    recorder = None if index is not None else _Recorder(pdf)
+    pdf.__dict__["_planner_layer"] = _REPLAY if recorder is None else recorder
+    try:
+        yield
+    finally:
+        pdf.__dict__["_planner_layer"] = None
+    if recorder is not None:
+        index = forms[key] = _register_form(pdf, recorder)
+        # Operators the form runs each time a page places it (see rendering.budget).
+        pdf.__dict__.setdefault("_planner_form_ops", {})[index] = count_operators(recorder.buffer)
+    _place_form(pdf, index)
+
+def add_pattern(pdf: FPDF, pattern) -> str:
+    """Register `pattern` where it is painted: on the form being recorded, else on the current page."""
+    layer = pdf.__dict__.get("_planner_layer")
+    recorder = layer if isinstance(layer, _Recorder) and layer.active else None
+    name = str(pdf._resource_catalog.add(PDFResourceType.PATTERN, pattern,
+                                         None if recorder else pdf.page))
+    if recorder is not None:
+        recorder.patterns.add(name)
+    return name
+
+@contextmanager
+def furniture(pdf: FPDF) -> Iterator[bool]:
+    """Wrap the drawing calls of one piece of static furniture.
+
+    Yields False when the drawing is already covered by a recorded form (the
+    caller should only advance its cursor), True otherwise. While recording,
+    operators are diverted from the page into the form buffer.
+    """
+    layer = pdf.__dict__.get("_planner_layer")
+    if layer is None:
+        yield True
+        return
+    if layer is _REPLAY:
+        yield False
+        return
+    page = pdf.pages[pdf.page]
+    page_contents = page.contents
+    page_state = (pdf.draw_color, pdf.fill_color, pdf.line_width)
+    page.contents = layer.buffer
+    pdf.draw_color, pdf.fill_color, pdf.line_width = layer.state
+    layer.active = True
+    try:
+        yield True
+    finally:
+        layer.active = False
+        layer.state = (pdf.draw_color, pdf.fill_color, pdf.line_width)
+        page.contents = page_contents
+        pdf.draw_color, pdf.fill_color, pdf.line_width = page_state
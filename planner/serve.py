@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from planner.api import render_month, render_range
+from planner.build_cache import InputHasher, source_signature
+from planner.generate.month_loop import iter_month_starts
+from planner.metrics import timed
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+class ByteLRU:
+    """LRU cache of rendered PDFs, bounded by the total size of the values."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, count: bool = True) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += count
+                return None
+            self._items.move_to_end(key)
+            self.hits += count
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._items), "bytes": self.size, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+class RequestError(ValueError):
+    pass
+
+def _param(query: Dict[str, List[str]], name: str, default: Optional[str] = None) -> str:
+    values = query.get(name)
+    if values:
+        return values[0]
+    if default is None:
+        raise RequestError(f"missing query parameter '{name}'")
+    return default
+
+def _parse_date(value: str, name: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise RequestError(f"'{name}' must be an ISO date (YYYY-MM-DD), got '{value}'") from None
+
+def _check_format(page_format: str) -> None:
+    from fpdf.fpdf import PAGE_FORMATS
+
+    if page_format.lower() not in PAGE_FORMATS:
+        raise RequestError(f"unknown format '{page_format}' (expected one of "
+                           f"{', '.join(f.capitalize() if len(f) > 2 else f.upper() for f in PAGE_FORMATS)})")
+
+class RenderService:
+    """Renders months and date ranges to PDF bytes, caching by input hash.
+
+    Renders carry their own context (planner.context), so different requests
+    render in parallel threads; concurrent requests for the same key wait
+    for a single render. Cache hits are served without taking any lock.
+    """
+
+    def __init__(self, cfg: dict, cache: ByteLRU):
+        self.cfg = cfg
+        self.cache = cache
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._hasher: Optional[InputHasher] = None
+        self._hasher_lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        # Pay imports, font metrics and the quote index once, before the first request.
+        import planner.generate.daily  # noqa: F401
+        import planner.generate.examen  # noqa: F401
+        self._input_hasher()
+
+    def _input_hasher(self) -> InputHasher:
+        """The hasher of the current inputs, rebuilt only when a font, event or quote file changes."""
+        signature = source_signature(self.cfg)
+        hasher = self._hasher
+        if hasher is None or hasher.signature != signature:
+            with self._hasher_lock:
+                hasher = self._hasher
+                if hasher is None or hasher.signature != signature:
+                    hasher = self._hasher = InputHasher(self.cfg)
+        return hasher
+
+    def _key(self, kind: str, months: List[Tuple[int, int]], page_format: str,
+             clip: Optional[Tuple[date, date]]) -> str:
+        hasher = self._input_hasher()
+        h = hashlib.sha256(f"{kind} {page_format} {clip}".encode("utf-8"))
+        for year, month in months:
+            parts = hasher.parts(kind, (year, month, page_format))
+            h.update(json.dumps(parts, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def _cached(self, key: str, render) -> Tuple[bytes, bool]:
+        data = self.cache.get(key)
+        if data is not None:
+            return data, True
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                data = self.cache.get(key, count=False)  # another request may have rendered it meanwhile
+                if data is not None:
+                    return data, True
+                data = render()
+                self.cache.put(key, data)
+        finally:
+            with self._locks_guard:
+                if self._locks.get(key) is lock and not lock.locked():
+                    del self._locks[key]
+        return data, False
+
+    def month(self, kind: str, year: int, month: int, page_format: str) -> Tuple[bytes, bool]:
+        if kind not in ("daily", "examen"):
+            raise RequestError(f"unknown kind '{kind}' (expected daily or examen)")
+        if not 1 <= month <= 12:
+            raise RequestError("month must be 1-12")
+        _check_format(page_format)
+        key = self._key(kind, [(year, month)], page_format, None)
+        with timed("serve_month", kind=kind, year=year, month=month, format=page_format):
+            return self._cached(key, lambda: render_month(year, month, page_format, self.cfg, kind))
+
+    def date_range(self, start: date, end: date, page_format: str) -> Tuple[bytes, bool]:
+        """Daily planner pages for [start, end], one PDF (months joined with an outline)."""
+        if end < start:
+            raise RequestError("'end' is before 'start'")
+        _check_format(page_format)
+        firsts = list(iter_month_starts(start, end))
+        key = self._key("daily", [(d.year, d.month) for d in firsts], page_format, (start, end))
+        with timed("serve_range", start=start.isoformat(), end=end.isoformat(), format=page_format):
+            return self._cached(key, lambda: render_range(start, end, page_format, self.cfg))
+
+class _Handler(BaseHTTPRequestHandler):
+    service: RenderService  # set on the subclass built by make_server
+
+    def log_message(self, fmt: str, *args) -> None:
+        logging.info("%s - %s", self.address_string(), fmt % args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send_pdf(self, data: bytes, hit: bool, filename: str) -> None:
+        self._send(200, data, "application/pdf", {
+            "X-Cache": "HIT" if hit else "MISS",
+            "Content-Disposition": f'inline; filename="{filename}"',
+        })
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        try:
+            if url.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            elif url.path == "/stats":
+                self._send_json(200, self.service.cache.stats())
+            elif url.path == "/month":
+                year, month = int(_param(query, "year")), int(_param(query, "month"))
+                page_format = _param(query, "format", "A4")
+                kind = _param(query, "kind", "daily")
+                data, hit = self.service.month(kind, year, month, page_format)
+                self._send_pdf(data, hit, f"{kind}_{year}-{month:02d}_{page_format}.pdf")
+            elif url.path == "/range":
+                start = _parse_date(_param(query, "start"), "start")
+                end = _parse_date(_param(query, "end"), "end")
+                page_format = _param(query, "format", "A4")
+                data, hit = self.service.date_range(start, end, page_format)
+                self._send_pdf(data, hit, f"daily_{start}_{end}_{page_format}.pdf")
+            else:
+                self._send_json(404, {"error": f"unknown path '{url.path}'"})
+        except (RequestError, ValueError) as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            logging.exception("Render failed for %s", self.path)
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    do_HEAD = do_GET
+
+def make_server(host: str, port: int, cfg: dict, cache_bytes: int = DEFAULT_CACHE_BYTES) -> ThreadingHTTPServer:
+    service = RenderService(cfg, ByteLRU(cache_bytes))
+    service.warm_up()
+    handler = type("PlannerHandler", (_Handler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
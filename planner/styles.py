@@ -6,10 +6,13 @@
 # Date: June 3, 2025 # Updated
 #
 # Description: Defines and loads style configurations (fonts, margins)
-#              for the PDF planner.
+#              for the PDF planner. The module attributes hold the styles of
+#              the project config.yaml; renders use resolve_styles() on their
+#              own configuration (see planner.context).
 
 from planner.config import load_config
 import os
+from typing import Any, Dict, Optional
 
 # Determine project root to locate config.yaml relative to this file's location
 # Assumes styles.py is in planner/ and config.yaml is in the parent directory (project root).
@@ -17,20 +20,22 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.yaml")
 
 # --- Load Configuration with Fallbacks ---
-config_data = {} # Initialize with an empty dict for fallback
-try:
-    config_data = load_config(CONFIG_PATH)
-    if not isinstance(config_data, dict):
-        print(f"[STYLE_CONFIG_WARN] Config file at '{CONFIG_PATH}' did not load as a dictionary. Using default styles.")
-        config_data = {} # Fallback to empty if not a dict
-except FileNotFoundError:
-    print(f"[STYLE_CONFIG_WARN] Config file '{CONFIG_PATH}' not found. Using default styles.")
-    # config_data remains an empty dict
-except Exception as e:
-    print(f"[STYLE_CONFIG_WARN] Error loading config file '{CONFIG_PATH}': {e}. Using default styles.")
-    # config_data remains an empty dict
+# The config file is only read when a style value is first accessed (see
+# __getattr__ at the bottom), so importing this module stays cheap.
+def _load_config_data() -> dict:
+    try:
+        config_data = load_config(CONFIG_PATH)
+        if not isinstance(config_data, dict):
+            print(f"[STYLE_CONFIG_WARN] Config file at '{CONFIG_PATH}' did not load as a dictionary. Using default styles.")
+            return {} # Fallback to empty if not a dict
+        return config_data
+    except FileNotFoundError:
+        print(f"[STYLE_CONFIG_WARN] Config file '{CONFIG_PATH}' not found. Using default styles.")
+    except Exception as e:
+        print(f"[STYLE_CONFIG_WARN] Error loading config file '{CONFIG_PATH}': {e}. Using default styles.")
+    return {} # Initialize with an empty dict for fallback
 
-def parse_font_string(font_str: str, default_family: str = 'Helvetica', default_style: str = '', default_size: int = 12) -> tuple:
+def parse_font_string(font_str: Optional[str], default_family: str = 'Helvetica', default_style: str = '', default_size: int = 12) -> tuple:
     """
     Safely parses a font string 'Family,Style,Size' into a (family, style, size) tuple.
     Provides default values if the string is malformed or parts are missing.
@@ -53,23 +58,44 @@ def parse_font_string(font_str: str, default_family: str = 'Helvetica', default_
             size = default_size
     return (family, style, size)
 
-# --- Font Styles ---
-# Default to 'Helvetica' as a safe fallback if specific fonts like 'Arial'
-# are not available or properly added to FPDF.
-# The config.yaml can specify other fonts (e.g., "Arial"), but FPDF might
-# substitute them if not correctly configured with add_font().
-FONT_TITLE = parse_font_string(config_data.get('font_title'), default_family='Helvetica', default_style='B', default_size=16)
-FONT_BODY  = parse_font_string(config_data.get('font_body'), default_family='Helvetica', default_style='', default_size=12)
+def resolve_styles(config_data: dict) -> dict:
+    """Fonts and margins for a configuration (FONT_TITLE, FONT_BODY, MARGIN_LEFT, ...)."""
+    styles: Dict[str, Any] = {}
 
-# --- Margin Settings (in mm) ---
-margins_config = config_data.get('margins', {})
-if not isinstance(margins_config, dict): # Ensure margins_config is a dict
-    margins_config = {} # Fallback if 'margins' is not a dictionary
-MARGIN_LEFT  = margins_config.get('left', 10)
-MARGIN_TOP   = margins_config.get('top', 15)
-MARGIN_RIGHT = margins_config.get('right', 10)
+    # --- Font Styles ---
+    # Default to 'Helvetica' as a safe fallback if specific fonts like 'Arial'
+    # are not available or properly added to FPDF.
+    # The config.yaml can specify other fonts (e.g., "Arial"), but FPDF might
+    # substitute them if not correctly configured with add_font().
+    styles['FONT_TITLE'] = parse_font_string(config_data.get('font_title'), default_family='Helvetica', default_style='B', default_size=16)
+    styles['FONT_BODY'] = parse_font_string(config_data.get('font_body'), default_family='Helvetica', default_style='', default_size=12)
 
-# --- Examen Page Specific Font Styles ---
-# These allow finer control over Examen page appearance via config.yaml.
-FONT_EXAMEN_STEP_TITLE = parse_font_string(config_data.get('font_examen_step_title'), default_family='Helvetica', default_style='B', default_size=12)
-FONT_EXAMEN_PROMPT = parse_font_string(config_data.get('font_examen_prompt'), default_family='Helvetica', default_style='I', default_size=10)
\ No newline at end of file
+    # --- Margin Settings (in mm) ---
+    margins_config = config_data.get('margins', {})
+    if not isinstance(margins_config, dict): # Ensure margins_config is a dict
+        margins_config = {} # Fallback if 'margins' is not a dictionary
+    styles['margins_config'] = margins_config
+    styles['MARGIN_LEFT'] = margins_config.get('left', 10)
+    styles['MARGIN_TOP'] = margins_config.get('top', 15)
+    styles['MARGIN_RIGHT'] = margins_config.get('right', 10)
+
+    # --- Examen Page Specific Font Styles ---
+    # These allow finer control over Examen page appearance via config.yaml.
+    styles['FONT_EXAMEN_STEP_TITLE'] = parse_font_string(config_data.get('font_examen_step_title'), default_family='Helvetica', default_style='B', default_size=12)
+    styles['FONT_EXAMEN_PROMPT'] = parse_font_string(config_data.get('font_examen_prompt'), default_family='Helvetica', default_style='I', default_size=10)
+    return styles
+
+def _resolve_styles() -> dict:
+    config_data = _load_config_data()
+    return {"config_data": config_data, **resolve_styles(config_data)}
+
+def __getattr__(name: str):
+    # Module-level lazy attributes (PEP 562): resolve every style on first use
+    # and cache them as real globals so later lookups are plain attribute reads.
+    if name.startswith("__") or "config_data" in globals():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    styles = _resolve_styles()
+    globals().update(styles)
+    if name not in styles:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return styles[name]
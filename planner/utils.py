@@ -2,7 +2,6 @@
 # Remarkable Daily Planner
 # Utilities for loading quotes (with logging, no import-time prints)
 
-import csv
 import os
 import logging
 
@@ -19,46 +18,40 @@ def _project_root() -> str:
     # styles.py and templates.py live in planner/, config and CSV live at repo root
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-def load_quotes(csv_filename: str = "my_quotes.csv"):
-    """Load quotes from CSV (quote, author). Falls back to DEFAULT_QUOTES.
+def quote_source(csv_filename: str = "my_quotes.csv"):
+    """Indexed quote store for a CSV at the project root, or DEFAULT_QUOTES.
 
-    Returns:
-        list[tuple[str, str]]: list of (quote, author)
+    The store supports len() and indexing like a list but only decodes the
+    rows that are looked up (see planner.quotes.QuoteStore).
     """
-    root = _project_root()
-    path = os.path.join(root, csv_filename)
+    from planner.quotes import quote_store
+
+    path = os.path.join(_project_root(), csv_filename)
 
     if not os.path.exists(path):
         logger.warning("Quotes file '%s' not found. Using default quotes.", os.path.abspath(path))
         return DEFAULT_QUOTES.copy()
 
-    quotes = []
     try:
-        with open(path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.reader(f)
-            for i, row in enumerate(reader):
-                if not row:
-                    continue
-                # Accept 1 or 2 columns: (quote) or (quote, author)
-                quote = row[0].strip()
-                author = row[1].strip() if len(row) > 1 and row[1] else "Unknown"
-                if not quote:
-                    logger.warning("Skipping empty quote at row %d in '%s'.", i+1, path)
-                    continue
-                quotes.append((quote, author))
-    except csv.Error as e:
-        logger.error("CSV parsing error in '%s': %s. Using default quotes.", os.path.abspath(path), e)
-        return DEFAULT_QUOTES.copy()
+        store = quote_store(path)
     except Exception as e:
         logger.error("Unexpected error while loading '%s': %s. Using default quotes.", os.path.abspath(path), e)
         return DEFAULT_QUOTES.copy()
 
-    if not quotes:
+    if not store:
         logger.warning("No valid quotes found in '%s'. Using default quotes.", os.path.abspath(path))
         return DEFAULT_QUOTES.copy()
 
-    logger.info("Loaded %d quotes from '%s'.", len(quotes), os.path.abspath(path))
-    return quotes
+    logger.info("Loaded %d quotes from '%s'.", len(store), os.path.abspath(path))
+    return store
+
+def load_quotes(csv_filename: str = "my_quotes.csv"):
+    """Load quotes from CSV (quote, author). Falls back to DEFAULT_QUOTES.
+
+    Returns:
+        list[tuple[str, str]]: list of (quote, author)
+    """
+    return list(quote_source(csv_filename))
 
 if __name__ == '__main__':
     logger.info("Testing quote loading utility...")
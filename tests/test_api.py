@@ -0,0 +1,30 @@
+import io
+import re
+import zipfile
+
+from planner.api import archive_name, render_month, write_archive
+from planner.assemble import _parse_document
+from planner.config import load_config
+
+
+def _page_count(data: bytes) -> int:
+    objects, root, _ = _parse_document(data)
+    pages = int(re.search(rb"/Pages (\d+) 0 R", objects[root].head).group(1))
+    return int(re.search(rb"/Count (\d+)", objects[pages].head).group(1))
+
+
+def test_render_month_returns_a_complete_pdf():
+    data = render_month(2025, 2, "A5", kind="examen")
+    assert data.startswith(b"%PDF-") and data.rstrip().endswith(b"%%EOF")
+    assert _page_count(data) > 0
+
+
+def test_write_archive_has_one_pdf_per_unit():
+    cfg = load_config(None)
+    units = [(2025, 1, "A5"), (2025, 2, "A4")]
+    out = io.BytesIO()
+    assert write_archive(out, units, cfg, kind="examen") == 2
+    with zipfile.ZipFile(io.BytesIO(out.getvalue())) as zf:
+        assert zf.namelist() == [archive_name(*unit, cfg) for unit in units]
+        for name in zf.namelist():
+            assert _page_count(zf.read(name)) > 0
@@ -0,0 +1,106 @@
+import re
+
+import pytest
+from fpdf import FPDF
+
+from planner.assemble import (AssembleError, StreamingAssembler, _parse_document, _rewrite_refs,
+                              monthly_inputs)
+
+
+def _pdf(objects, root=1):
+    """A classic-xref PDF from {number: body} (bodies include any stream)."""
+    out = bytearray(b"%PDF-1.3\n")
+    offsets = {}
+    for num, body in sorted(objects.items()):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    size = max(objects) + 1
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for num in range(1, size):
+        out += b"%010d 00000 n \n" % offsets[num] if num in offsets else b"0000000000 65535 f \n"
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, root, xref)
+    return bytes(out)
+
+
+def _doc(title: str, pages: int) -> bytes:
+    pdf = FPDF(format="A5")
+    pdf.set_title(title)
+    pdf.set_font("Helvetica", size=12)
+    for n in range(pages):
+        pdf.add_page()
+        pdf.cell(40, 10, f"{title} page {n + 1}", link=pdf.add_link(page=1))
+    return bytes(pdf.output())
+
+
+def test_parse_document_reads_objects_and_streams():
+    objects, root, info = _parse_document(_pdf({
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [] /Count 0 >>",
+        3: b"<< /Length 5 >>\nstream\nhello\nendstream",
+    }))
+    assert (root, info) == (1, None)
+    assert objects[2].stream is None
+    assert objects[3].head == b"<< /Length 5 >>"
+    assert objects[3].stream == b"hello"
+
+
+def test_keywords_inside_strings_do_not_end_the_object():
+    objects, _, _ = _parse_document(_pdf({
+        1: b"<< /Type /Catalog /Pages 2 0 R /Title (a stream endobj \\) stream) >>",
+        2: b"<< /Type /Pages /Kids [] /Count 0 /Note <73747265616d> >>",
+        3: b"<< /Length 3 /Name (endstream) >>\nstream\nabc\nendstream",
+    }))
+    assert objects[1].stream is None
+    assert objects[1].head.endswith(b"stream) >>")
+    assert objects[2].stream is None
+    assert objects[3].stream == b"abc"
+
+
+def test_stream_without_length():
+    objects, _, _ = _parse_document(_pdf({
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [] /Count 0 >>",
+        3: b"<< /Length 9 0 R >>\nstream\nxyz\nendstream",
+    }))
+    assert objects[3].stream == b"xyz"
+
+
+def test_rejects_cross_reference_streams():
+    with pytest.raises(AssembleError):
+        _parse_document(b"%PDF-1.5\n1 0 obj\n<<>>\nendobj\nstartxref\n9\n%%EOF\n")
+
+
+def test_rewrite_refs_leaves_strings_alone():
+    body = b"<< /Parent 4 0 R /Kids [5 0 R 15 0 R] /T (see 4 0 R) /H <34203020> >>"
+    assert _rewrite_refs(body, {4: 40, 5: 50, 15: 150}) == (
+        b"<< /Parent 40 0 R /Kids [50 0 R 150 0 R] /T (see 4 0 R) /H <34203020> >>")
+
+
+def test_assembled_document_has_every_page_and_a_bookmark_each():
+    import io
+
+    out = io.BytesIO()
+    asm = StreamingAssembler(out)
+    asm.add_document(_doc("Upstream endobj", 2), "January 2025")
+    asm.add_document(_doc("February", 3), "February 2025")
+    asm.close()
+
+    objects, root, _ = _parse_document(out.getvalue())
+    pages = int(re.search(rb"/Pages (\d+) 0 R", objects[root].head).group(1))
+    assert b"/Count 5" in objects[pages].head
+    titles = [o.head for o in objects.values() if b"/Title (" in o.head and b"/Dest" in o.head]
+    assert len(titles) == 2
+    # Both documents use Helvetica: the font dictionary is written once.
+    assert sum(b"/BaseFont /Helvetica" in o.head for o in objects.values()) == 1
+    assert asm.stats["documents"] == 2 and asm.stats["objects_shared"] > 0
+
+
+def test_monthly_inputs(tmp_path):
+    assert monthly_inputs(str(tmp_path), 2031, "A4") == []
+    folder = tmp_path / "2025" / "A5"
+    folder.mkdir(parents=True)
+    for name in ("02 - February_2025_A5.pdf", "01 - January_2025_A5.pdf", "Planner_2025_A5.pdf"):
+        (folder / name).write_bytes(b"")
+    assert [p.rsplit("/", 1)[1] for p in monthly_inputs(str(tmp_path), 2025, "A5")] == [
+        "01 - January_2025_A5.pdf", "02 - February_2025_A5.pdf"]
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from planner.batch import ManifestError, batch_tasks, load_manifest
+
+
+def _manifest(tmp_path, text: str) -> str:
+    path = tmp_path / "manifest.yaml"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_tenant_paths_are_relative_to_their_config(tmp_path):
+    folder = tmp_path / "alice"
+    folder.mkdir()
+    (folder / "quotes.csv").write_text('"Q","A"\n', encoding="utf-8")
+    (folder / "config.yaml").write_text(
+        "quotes: {path: quotes.csv}\n"
+        "events: {sources: [events.csv, /srv/shared.yaml]}\n"
+        "fonts: {Body: {regular: fonts/Body.ttf}}\n", encoding="utf-8")
+    [alice] = load_manifest(_manifest(tmp_path, "tenants:\n  - {name: alice, config: alice/config.yaml, years: [2025]}\n"))
+    assert alice.cfg["quotes"]["path"] == str(folder / "quotes.csv")
+    assert alice.cfg["events"]["sources"] == [str(folder / "events.csv"), "/srv/shared.yaml"]
+    assert alice.cfg["fonts"] == {"Body": {"regular": str(folder / "fonts" / "Body.ttf")}}
+
+
+def test_missing_quote_file_keeps_the_project_default(tmp_path):
+    folder = tmp_path / "bob"
+    folder.mkdir()
+    (folder / "config.yaml").write_text("quotes: {path: my_quotes.csv}\n", encoding="utf-8")
+    [bob] = load_manifest(_manifest(tmp_path, "tenants:\n  - {name: bob, config: bob/config.yaml, years: [2025]}\n"))
+    assert bob.cfg["quotes"]["path"] == "my_quotes.csv"
+
+
+def test_outdirs_and_defaults(tmp_path):
+    tenants = load_manifest(_manifest(tmp_path, (
+        "defaults: {years: [2025], formats: [A5]}\n"
+        "tenants:\n"
+        "  - {name: a, outdir: out/a, kinds: [daily, examen]}\n"
+        "  - {name: b, formats: [A4], years: [2026]}\n")))
+    assert [t.outdir for t in tenants] == [str(tmp_path / "out" / "a"),
+                                          str(tmp_path / "generated_planners" / "b")]
+    assert (tenants[1].years, tenants[1].formats, tenants[1].kinds) == ([2026], ["A4"], ["daily"])
+    tasks = batch_tasks(tenants)
+    assert len(tasks) == 12 * 3
+    assert {t.base_output_dir for t in tasks if t.tenant == "a"} == {
+        os.path.join(tenants[0].outdir, "daily"), os.path.join(tenants[0].outdir, "examen")}
+
+
+@pytest.mark.parametrize("text, message", [
+    ("tenants: {}\n", "'tenants' list"),
+    ("tenants:\n  - {years: [2025]}\n", "tenant #1 needs a 'name'"),
+    ("tenants:\n  - {name: a, years: [2025]}\n  - {name: a, years: [2025]}\n", "duplicate tenant name 'a'"),
+    ("tenants:\n  - {name: a, years: [2025], config: nope.yaml}\n", "config for tenant 'a' not found"),
+    ("tenants:\n  - {name: a, years: [2025], kinds: [weekly]}\n", "unknown kinds"),
+    ("tenants:\n  - {name: a}\n", "tenant 'a' has no years"),
+])
+def test_invalid_manifests(tmp_path, text, message):
+    with pytest.raises(ManifestError, match=message):
+        load_manifest(_manifest(tmp_path, text))
@@ -0,0 +1,83 @@
+import os
+
+from planner.build_cache import BuildCache, InputHasher, plan_incremental
+
+UNITS = [(2025, month, "A5") for month in range(1, 13)]
+
+
+def _write(path, text: str) -> None:
+    # Bump the mtime explicitly: the event and quote stores reload on it.
+    st = os.stat(path) if path.exists() else None
+    path.write_text(text, encoding="utf-8")
+    if st is not None:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def _setup(tmp_path):
+    events = tmp_path / "events.csv"
+    _write(events, "type,name,day,month\nbirthday,Ann,20,3\nbirthday,Bo,5,7\n")
+    quotes = tmp_path / "quotes.csv"
+    _write(quotes, "".join(f'"Quote {i}","Author"\n' for i in range(400)))
+    cfg = {"events": {"sources": [str(events)], "include_builtin": False},
+           "quotes": {"path": str(quotes)}}
+    return cfg, events, quotes
+
+
+def _build_all(tmp_path, cfg) -> BuildCache:
+    cache = BuildCache(str(tmp_path))
+    hasher = InputHasher(cfg)
+    for unit in UNITS:
+        out = tmp_path / "out" / f"{unit[1]:02d}.pdf"
+        out.parent.mkdir(exist_ok=True)
+        out.write_bytes(b"%PDF-1.3")
+        cache.record("daily", unit, hasher.parts("daily", unit), str(out))
+    return cache
+
+
+def _stale(cache, cfg, kind="daily"):
+    decisions, _ = plan_incremental(cache, InputHasher(cfg), kind, UNITS)
+    return {d.unit[1]: d.reason for d in decisions if d.stale}
+
+
+def test_unchanged_inputs_rebuild_nothing(tmp_path):
+    cfg, _, _ = _setup(tmp_path)
+    assert _stale(_build_all(tmp_path, cfg), cfg) == {}
+
+
+def test_changed_birthday_rebuilds_only_its_month(tmp_path):
+    cfg, events, _ = _setup(tmp_path)
+    cache = _build_all(tmp_path, cfg)
+    _write(events, "type,name,day,month\nbirthday,Ann,21,3\nbirthday,Bo,5,7\n")
+    # The weekly overviews list birthdays too, hence special_dates.
+    assert _stale(cache, cfg) == {3: "changed: birthdays, special_dates"}
+
+
+def test_birthday_early_in_a_month_also_rebuilds_the_previous_month(tmp_path):
+    cfg, events, _ = _setup(tmp_path)
+    cache = _build_all(tmp_path, cfg)
+    _write(events, "type,name,day,month\nbirthday,Ann,20,3\nbirthday,Bo,2,7\n")
+    # June's last weekly overview runs into the first days of July.
+    assert _stale(cache, cfg) == {6: "changed: special_dates", 7: "changed: birthdays, special_dates"}
+
+
+def test_changed_quote_rebuilds_only_the_months_that_show_it(tmp_path):
+    cfg, _, quotes = _setup(tmp_path)
+    cache = _build_all(tmp_path, cfg)
+    # Quote 40 is shown on day 41 of the year (February 10th) only.
+    _write(quotes, "".join(f'"Quote {i}{"!" if i == 40 else ""}","Author"\n' for i in range(400)))
+    assert _stale(cache, cfg) == {2: "changed: quotes"}
+
+
+def test_changed_config_rebuilds_every_month(tmp_path):
+    cfg, _, _ = _setup(tmp_path)
+    cache = _build_all(tmp_path, cfg)
+    stale = _stale(cache, dict(cfg, locale="fr_FR"))
+    assert sorted(stale) == list(range(1, 13))
+    assert set(stale.values()) == {"changed: config"}
+
+
+def test_missing_output_is_rebuilt(tmp_path):
+    cfg, _, _ = _setup(tmp_path)
+    cache = _build_all(tmp_path, cfg)
+    (tmp_path / "out" / "05.pdf").unlink()
+    assert _stale(cache, cfg) == {5: "output missing"}
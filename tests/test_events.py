@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+from planner.events import Event, EventStore
+
+
+def _store() -> EventStore:
+    return EventStore([
+        Event("birthday", "Ann", 20, 3, 1990),
+        Event("anniversary", "Bo & Cy", 2, 3, 2010),
+        Event("holiday", "Feast", 19, 3),
+        Event("gift", "Deadline", 1, 4, 2025),
+        Event("gift", "Old deadline", 5, 3, 2024),
+        Event("holiday", "Also 20th", 20, 3),
+    ])
+
+
+def _names(events):
+    return [e.name for e in events]
+
+
+def test_in_month_lookups_are_sorted_by_day():
+    store = _store()
+    assert _names(store.personal_in_month(3)) == ["Bo & Cy", "Ann"]
+    assert _names(store.special_in_month(2025, 3)) == ["Feast", "Also 20th"]
+    assert _names(store.special_in_month(2024, 3)) == ["Old deadline", "Feast", "Also 20th"]
+    assert store.personal_in_month(4) == []
+
+
+def test_events_added_later_are_sorted_in():
+    store = _store()
+    store.personal_in_month(3)
+    store.add(Event("birthday", "Di", 1, 3))
+    assert _names(store.personal_in_month(3)) == ["Di", "Bo & Cy", "Ann"]
+
+
+def test_between_spans_months_and_skips_other_years():
+    found = [(d, e.name) for d, e in _store().between(date(2025, 3, 19), date(2025, 4, 1))]
+    assert found == [
+        (date(2025, 3, 19), "Feast"),
+        (date(2025, 3, 20), "Ann"),
+        (date(2025, 3, 20), "Also 20th"),
+        (date(2025, 4, 1), "Deadline"),
+    ]
+    assert list(_store().between(date(2024, 4, 1), date(2024, 4, 1))) == []
+
+
+def test_invalid_rows_are_skipped():
+    store = EventStore()
+    store.extend([{"name": "No day", "month": 3}, {"name": "Bad", "day": 40, "month": 1},
+                  {"name": "Ok", "day": "7", "month": "5", "type": " Holiday "}])
+    assert store.count == 1
+    assert store.on(date(2030, 5, 7))[0].key() == ("holiday", "Ok", 5, 7, None)
+    with pytest.raises(ValueError):
+        store.add(Event("holiday", "Bad", 0, 13))
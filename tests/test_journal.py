@@ -0,0 +1,87 @@
+import json
+
+from planner.generate.parallel import Task, UnitResult
+from planner.journal import JOURNAL_FILENAME, JobJournal, open_journals, pending_tasks
+
+CFG = {"locale": "en_US"}
+JAN, FEB = (2025, 1, "A5"), (2025, 2, "A5")
+
+
+def _output(tmp_path, month: int, data: bytes = b"%PDF-1.3 month") -> str:
+    path = tmp_path / "2025" / "A5" / f"{month:02d}.pdf"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def _journal_lines(tmp_path):
+    return (tmp_path / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines()
+
+
+def test_recorded_units_are_skipped_on_resume(tmp_path):
+    JobJournal(str(tmp_path), CFG).record("daily", JAN, _output(tmp_path, 1))
+    journal = JobJournal(str(tmp_path), CFG, resume=True)
+    assert journal.check("daily", JAN) is None
+    assert journal.pending("daily", [JAN, FEB]) == [FEB]
+    assert journal.check("examen", JAN) == "not finished"
+
+
+def test_without_resume_nothing_is_skipped(tmp_path):
+    JobJournal(str(tmp_path), CFG).record("daily", JAN, _output(tmp_path, 1))
+    assert JobJournal(str(tmp_path), CFG).pending("daily", [JAN, FEB]) == [JAN, FEB]
+
+
+def test_changed_or_missing_output_is_rendered_again(tmp_path):
+    path = _output(tmp_path, 1)
+    JobJournal(str(tmp_path), CFG).record("daily", JAN, path)
+    _output(tmp_path, 1, b"%PDF-1.3 other")
+    assert JobJournal(str(tmp_path), CFG, resume=True).check("daily", JAN) == "checksum mismatch"
+    (tmp_path / "2025" / "A5" / "01.pdf").unlink()
+    assert JobJournal(str(tmp_path), CFG, resume=True).check("daily", JAN) == "output missing"
+
+
+def test_changed_config_is_rendered_again(tmp_path):
+    JobJournal(str(tmp_path), CFG).record("daily", JAN, _output(tmp_path, 1))
+    journal = JobJournal(str(tmp_path), {"locale": "fr_FR"}, resume=True)
+    assert journal.check("daily", JAN) == "inputs changed"
+
+
+def test_changed_data_source_is_rendered_again(tmp_path):
+    events = tmp_path / "events.csv"
+    events.write_text("date,name\n2025-01-02,Alex\n", encoding="utf-8")
+    cfg = {"events": {"sources": [str(events)]}}
+    JobJournal(str(tmp_path), cfg).record("daily", JAN, _output(tmp_path, 1))
+    assert JobJournal(str(tmp_path), cfg, resume=True).check("daily", JAN) is None
+    events.write_text("date,name\n2025-01-02,Alex\n2025-01-03,Sam\n", encoding="utf-8")
+    assert JobJournal(str(tmp_path), cfg, resume=True).check("daily", JAN) == "inputs changed"
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    JobJournal(str(tmp_path), CFG).record("daily", JAN, _output(tmp_path, 1))
+    with open(tmp_path / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+        f.write('{"key": "daily/2025/A5/02", "pa')
+    journal = JobJournal(str(tmp_path), CFG, resume=True)
+    assert journal.pending("daily", [JAN, FEB]) == [FEB]
+
+
+def test_reruns_are_compacted_to_one_line_per_unit(tmp_path):
+    path = _output(tmp_path, 1)
+    journal = JobJournal(str(tmp_path), CFG)
+    for _ in range(70):
+        journal.record("daily", JAN, path)
+    assert len(_journal_lines(tmp_path)) == 70
+    reloaded = JobJournal(str(tmp_path), CFG, resume=True)
+    lines = _journal_lines(tmp_path)
+    assert len(lines) == 1
+    assert json.loads(lines[0])["key"] == "daily/2025/A5/01"
+    assert reloaded.check("daily", JAN) is None
+
+
+def test_task_helpers_record_successes_only(tmp_path):
+    tasks = [Task("daily", JAN, str(tmp_path), CFG), Task("daily", FEB, str(tmp_path), CFG)]
+    journals = open_journals(tasks)
+    journal = journals[str(tmp_path)]
+    journal.record_result(tasks[0], UnitResult(2025, 1, "A5", path=_output(tmp_path, 1)))
+    journal.record_result(tasks[1], UnitResult(2025, 2, "A5", error="boom"))
+    resumed = open_journals(tasks, resume=True)
+    assert pending_tasks(tasks, resumed) == [tasks[1]]
@@ -0,0 +1,51 @@
+import pytest
+
+from planner.layout import build_plan, layout_for_format
+
+STEP, PROMPT, TITLE = ("Helvetica", "B", 12), ("Helvetica", "", 10), ("Helvetica", "B", 16)
+
+
+def _plan(w, h):
+    return build_plan(w, h, 10, 10, 10, 12, STEP, PROMPT, TITLE)
+
+
+def test_a5_geometry():
+    plan = _plan(148, 210)
+    monthly = plan.monthly
+    assert monthly.is_a5 and monthly.page_width == 128 and monthly.content_bottom == 198
+    # Seven 12 mm calendar cells, centred between the margins.
+    assert (monthly.cal_cell_w, monthly.cal_x_start) == (12, 32)
+    assert monthly.birthday_col_width == pytest.approx(124 / 3)
+    assert monthly.birthday_col_x == pytest.approx((10, 10 + 2 + 124 / 3, 10 + 2 * (2 + 124 / 3)))
+    assert plan.weekly_examen.step_lines == (2, 2, 3, 2, 2)
+    assert plan.weekly_examen.step_font == ("Helvetica", "B", 11)
+    assert plan.reflection.title_font == ("Helvetica", "B", 12)
+
+
+def test_a4_geometry():
+    plan = _plan(210, 297)
+    assert not plan.daily.is_a5 and plan.daily.page_width == 190
+    assert (plan.monthly.cal_cell_w, plan.monthly.cal_x_start) == (12, 63)
+    assert plan.weekly_examen.step_lines == (4, 3, 7, 4, 4)
+    assert plan.weekly_examen.step_font == STEP
+    # The reflection page uses the step and prompt fonts one point smaller.
+    assert (plan.reflection.step_font[2], plan.reflection.prompt_font[2]) == (11, 9)
+
+
+def test_remaining_line_counts():
+    a5, a4 = _plan(148, 210), _plan(210, 297)
+    assert a5.daily.journal_lines(100) == 13    # (198 - 100 - 2.1) / 7
+    assert a4.daily.journal_lines(100) == 26    # (285 - 100 - 2.1) // 7
+    assert a5.daily.journal_lines(198) == 0
+    assert a5.monthly.ideas_lines(180) == 2     # (198 - 180 - 5) / 5
+    assert a5.monthly.ideas_lines(100) == a5.monthly.max_ideas_lines
+    assert a5.monthly.ideas_lines(195) == 0
+
+
+def test_plans_are_shared_per_page_shape():
+    assert _plan(148, 210) is _plan(148, 210)
+    assert _plan(148, 210) is not _plan(210, 297)
+    margins = {"left": 10, "top": 15, "right": 10, "bottom": 15}
+    plan = layout_for_format("A5", margins)
+    assert plan is layout_for_format("A5", dict(margins))
+    assert plan.margins == (10, 15, 10, 15)
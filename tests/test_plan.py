@@ -0,0 +1,35 @@
+import re
+
+import pytest
+
+from planner.api import render_month
+from planner.assemble import _parse_document
+from planner.plan import DEFAULT_COSTS, estimate_month, month_templates
+
+
+def _page_count(data: bytes) -> int:
+    objects, root, _ = _parse_document(data)
+    pages = int(re.search(rb"/Pages (\d+) 0 R", objects[root].head).group(1))
+    return int(re.search(rb"/Count (\d+)", objects[pages].head).group(1))
+
+
+def test_daily_month_templates():
+    calls = month_templates("daily", 2025, 2)
+    # February 2025: 28 days, four of them Mondays.
+    assert calls[0] == "create_monthly_overview" and calls[-1] == "create_monthly_examen_page"
+    assert calls.count("create_daily_page") == calls.count("create_daily_reflection_page") == 28
+    assert calls.count("create_weekly_overview") == 4
+    assert calls[1:4] == ["create_daily_page", "create_daily_reflection_page", "create_daily_page"]
+    with pytest.raises(ValueError):
+        month_templates("weekly", 2025, 2)
+
+
+@pytest.mark.parametrize("kind, unit", [
+    ("daily", (2025, 2, "A5")),
+    ("daily", (2025, 3, "Letter")),
+    ("examen", (2025, 2, "A4")),
+    ("examen", (2025, 3, "Letter")),  # weekly examen pages overflow onto a second page
+])
+def test_estimated_pages_match_the_rendered_document(kind, unit):
+    plan = estimate_month(kind, unit, DEFAULT_COSTS)
+    assert plan.page_count == _page_count(render_month(*unit, kind=kind))
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from planner.quotes import QuoteStore, _iter_records, index_path, quote_store
+
+
+def _records(data: bytes):
+    return [data[offset:offset + length] for offset, length in _iter_records(data)]
+
+
+def _write(path, text: str) -> str:
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_records_split_on_newlines():
+    assert _records(b'a,b\nc,d\n') == [b"a,b\n", b"c,d\n"]
+
+
+def test_records_keep_quoted_newlines_together():
+    data = b'"one\ntwo",x\nthree,y\n'
+    assert _records(data) == [b'"one\ntwo",x\n', b"three,y\n"]
+
+
+def test_records_escaped_quotes_do_not_flip_parity():
+    data = b'"say ""hi""\nthere",x\nnext,y\n'
+    assert _records(data) == [b'"say ""hi""\nthere",x\n', b"next,y\n"]
+
+
+def test_records_last_line_without_newline():
+    assert _records(b"a,b\nc,d") == [b"a,b\n", b"c,d"]
+
+
+def test_store_reads_rows_and_skips_blank_quotes(tmp_path):
+    path = _write(tmp_path / "q.csv", 'First,Ann\n,Nobody\n"Multi\nline",\nLast,Bo\n')
+    store = QuoteStore(path)
+    assert len(store) == 3
+    assert list(store) == [("First", "Ann"), ("Multi\nline", "Unknown"), ("Last", "Bo")]
+    assert store[-1] == ("Last", "Bo")
+    with pytest.raises(IndexError):
+        store[3]
+    store.close()
+
+
+def test_store_writes_and_reuses_index(tmp_path):
+    path = _write(tmp_path / "q.csv", "A,1\nB,2\n")
+    QuoteStore(path).close()
+    idx = index_path(path)
+    assert os.path.exists(idx)
+    before = os.stat(idx).st_mtime_ns
+    assert len(QuoteStore(path)) == 2
+    assert os.stat(idx).st_mtime_ns == before
+
+
+def test_index_rebuilt_when_csv_changes(tmp_path):
+    path = _write(tmp_path / "q.csv", "A,1\nB,2\n")
+    QuoteStore(path).close()
+    _write(tmp_path / "q.csv", "A,1\nB,2\nC,3\n")
+    store = QuoteStore(path)
+    assert len(store) == 3
+    assert store[2] == ("C", "3")
+
+
+def test_index_rebuilt_when_corrupt(tmp_path):
+    path = _write(tmp_path / "q.csv", "A,1\nB,2\n")
+    QuoteStore(path).close()
+    with open(index_path(path), "r+b") as f:
+        f.truncate(10)
+    assert list(QuoteStore(path)) == [("A", "1"), ("B", "2")]
+
+
+def test_missing_and_empty_files(tmp_path):
+    assert len(QuoteStore(str(tmp_path / "missing.csv"))) == 0
+    assert len(QuoteStore(_write(tmp_path / "empty.csv", ""))) == 0
+
+
+def test_shared_store_reopened_only_when_file_changes(tmp_path):
+    path = _write(tmp_path / "q.csv", "A,1\n")
+    store = quote_store(path)
+    assert quote_store(path) is store
+    _write(tmp_path / "q.csv", "A,1\nB,2\n")
+    changed = quote_store(path)
+    assert changed is not store
+    assert len(changed) == 2
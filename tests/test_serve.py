@@ -0,0 +1,47 @@
+import pytest
+
+from planner.serve import ByteLRU, RequestError, _check_format
+
+
+def test_get_and_put_count_hits_and_misses():
+    cache = ByteLRU(100)
+    assert cache.get("a") is None
+    cache.put("a", b"x" * 10)
+    assert cache.get("a") == b"x" * 10
+    assert cache.stats() == {"entries": 1, "bytes": 10, "max_bytes": 100,
+                             "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_evicts_least_recently_used_until_under_budget():
+    cache = ByteLRU(30)
+    for key in "abc":
+        cache.put(key, b"x" * 10)
+    cache.get("a")  # "b" is now the oldest
+    cache.put("d", b"x" * 15)
+    assert cache.get("b", count=False) is None
+    assert cache.get("c", count=False) is None
+    assert cache.get("a", count=False) is not None
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 25, 2)
+
+
+def test_replacing_a_key_updates_the_size():
+    cache = ByteLRU(100)
+    cache.put("a", b"x" * 40)
+    cache.put("a", b"x" * 10)
+    assert cache.stats()["bytes"] == 10
+
+
+def test_values_larger_than_the_cache_are_not_stored():
+    cache = ByteLRU(10)
+    cache.put("small", b"x" * 5)
+    cache.put("big", b"x" * 11)
+    assert cache.get("big", count=False) is None
+    assert cache.get("small", count=False) == b"x" * 5
+
+
+def test_unknown_page_format_is_a_request_error():
+    _check_format("A5")
+    _check_format("letter")
+    with pytest.raises(RequestError, match="unknown format 'XYZ'"):
+        _check_format("XYZ")